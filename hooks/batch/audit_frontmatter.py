@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Vault-Wide Frontmatter Audit
+
+Validates every note in an Obsidian vault with frontmatter-validator.py's
+rules: the required fields, enum values, date fields and filename prefix of
+each note type in hooks/lib/note_types.py. That hook only checks the note just edited, so schema drift
+elsewhere goes unnoticed until someone touches the note. Run this after
+changing the rules, or nightly.
+
+Re-runs are incremental. Results are cached in
+.claude/cache/frontmatter-audit.sqlite with each note's size, mtime and
+BLAKE2 content hash:
+  - size and mtime unchanged   -> cached result, file not read
+  - touched but hash unchanged -> cached result after hashing
+  - new or changed             -> revalidated
+Editing frontmatter-validator.py, note_types.py or the shared parser
+invalidates the cache.
+
+Notes are listed from the shared note index and validated by a process pool.
+
+Usage:
+  python3 hooks/batch/audit_frontmatter.py                  # vault = $CLAUDE_PROJECT_DIR or .
+  python3 hooks/batch/audit_frontmatter.py --vault ~/Vault --scope Meetings/ --strict
+  python3 hooks/batch/audit_frontmatter.py --all --revalidate
+
+Output (one JSON object per note type, types sorted):
+  {"type": "Task", "notes": 120, "invalid": 2,
+   "files": [{"file": "Tasks/fix.md", "warnings": ["Missing required field for Task: priority"]}]}
+Notes without a type are grouped under "(none)".
+
+Exit Codes:
+  0 - Audit completed (or only warnings)
+  1 - Usage error, or vault not found
+  2 - Invalid notes found (with --strict)
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "lib"))
+
+import frontmatter  # noqa: E402
+import note_types  # noqa: E402
+from hook_runner import HOOKS_DIR, load_hook_module  # noqa: E402
+from note_index import NoteIndex, load_note_index  # noqa: E402
+
+# Where the cache lives, relative to the vault root
+CACHE_PATH = Path(".claude") / "cache" / "frontmatter-audit.sqlite"
+
+VALIDATOR = "quality/frontmatter-validator.py"
+
+# Group for notes without a type
+UNTYPED = "(none)"
+
+# Files changed this recently are re-hashed on the next audit
+RACY_WINDOW_NS = 2_000_000_000
+
+# Notes per task sent to a worker
+BATCH_SIZE = 250
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS notes (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime INTEGER NOT NULL,
+    digest TEXT NOT NULL,
+    note_type TEXT NOT NULL,
+    warnings TEXT NOT NULL
+);
+"""
+
+_validator = None
+
+
+def _init_worker() -> None:
+    global _validator
+    _validator = load_hook_module(VALIDATOR)
+
+
+def validate_note(rel_path: str, content: str) -> tuple[str, list[str]]:
+    """(note type, warnings) for one note, exactly as the hook reports them."""
+    data, parse_errors = _validator.extract_frontmatter(content)
+    warnings = list(parse_errors)
+    if data:
+        warnings.extend(_validator.validate_frontmatter(data, rel_path))
+    note_type = data.get("type", "") if data else ""
+    return (note_type if isinstance(note_type, str) else "") or UNTYPED, warnings
+
+
+def audit_batch(vault_root: str, batch: list[tuple[str, str | None]]) -> list[tuple]:
+    """Validate notes whose size or mtime changed.
+
+    Returns (path, digest, note_type, warnings) per note; note_type is None
+    when the content hash matches the cached one, so the cached result applies.
+    """
+    results = []
+    for rel_path, cached_digest in batch:
+        try:
+            raw = Path(vault_root, rel_path).read_bytes()
+        except OSError:
+            continue  # Vanished - picked up next audit
+        digest = hashlib.blake2b(raw).hexdigest()
+        if digest == cached_digest:
+            results.append((rel_path, digest, None, None))
+            continue
+        note_type, warnings = validate_note(rel_path, raw.decode("utf-8", errors="replace"))
+        results.append((rel_path, digest, note_type, warnings))
+    return results
+
+
+def rules_digest() -> str:
+    """Hash of the validator and schema sources and the parser version, for invalidation."""
+    source = (HOOKS_DIR / VALIDATOR).read_bytes() + b"\0" + Path(note_types.__file__).read_bytes()
+    parser = f"{frontmatter.PARSER_VERSION}:{frontmatter.MAX_HEADER_BYTES}".encode("ascii")
+    return hashlib.sha256(source + b"\0" + parser).hexdigest()
+
+
+def open_cache(vault_root: Path, revalidate: bool) -> sqlite3.Connection:
+    path = vault_root / CACHE_PATH
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(path), timeout=5)
+    conn.executescript(_SCHEMA)
+
+    digest = rules_digest()
+    row = conn.execute("SELECT value FROM meta WHERE key = 'rules'").fetchone()
+    if revalidate or row is None or row[0] != digest:
+        with conn:
+            conn.execute("DELETE FROM notes")
+            conn.execute("INSERT OR REPLACE INTO meta VALUES ('rules', ?)", (digest,))
+    return conn
+
+
+def select_notes(note_index: NoteIndex, scope: str | None, skip_paths: list[str]) -> list[str]:
+    """Notes to audit: everything in scope except the validator's SKIP_PATHS."""
+    prefix = scope.strip("/") + "/" if scope else ""
+    return [
+        rel_path for rel_path in note_index.note_paths()
+        if rel_path.startswith(prefix) and not any(skip in rel_path for skip in skip_paths)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate frontmatter across a whole vault")
+    parser.add_argument("--vault", default=os.environ.get("CLAUDE_PROJECT_DIR", "."),
+                        help="Vault root (default: $CLAUDE_PROJECT_DIR or .)")
+    parser.add_argument("--scope", help="Only audit notes under this folder")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="Worker processes (default: CPU count)")
+    parser.add_argument("--all", action="store_true", help="List valid notes too, with no warnings")
+    parser.add_argument("--revalidate", action="store_true", help="Ignore the cache and validate everything")
+    parser.add_argument("--strict", action="store_true", help="Exit 2 if any note has warnings")
+    try:
+        args = parser.parse_args()
+    except SystemExit as exc:
+        # argparse exits 2 on bad arguments, which here means invalid notes
+        sys.exit(0 if exc.code == 0 else 1)
+
+    vault_root = Path(args.vault).resolve()
+    if not vault_root.is_dir():
+        print(f"ERROR: Vault not found: {args.vault}", file=sys.stderr)
+        sys.exit(1)
+
+    start = time.perf_counter()
+    now = time.time_ns()
+    note_index = load_note_index(vault_root)
+    try:
+        rel_paths = select_notes(note_index, args.scope, load_hook_module(VALIDATOR).SKIP_PATHS)
+    finally:
+        note_index.close()
+
+    conn = open_cache(vault_root, args.revalidate)
+    cached = {path: (size, mtime, digest) for path, size, mtime, digest
+              in conn.execute("SELECT path, size, mtime, digest FROM notes")}
+
+    seen = {}
+    changed = []
+    for rel_path in rel_paths:
+        try:
+            st = os.stat(vault_root / rel_path)
+        except OSError:
+            continue
+        # Recently modified notes may change again within the mtime granularity
+        seen[rel_path] = (st.st_size, -1 if now - st.st_mtime_ns < RACY_WINDOW_NS else st.st_mtime_ns)
+        entry = cached.get(rel_path)
+        if entry and entry[0] == st.st_size and entry[1] == st.st_mtime_ns:
+            continue
+        changed.append((rel_path, entry[2] if entry else None))
+
+    batches = [changed[i:i + BATCH_SIZE] for i in range(0, len(changed), BATCH_SIZE)]
+    validated = rehashed = 0
+
+    with ProcessPoolExecutor(max_workers=max(1, args.workers), initializer=_init_worker) as pool, conn:
+        for results in pool.map(audit_batch, [str(vault_root)] * len(batches), batches):
+            for rel_path, digest, note_type, warnings in results:
+                size, mtime = seen[rel_path]
+                if note_type is None:
+                    rehashed += 1
+                    conn.execute("UPDATE notes SET size = ?, mtime = ? WHERE path = ?",
+                                 (size, mtime, rel_path))
+                    continue
+                validated += 1
+                conn.execute("INSERT OR REPLACE INTO notes VALUES (?, ?, ?, ?, ?, ?)",
+                             (rel_path, size, mtime, digest, note_type, json.dumps(warnings)))
+
+        # Forget deleted notes (only within the audited scope)
+        for rel_path in set(cached) - set(seen):
+            if not args.scope or rel_path.startswith(args.scope.strip("/") + "/"):
+                conn.execute("DELETE FROM notes WHERE path = ?", (rel_path,))
+
+    groups: dict[str, dict] = {}
+    invalid = 0
+    for rel_path, note_type, warnings_json in conn.execute(
+            "SELECT path, note_type, warnings FROM notes ORDER BY path"):
+        if rel_path not in seen:
+            continue  # Outside --scope
+        group = groups.setdefault(note_type, {"type": note_type, "notes": 0, "invalid": 0, "files": []})
+        group["notes"] += 1
+        warnings = json.loads(warnings_json)
+        if warnings:
+            group["invalid"] += 1
+            invalid += 1
+        if warnings or args.all:
+            group["files"].append({"file": rel_path, "warnings": warnings})
+    conn.close()
+
+    for note_type in sorted(groups):
+        sys.stdout.write(json.dumps(groups[note_type]) + "\n")
+
+    elapsed = time.perf_counter() - start
+    print(f"Audited {len(seen)} notes: {validated} validated, {rehashed} unchanged by hash, "
+          f"{len(seen) - len(changed)} unchanged by mtime; {invalid} with warnings across "
+          f"{len(groups)} types ({elapsed:.1f}s)", file=sys.stderr)
+
+    if invalid and args.strict:
+        sys.exit(2)
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
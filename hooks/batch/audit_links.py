@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Vault-Wide Broken-Link Audit
+
+Checks every note in an Obsidian vault for wiki-links that don't resolve,
+using the same extraction and resolution rules as wiki-link-checker.py.
+
+Notes are listed from the shared note index (no directory walk), split into
+batches and checked by a process pool. Each worker loads the vault's link
+keys once, so every link costs one dictionary lookup. Broken links are
+streamed to stdout as JSONL while the audit runs; a summary goes to stderr.
+
+Usage:
+  python3 hooks/batch/audit_links.py                       # vault = $CLAUDE_PROJECT_DIR or .
+  python3 hooks/batch/audit_links.py --vault ~/Vault --scope Meetings/
+  python3 hooks/batch/audit_links.py --all > links.jsonl   # every link, not just broken
+
+Output (one JSON object per line):
+  {"file": "Meetings/Sync.md", "line": 12, "link": "Task - Foo", "source": "body", "resolves": false}
+
+Exit Codes:
+  0 - Audit completed (or only warnings)
+  2 - Broken links found (with --strict)
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "lib"))
+
+from hook_runner import load_hook_module  # noqa: E402
+from note_index import NoteIndex, link_resolves, load_note_index  # noqa: E402
+
+# Notes per task sent to a worker
+BATCH_SIZE = 250
+
+# Per-worker state, set once by _init_worker()
+_checker = None
+_link_keys = None
+_vault_root = None
+
+
+def _init_worker(vault_root: str) -> None:
+    """Load the link checker and the vault's link keys once per worker."""
+    global _checker, _link_keys, _vault_root
+    _checker = load_hook_module("quality/wiki-link-checker.py")
+    _vault_root = Path(vault_root)
+    note_index = NoteIndex(_vault_root)
+    try:
+        _link_keys = note_index.link_keys()
+    finally:
+        note_index.close()
+
+
+def audit_batch(rel_paths: list[str], include_valid: bool) -> tuple[int, int, list[dict]]:
+    """Check a batch of notes. Returns (notes read, links checked, records)."""
+    notes = 0
+    checked = 0
+    records = []
+
+    for rel_path in rel_paths:
+        try:
+            content = (_vault_root / rel_path).read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            continue
+        notes += 1
+
+        links = [(target, line, "body") for target, line in _checker.extract_wiki_links(content)]
+        links += [(target, None, "frontmatter") for target in _checker.extract_frontmatter_links(content)]
+
+        for target, line, source in links:
+            checked += 1
+            resolves = link_resolves(_link_keys, target)
+            if resolves and not include_valid:
+                continue
+            records.append({
+                "file": rel_path,
+                "line": line,
+                "link": target,
+                "source": source,
+                "resolves": resolves,
+            })
+
+    return notes, checked, records
+
+
+def select_notes(note_index: NoteIndex, scope: str | None, skip_paths: list[str]) -> list[str]:
+    """Notes to audit: everything in scope except the checker's SKIP_PATHS."""
+    prefix = scope.strip("/") + "/" if scope else ""
+    return [
+        rel_path for rel_path in note_index.note_paths()
+        if rel_path.startswith(prefix) and not any(skip in rel_path for skip in skip_paths)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Audit wiki-links across a whole vault")
+    parser.add_argument("--vault", default=os.environ.get("CLAUDE_PROJECT_DIR", "."),
+                        help="Vault root (default: $CLAUDE_PROJECT_DIR or .)")
+    parser.add_argument("--scope", help="Only audit notes under this folder")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="Worker processes (default: CPU count)")
+    parser.add_argument("--all", action="store_true", help="Emit every link, not just broken ones")
+    parser.add_argument("--strict", action="store_true", help="Exit 2 if any broken links are found")
+    args = parser.parse_args()
+
+    vault_root = Path(args.vault).resolve()
+    if not vault_root.is_dir():
+        print(f"ERROR: Vault not found: {args.vault}", file=sys.stderr)
+        sys.exit(2)
+
+    start = time.perf_counter()
+
+    # Refresh once here so workers only read the index
+    note_index = load_note_index(vault_root)
+    try:
+        skip_paths = load_hook_module("quality/wiki-link-checker.py").SKIP_PATHS
+        rel_paths = select_notes(note_index, args.scope, skip_paths)
+    finally:
+        note_index.close()
+
+    batches = [rel_paths[i:i + BATCH_SIZE] for i in range(0, len(rel_paths), BATCH_SIZE)]
+    notes = checked = broken = 0
+
+    with ProcessPoolExecutor(max_workers=max(1, args.workers), initializer=_init_worker,
+                             initargs=(str(vault_root),)) as pool:
+        futures = [pool.submit(audit_batch, batch, args.all) for batch in batches]
+        for future in futures:
+            batch_notes, batch_checked, records = future.result()
+            notes += batch_notes
+            checked += batch_checked
+            for record in records:
+                if not record["resolves"]:
+                    broken += 1
+                sys.stdout.write(json.dumps(record) + "\n")
+            sys.stdout.flush()
+
+    elapsed = time.perf_counter() - start
+    print(f"Audited {notes} notes, {checked} links: {broken} broken "
+          f"({elapsed:.1f}s, {args.workers} workers)", file=sys.stderr)
+
+    if broken and args.strict:
+        sys.exit(2)
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Vault Frontmatter Index CLI
+
+Builds and queries the frontmatter index (hooks/lib/frontmatter_index.py),
+so skills such as /find-decisions, /timeline or /weekly-summary can filter
+notes by type, status, date or any field without reading the vault. Build
+it once; frontmatter-validator.py (or quality-dispatcher.py) then records
+each edited note, and every query first refreshes notes changed outside
+Claude (by size and mtime).
+
+Usage:
+  python3 hooks/batch/frontmatter_index.py build
+  python3 hooks/batch/frontmatter_index.py query --type ADR --status accepted
+  python3 hooks/batch/frontmatter_index.py query --type Meeting --since 2026-01-01 --field project=Alpha
+  python3 hooks/batch/frontmatter_index.py query --field tags=domain/data --json
+  python3 hooks/batch/frontmatter_index.py show "Projects/Project - Alpha.md"
+  python3 hooks/batch/frontmatter_index.py stats
+
+Queries print one note path per line, newest date first (--json for an
+array of {"path", "type", "status", "date", "priority", "title"}).
+
+Exit Codes:
+  0 - Success
+  2 - Index not built, or vault/note not found
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "lib"))
+
+from frontmatter_index import FrontmatterIndex, load_frontmatter_index  # noqa: E402
+from note_index import load_note_index  # noqa: E402
+
+
+def refresh(index: FrontmatterIndex, vault_root: Path) -> tuple[int, int, int]:
+    """Refresh against the note index. Returns (notes, reparsed, removed)."""
+    note_index = load_note_index(vault_root)
+    try:
+        note_paths = note_index.note_paths()
+    finally:
+        note_index.close()
+    parsed, removed = index.refresh(note_paths)
+    return len(note_paths), parsed, removed
+
+
+def parse_fields(values: list[str]) -> dict[str, str]:
+    fields = {}
+    for value in values:
+        key, sep, wanted = value.partition("=")
+        if not sep or not key:
+            print(f"ERROR: --field needs KEY=VALUE, got: {value}", file=sys.stderr)
+            sys.exit(2)
+        fields[key] = wanted
+    return fields
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build and query the vault frontmatter index")
+    parser.add_argument("command", choices=["build", "query", "show", "stats"])
+    parser.add_argument("note", nargs="?", help="Vault-relative note path (show)")
+    parser.add_argument("--vault", default=os.environ.get("CLAUDE_PROJECT_DIR", "."),
+                        help="Vault root (default: $CLAUDE_PROJECT_DIR or .)")
+    parser.add_argument("--type", dest="note_type", help="Note type, e.g. Meeting")
+    parser.add_argument("--status", help="Status, e.g. active")
+    parser.add_argument("--priority", help="Priority, e.g. high")
+    parser.add_argument("--since", help="Earliest date (YYYY-MM-DD, inclusive)")
+    parser.add_argument("--until", help="Latest date (YYYY-MM-DD, inclusive)")
+    parser.add_argument("--field", action="append", default=[], metavar="KEY=VALUE",
+                        help="Any frontmatter field (repeatable; list fields match any item)")
+    parser.add_argument("--scope", help="Only notes under this folder")
+    parser.add_argument("--limit", type=int, help="At most this many results")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    vault_root = Path(args.vault).resolve()
+    if not vault_root.is_dir():
+        print(f"ERROR: Vault not found: {args.vault}", file=sys.stderr)
+        sys.exit(2)
+
+    if args.command != "build" and not FrontmatterIndex(vault_root).exists():
+        print("ERROR: Frontmatter index not built. Run: frontmatter_index.py build", file=sys.stderr)
+        sys.exit(2)
+
+    start = time.perf_counter()
+    index = load_frontmatter_index(vault_root)
+    try:
+        notes, parsed, removed = refresh(index, vault_root)
+
+        if args.command == "build":
+            print(f"Indexed {notes} notes: {parsed} parsed, {removed} removed "
+                  f"({time.perf_counter() - start:.1f}s)", file=sys.stderr)
+
+        elif args.command == "query":
+            rows = index.query(note_type=args.note_type, status=args.status, priority=args.priority,
+                               since=args.since, until=args.until, fields=parse_fields(args.field),
+                               scope=args.scope, limit=args.limit)
+            if args.json:
+                print(json.dumps([row._asdict() for row in rows], indent=2))
+            else:
+                for row in rows:
+                    print(row.path)
+            print(f"{len(rows)} notes ({time.perf_counter() - start:.2f}s)", file=sys.stderr)
+
+        elif args.command == "show":
+            if not args.note:
+                print("ERROR: show needs a note path", file=sys.stderr)
+                sys.exit(2)
+            note = args.note if args.note.endswith(".md") else f"{args.note}.md"
+            if not (vault_root / note).exists():
+                print(f"ERROR: Note not found: {note}", file=sys.stderr)
+                sys.exit(2)
+            print(json.dumps(index.fields(note), indent=2))
+
+        else:
+            stats = {"notes": notes, "types": index.counts("type"), "statuses": index.counts("status")}
+            print(json.dumps(stats, indent=2) if args.json else
+                  f"notes: {notes}\n" + "\n".join(f"  {note_type or '(none)'}: {count}"
+                                                 for note_type, count in stats["types"].items()))
+    finally:
+        index.close()
+
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Vault Link Graph CLI
+
+Builds and queries the persistent backlink graph (hooks/lib/link_graph.py).
+Build it once; wiki-link-checker.py (or quality-dispatcher.py) then keeps it
+current by recording each edited note's links, and starts `compact` in the
+background once enough edits have piled up.
+
+Usage:
+  python3 hooks/batch/link_graph.py build
+  python3 hooks/batch/link_graph.py backlinks "Projects/Project - Alpha.md"
+  python3 hooks/batch/link_graph.py outlinks "Meetings/2026-01-05 Sync.md"
+  python3 hooks/batch/link_graph.py orphans --scope Concepts/
+  python3 hooks/batch/link_graph.py stats
+  python3 hooks/batch/link_graph.py compact
+
+Queries print one note path per line (--json for a JSON array).
+
+Exit Codes:
+  0 - Success
+  2 - Graph not built, or vault/note not found
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "lib"))
+
+from hook_runner import load_hook_module  # noqa: E402
+from link_graph import LinkGraph, compact_link_graph, link_key, load_link_graph  # noqa: E402
+from note_index import load_note_index  # noqa: E402
+
+# Notes per task sent to a worker
+BATCH_SIZE = 250
+
+_checker = None
+
+
+def _init_worker() -> None:
+    global _checker
+    _checker = load_hook_module("quality/wiki-link-checker.py")
+
+
+def extract_batch(vault_root: str, rel_paths: list[str]) -> dict[str, list[str]]:
+    """Read a batch of notes and return {file: [link keys]}."""
+    edges = {}
+    for rel_path in rel_paths:
+        try:
+            content = (Path(vault_root) / rel_path).read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            continue
+        targets = [target for target, _ in _checker.extract_wiki_links(content)]
+        targets += _checker.extract_frontmatter_links(content)
+        edges[rel_path] = sorted({key for key in map(link_key, targets) if key})
+    return edges
+
+
+def build_graph(vault_root: Path, note_paths: list[str], workers: int) -> LinkGraph:
+    skip_paths = load_hook_module("quality/wiki-link-checker.py").SKIP_PATHS
+    rel_paths = [p for p in note_paths if not any(skip in p for skip in skip_paths)]
+    batches = [rel_paths[i:i + BATCH_SIZE] for i in range(0, len(rel_paths), BATCH_SIZE)]
+
+    edges = {}
+    with ProcessPoolExecutor(max_workers=max(1, workers), initializer=_init_worker) as pool:
+        for batch_edges in pool.map(extract_batch, [str(vault_root)] * len(batches), batches):
+            edges.update(batch_edges)
+
+    graph = LinkGraph(vault_root).build(edges)
+    graph.save()
+    return graph
+
+
+def emit(paths: list[str], as_json: bool) -> None:
+    if as_json:
+        print(json.dumps(paths))
+    else:
+        for path in paths:
+            print(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build and query the vault backlink graph")
+    parser.add_argument("command", choices=["build", "backlinks", "outlinks", "orphans", "stats", "compact"])
+    parser.add_argument("note", nargs="?", help="Vault-relative note path (backlinks/outlinks)")
+    parser.add_argument("--vault", default=os.environ.get("CLAUDE_PROJECT_DIR", "."),
+                        help="Vault root (default: $CLAUDE_PROJECT_DIR or .)")
+    parser.add_argument("--scope", help="Only report orphans under this folder")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="Worker processes for build (default: CPU count)")
+    parser.add_argument("--json", action="store_true", help="Print results as a JSON array")
+    args = parser.parse_args()
+
+    vault_root = Path(args.vault).resolve()
+    if not vault_root.is_dir():
+        print(f"ERROR: Vault not found: {args.vault}", file=sys.stderr)
+        sys.exit(2)
+
+    if args.command == "build":
+        start = time.perf_counter()
+        note_index = load_note_index(vault_root)
+        try:
+            note_paths = note_index.note_paths()
+        finally:
+            note_index.close()
+        graph = build_graph(vault_root, note_paths, args.workers)
+        print(f"Built link graph: {len(graph.files)} notes, {len(graph.keys)} link targets, "
+              f"{len(graph.fwd_targets)} links ({time.perf_counter() - start:.1f}s)",
+              file=sys.stderr)
+        sys.exit(0)
+
+    graph = load_link_graph(vault_root)
+    if not graph.exists():
+        print("ERROR: Link graph not built. Run: link_graph.py build", file=sys.stderr)
+        sys.exit(2)
+
+    if args.command == "compact":
+        start = time.perf_counter()
+        pending = len(graph.overlay)
+        if compact_link_graph(vault_root) is None:
+            print("Compaction already running", file=sys.stderr)
+        else:
+            print(f"Folded {pending} edited notes into the link graph "
+                  f"({time.perf_counter() - start:.1f}s)", file=sys.stderr)
+        sys.exit(0)
+
+    if args.command in ("backlinks", "outlinks"):
+        if not args.note:
+            print(f"ERROR: {args.command} needs a note path", file=sys.stderr)
+            sys.exit(2)
+        note = args.note if args.note.endswith(".md") else f"{args.note}.md"
+        if not (vault_root / note).exists():
+            print(f"ERROR: Note not found: {note}", file=sys.stderr)
+            sys.exit(2)
+        if args.command == "backlinks":
+            emit(graph.backlinks(note), args.json)
+        else:
+            emit(graph.outlinks(note), args.json)
+
+    elif args.command == "orphans":
+        note_index = load_note_index(vault_root)
+        try:
+            note_paths = note_index.note_paths()
+        finally:
+            note_index.close()
+        orphans = graph.orphans(note_paths)
+        if args.scope:
+            prefix = args.scope.strip("/") + "/"
+            orphans = [path for path in orphans if path.startswith(prefix)]
+        emit(orphans, args.json)
+
+    else:
+        stats = {
+            "notes": len(graph.files),
+            "link_targets": len(graph.keys),
+            "links": len(graph.fwd_targets),
+            "pending_edits": len(graph.overlay),
+        }
+        print(json.dumps(stats, indent=2) if args.json else
+              "\n".join(f"{name}: {value}" for name, value in stats.items()))
+
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Bulk Protected-Path Check
+
+Classifies a list of paths with file-protection.py's policy in one call, so
+the same rules the hook applies to single edits can gate a commit or sweep
+a vault for stray credential files (.env, id_rsa, "API key.md", ...).
+
+Paths come from the command line, from stdin (one per line) or, with
+--walk, from every file under the vault. The policy is compiled once and
+decisions are memoised, so repeated directory prefixes and names cost a
+dictionary lookup.
+
+Usage:
+  git diff --cached --name-only | python3 hooks/batch/protected_paths.py --strict
+  python3 hooks/batch/protected_paths.py .env notes/todo.md
+  python3 hooks/batch/protected_paths.py --walk --vault ~/Vault
+
+Output (one JSON object per protected path; every path with --all):
+  {"path": ".env", "protected": true, "reason": "Protected file: .env"}
+
+Exit Codes:
+  0 - Check completed (or only warnings)
+  2 - Protected paths found (with --strict)
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "lib"))
+
+from hook_runner import load_hook_module  # noqa: E402
+
+# Directories not descended into by --walk (.git is reported once, not per object)
+SKIP_DIRS = {".git", ".obsidian", "node_modules", ".trash"}
+
+
+def walk_paths(vault_root: Path):
+    """Yield every file under the vault, relative and POSIX-style."""
+    root = str(vault_root)
+    for dirpath, dirnames, filenames in os.walk(root):
+        rel_dir = os.path.relpath(dirpath, root)
+        for name in dirnames:
+            if name in SKIP_DIRS:
+                yield (name if rel_dir == "." else f"{rel_dir}/{name}").replace(os.sep, "/") + "/"
+        dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+        for name in filenames:
+            yield (name if rel_dir == "." else f"{rel_dir}/{name}").replace(os.sep, "/")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check many paths against the file-protection policy")
+    parser.add_argument("paths", nargs="*", help="Paths to check (default: read from stdin)")
+    parser.add_argument("--walk", action="store_true", help="Check every file in the vault")
+    parser.add_argument("--vault", default=os.environ.get("CLAUDE_PROJECT_DIR", "."),
+                        help="Vault root for --walk (default: $CLAUDE_PROJECT_DIR or .)")
+    parser.add_argument("--all", action="store_true", help="Emit every path, not just protected ones")
+    parser.add_argument("--strict", action="store_true", help="Exit 2 if any path is protected")
+    args = parser.parse_args()
+
+    if args.walk:
+        vault_root = Path(args.vault).resolve()
+        if not vault_root.is_dir():
+            print(f"ERROR: Vault not found: {args.vault}", file=sys.stderr)
+            sys.exit(2)
+        paths = list(walk_paths(vault_root))
+    elif args.paths:
+        paths = args.paths
+    else:
+        paths = [line.rstrip("\n") for line in sys.stdin if line.strip()]
+
+    start = time.perf_counter()
+    protection = load_hook_module("security/file-protection.py")
+    protected = 0
+    for path, blocked, reason in protection.classify_paths(paths):
+        if blocked:
+            protected += 1
+        if blocked or args.all:
+            sys.stdout.write(json.dumps({"path": path, "protected": blocked, "reason": reason}) + "\n")
+
+    elapsed = time.perf_counter() - start
+    print(f"Checked {len(paths)} paths: {protected} protected ({elapsed:.2f}s)", file=sys.stderr)
+
+    if protected and args.strict:
+        sys.exit(2)
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Vault-Wide Secret Sweep
+
+Scans every text file in a vault for secrets with the same patterns and skip
+rules as secret-file-scanner.py. That hook only sees content Claude writes;
+notes that arrive through Obsidian Sync or a git pull are never checked.
+Run this nightly (or after a pull) to cover them.
+
+Re-runs are incremental. The sweep keeps a cache in
+.claude/cache/secret-sweep.sqlite with each file's size, mtime and BLAKE2
+content hash:
+  - size and mtime unchanged   -> skipped without reading the file
+  - touched but hash unchanged -> skipped after hashing (no scan)
+  - new or changed             -> scanned
+Changing the secret patterns or the allowlist (.claude/secret-allowlist.json)
+invalidates the cache.
+
+Changed files are hashed and scanned by a process pool. Files are
+memory-mapped, and large ones are decoded and scanned in chunks.
+
+Usage:
+  python3 hooks/batch/secret_sweep.py                  # vault = $CLAUDE_PROJECT_DIR or .
+  python3 hooks/batch/secret_sweep.py --vault ~/Vault --strict
+  python3 hooks/batch/secret_sweep.py --rescan         # ignore the cache
+
+Output (one JSON object per file with findings):
+  {"file": "Meetings/Sync.md", "findings": [{"type": "password", "count": 1}], "cached": true}
+
+Exit Codes:
+  0 - Sweep completed (or only warnings)
+  2 - Secrets found (with --strict)
+"""
+
+import argparse
+import codecs
+import hashlib
+import json
+import mmap
+import os
+import sqlite3
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "lib"))
+
+from hook_runner import load_hook_module  # noqa: E402
+from secret_allowlist import load_allowlist  # noqa: E402
+from secret_matcher import CHUNK_SIZE  # noqa: E402
+from secret_patterns import patterns_digest, scan_stream  # noqa: E402
+
+# Where the cache lives, relative to the vault root
+CACHE_PATH = Path(".claude") / "cache" / "secret-sweep.sqlite"
+
+# Customise: file extensions to sweep
+SWEEP_EXTENSIONS = {".md", ".txt", ".json", ".yaml", ".yml", ".csv", ".canvas"}
+
+# Directories to skip (plus any directory starting with '.')
+SKIP_DIRS = {".obsidian", ".git", "node_modules", ".claude", ".trash"}
+
+# Files larger than this are decoded and scanned in chunks
+STREAM_BYTES = 1024 * 1024
+
+# Files changed this recently are re-hashed on the next sweep
+RACY_WINDOW_NS = 2_000_000_000
+
+# Files per task sent to a worker
+BATCH_SIZE = 100
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime INTEGER NOT NULL,
+    digest TEXT NOT NULL,
+    findings TEXT NOT NULL
+);
+"""
+
+_scanner = None
+
+
+def _init_worker() -> None:
+    global _scanner
+    _scanner = load_hook_module("security/secret-file-scanner.py")
+
+
+def scan_file(abs_path: str, size: int, allow=None) -> tuple[str, list]:
+    """Hash and scan one file. Returns (BLAKE2 hex digest, findings)."""
+    if size == 0:
+        return hashlib.blake2b(b"").hexdigest(), []
+
+    with open(abs_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        digest = hashlib.blake2b(mm).hexdigest()
+        if size <= STREAM_BYTES:
+            text = mm[:].decode("utf-8", errors="replace")
+            findings = _scanner.check_content_for_secrets(text, allow=allow)
+        else:
+            findings = scan_stream(_decode_chunks(mm), allow=allow)
+    return digest, [list(finding) for finding in findings]
+
+
+def _decode_chunks(mm: mmap.mmap):
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    for start in range(0, len(mm), CHUNK_SIZE):
+        yield decoder.decode(mm[start:start + CHUNK_SIZE])
+    yield decoder.decode(b"", final=True)
+
+
+def sweep_batch(vault_root: str, batch: list[tuple[str, int, str | None]]) -> list[tuple]:
+    """Process files whose size or mtime changed.
+
+    Returns (path, digest, findings) per file; findings is None when the
+    content hash matches the cached one, so the cached findings still apply.
+    """
+    results = []
+    allowlist = load_allowlist(Path(vault_root))
+    for rel_path, size, cached_digest in batch:
+        abs_path = os.path.join(vault_root, rel_path)
+        try:
+            if cached_digest is not None and size > 0:
+                with open(abs_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    digest = hashlib.blake2b(mm).hexdigest()
+                if digest == cached_digest:
+                    results.append((rel_path, digest, None))
+                    continue
+            digest, findings = scan_file(abs_path, size, allowlist.for_path(rel_path))
+        except (OSError, ValueError):
+            continue  # Vanished or unreadable - picked up next sweep
+        results.append((rel_path, digest, findings))
+    return results
+
+
+def walk_vault(vault_root: Path, should_skip):
+    """Yield (rel_path, size, mtime_ns) for every file to sweep."""
+    root = str(vault_root)
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS and not d.startswith('.')]
+        rel_dir = os.path.relpath(dirpath, root)
+        for name in filenames:
+            if os.path.splitext(name)[1].lower() not in SWEEP_EXTENSIONS:
+                continue
+            rel_path = name if rel_dir == "." else f"{rel_dir}/{name}".replace(os.sep, "/")
+            if should_skip(rel_path):
+                continue
+            try:
+                st = os.stat(os.path.join(dirpath, name))
+            except OSError:
+                continue
+            yield rel_path, st.st_size, st.st_mtime_ns
+
+
+def open_cache(vault_root: Path, rescan: bool) -> sqlite3.Connection:
+    path = vault_root / CACHE_PATH
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(path), timeout=5)
+    conn.executescript(_SCHEMA)
+
+    digest = f"{patterns_digest()}:{load_allowlist(vault_root).digest()}"
+    row = conn.execute("SELECT value FROM meta WHERE key = 'patterns'").fetchone()
+    if rescan or row is None or row[0] != digest:
+        with conn:
+            conn.execute("DELETE FROM files")
+            conn.execute("INSERT OR REPLACE INTO meta VALUES ('patterns', ?)", (digest,))
+    return conn
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sweep a vault for secrets")
+    parser.add_argument("--vault", default=os.environ.get("CLAUDE_PROJECT_DIR", "."),
+                        help="Vault root (default: $CLAUDE_PROJECT_DIR or .)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="Worker processes (default: CPU count)")
+    parser.add_argument("--rescan", action="store_true", help="Ignore the cache and scan everything")
+    parser.add_argument("--strict", action="store_true", help="Exit 2 if any secrets are found")
+    args = parser.parse_args()
+
+    vault_root = Path(args.vault).resolve()
+    if not vault_root.is_dir():
+        print(f"ERROR: Vault not found: {args.vault}", file=sys.stderr)
+        sys.exit(2)
+
+    start = time.perf_counter()
+    now = time.time_ns()
+    scanner = load_hook_module("security/secret-file-scanner.py")
+    conn = open_cache(vault_root, args.rescan)
+    cached = {path: (size, mtime, digest, findings) for path, size, mtime, digest, findings
+              in conn.execute("SELECT path, size, mtime, digest, findings FROM files")}
+
+    seen = {}
+    changed = []
+    for rel_path, size, mtime in walk_vault(vault_root, scanner.should_skip_file):
+        # Recently modified files may change again within the mtime granularity
+        seen[rel_path] = (size, -1 if now - mtime < RACY_WINDOW_NS else mtime)
+        entry = cached.get(rel_path)
+        if entry and entry[0] == size and entry[1] == mtime:
+            continue
+        changed.append((rel_path, size, entry[2] if entry else None))
+
+    batches = [changed[i:i + BATCH_SIZE] for i in range(0, len(changed), BATCH_SIZE)]
+    scanned = set()
+    rehashed = 0
+
+    with ProcessPoolExecutor(max_workers=max(1, args.workers), initializer=_init_worker) as pool, conn:
+        for results in pool.map(sweep_batch, [str(vault_root)] * len(batches), batches):
+            for rel_path, digest, findings in results:
+                size, mtime = seen[rel_path]
+                if findings is None:
+                    rehashed += 1
+                    findings_json = cached[rel_path][3]
+                else:
+                    scanned.add(rel_path)
+                    findings_json = json.dumps(findings)
+                conn.execute("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?)",
+                             (rel_path, size, mtime, digest, findings_json))
+
+        # Forget deleted files
+        for rel_path in set(cached) - set(seen):
+            conn.execute("DELETE FROM files WHERE path = ?", (rel_path,))
+
+    flagged = 0
+    for rel_path, findings_json in conn.execute(
+            "SELECT path, findings FROM files WHERE findings != '[]' ORDER BY path"):
+        flagged += 1
+        record = {
+            "file": rel_path,
+            "findings": [{"type": stype, "count": count} for stype, count in json.loads(findings_json)],
+            "cached": rel_path not in scanned,
+        }
+        sys.stdout.write(json.dumps(record) + "\n")
+    conn.close()
+
+    elapsed = time.perf_counter() - start
+    print(f"Swept {len(seen)} files: {len(scanned)} scanned, {rehashed} unchanged by hash, "
+          f"{len(seen) - len(changed)} unchanged by mtime; {flagged} with secrets ({elapsed:.1f}s)",
+          file=sys.stderr)
+
+    if flagged and args.strict:
+        sys.exit(2)
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
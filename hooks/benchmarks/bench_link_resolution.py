@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Wiki-Link Resolution Benchmark
+
+Compares per-link cost of the original prefix-probing check_link_exists()
+(two loops over every ontology prefix per link) with the note index's
+canonical link keys on a synthetic vault:
+
+  - in-memory map: one dictionary lookup per link (batch tools load the
+    whole map once)
+  - indexed query: what the hook does, one SQLite query per note for all of
+    its links, with nothing loaded up front
+
+Usage:
+  python3 hooks/benchmarks/bench_link_resolution.py
+  python3 hooks/benchmarks/bench_link_resolution.py --notes 60000 --links 20000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "lib"))
+
+from note_index import LINK_PREFIXES, NoteIndex, link_resolves  # noqa: E402
+
+
+def legacy_check_link_exists(link_target: str, vault_notes: set[str]) -> bool:
+    """check_link_exists() as it was before the link-key map."""
+    if link_target in vault_notes:
+        return True
+    for prefix in LINK_PREFIXES:
+        if link_target.startswith(prefix):
+            if link_target[len(prefix):] in vault_notes:
+                return True
+    for prefix in LINK_PREFIXES:
+        if prefix + link_target in vault_notes:
+            return True
+    if '#' in link_target:
+        if link_target.split('#')[0] in vault_notes:
+            return True
+    if '^' in link_target:
+        if link_target.split('^')[0] in vault_notes:
+            return True
+    return False
+
+
+def make_vault(note_count: int, link_count: int, seed: int) -> tuple[list[str], list[str]]:
+    """Synthetic note names and a link mix (exact, prefix-less, anchored, broken)."""
+    rng = random.Random(seed)
+    prefixes = LINK_PREFIXES + [""] * 5
+    notes = [f"{rng.choice(prefixes)}Note {i}" for i in range(note_count)]
+
+    links = []
+    for _ in range(link_count):
+        name = rng.choice(notes)
+        kind = rng.random()
+        if kind < 0.4:
+            links.append(name)                            # exact
+        elif kind < 0.6:
+            links.append(name.split(" - ", 1)[-1])        # prefix omitted
+        elif kind < 0.7:
+            links.append(f"{name}#Heading")               # heading link
+        else:
+            links.append(f"Missing Note {rng.random()}")  # broken (worst case)
+    return notes, links
+
+
+def time_per_link(check, links: list[str], repeat: int) -> float:
+    """Best-of-N nanoseconds per link."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        for link in links:
+            check(link)
+        best = min(best, (time.perf_counter_ns() - start) / len(links))
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark wiki-link resolution")
+    parser.add_argument("--notes", type=int, default=60000, help="Notes in the synthetic vault")
+    parser.add_argument("--links", type=int, default=20000, help="Links to resolve")
+    parser.add_argument("--links-per-note", type=int, default=50, help="Links per hook query")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing repetitions (best is kept)")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    notes, links = make_vault(args.notes, args.links, args.seed)
+    vault_notes = set(notes)
+
+    index = NoteIndex(Path("."), db_path=":memory:")
+    start = time.perf_counter()
+    index.add_notes("", notes)
+    build_ms = (time.perf_counter() - start) * 1000
+    link_keys = index.link_keys()
+
+    batches = [links[i:i + args.links_per_note] for i in range(0, len(links), args.links_per_note)]
+
+    def query_batches():
+        for batch in batches:
+            index.resolve_links(batch)
+
+    legacy_ns = time_per_link(lambda link: legacy_check_link_exists(link, vault_notes), links, args.repeat)
+    mapped_ns = time_per_link(lambda link: link_resolves(link_keys, link), links, args.repeat)
+    query_ns = min(_time_ns(query_batches) for _ in range(args.repeat)) / len(links)
+
+    print(f"Vault: {args.notes} notes, {args.links} links")
+    print(f"Index build:        {build_ms:.1f} ms (once; then only changed directories)")
+    print(f"Prefix probing:     {legacy_ns:8.0f} ns/link (needs every note name loaded first)")
+    print(f"In-memory link map: {mapped_ns:8.0f} ns/link  ({legacy_ns / mapped_ns:.1f}x faster)")
+    print(f"Indexed query:      {query_ns:8.0f} ns/link  ({args.links_per_note} links per query, nothing preloaded)")
+
+
+def _time_ns(func) -> int:
+    start = time.perf_counter_ns()
+    func()
+    return time.perf_counter_ns() - start
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Secret Scan Adversarial-Input Benchmark
+
+Times the full prompt scan (secret_patterns.scan) on inputs built to make
+regexes backtrack - anchors repeated with no match, separator-heavy lines,
+one giant token - at growing sizes, and checks the time grows linearly.
+
+For comparison, the old connection-string pattern
+"(mongodb|...)://[^\\s]+:[^\\s]+@" run with re.findall is timed on the
+connection-string inputs, only at small sizes: it is cubic on "postgres://"
+repeated.
+
+Also lists any registry pattern that backtracking_risk() flags (those run
+with a RISKY_SPAN match window) and exits 1 if the scan time per character
+grows more than --max-growth times from the smallest size to the largest.
+
+Usage:
+  python3 hooks/benchmarks/bench_secret_redos.py
+  python3 hooks/benchmarks/bench_secret_redos.py --max-kb 4096
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "lib"))
+
+from secret_matcher import RISKY_SPAN, backtracking_risk  # noqa: E402
+from secret_patterns import SECRET_PATTERNS, scan  # noqa: E402
+
+LEGACY_CONNECTION_STRING = r"(?i)(mongodb|postgres|mysql|redis)://[^\s]+:[^\s]+@"
+
+# The legacy pattern is only run on these payloads, up to this many characters
+LEGACY_PAYLOADS = ("conn-colons", "conn-repeat")
+LEGACY_MAX_CHARS = 4096
+
+PAYLOADS = {
+    "conn-colons": lambda n: "postgres://" + "a:" * (n // 2),
+    "conn-repeat": lambda n: "postgres://" * (n // 11),
+    "keyword-repeat": lambda n: "password token secret " * (n // 22),
+    "bearer-short": lambda n: "Bearer abcdefghijklmnopqrs " * (n // 27),
+    "one-token": lambda n: "x" * n,
+    "url-colons": lambda n: "redis://" + ":@" * (n // 2),
+}
+
+
+def seconds(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark secret scanning on adversarial input")
+    parser.add_argument("--min-kb", type=int, default=16, help="Smallest payload in KB")
+    parser.add_argument("--max-kb", type=int, default=1024, help="Largest payload in KB")
+    parser.add_argument("--max-growth", type=float, default=4.0,
+                        help="Fail if time per character grows more than this")
+    args = parser.parse_args()
+
+    risky = [p.id for p in SECRET_PATTERNS if backtracking_risk(p.regex)]
+    print(f"{len(SECRET_PATTERNS)} patterns; backtracking risk: "
+          f"{', '.join(risky) if risky else 'none'} (window {RISKY_SPAN} chars)")
+
+    sizes = []
+    size = args.min_kb * 1024
+    while size <= args.max_kb * 1024:
+        sizes.append(size)
+        size *= 4
+
+    legacy = re.compile(LEGACY_CONNECTION_STRING)
+    scan("warm up")
+
+    failed = False
+    for name, make in PAYLOADS.items():
+        print(f"{name}:")
+        per_char = []
+        for size in sizes:
+            text = make(size)
+            elapsed = seconds(lambda: scan(text))
+            per_char.append(elapsed / len(text))
+            print(f"  {len(text) / 1024:>7.0f} KB  scan {elapsed * 1000:>8.1f} ms")
+
+        for size in (LEGACY_MAX_CHARS // 4, LEGACY_MAX_CHARS // 2, LEGACY_MAX_CHARS):
+            if name not in LEGACY_PAYLOADS:
+                break
+            text = make(size)
+            elapsed = seconds(lambda: legacy.findall(text))
+            print(f"  {len(text) / 1024:>7.1f} KB  old connection-string pattern "
+                  f"{elapsed * 1000:>8.1f} ms")
+
+        growth = per_char[-1] / per_char[0]
+        print(f"  time per character grew {growth:.1f}x")
+        if growth > args.max_growth:
+            failed = True
+
+    if failed:
+        print(f"FAIL: scan time grew faster than linear (>{args.max_growth}x per character)")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
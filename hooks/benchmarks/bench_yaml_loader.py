@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Frontmatter Loader Ladder Benchmark
+
+Times validate_frontmatter.py's loader ladder against always loading the
+header with PyYAML:
+
+  import  - `import yaml` in a fresh interpreter, and the whole Stop hook
+            run on a typical note and on a note with nested YAML
+  parse   - microseconds per header for the simple parser, CSafeLoader
+            (when PyYAML was built with libyaml) and SafeLoader
+
+Also checks which path the ladder takes for each note, and that it matches
+PyYAML on every required field of the note's type.
+
+Notes:
+  flat    - a Meeting note: scalars, a block list and an inline list
+  nested  - a Project note with a nested mapping and a block scalar
+
+Usage:
+  python3 hooks/benchmarks/bench_yaml_loader.py
+  python3 hooks/benchmarks/bench_yaml_loader.py --repeat 20 --number 2000
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "lib"))
+
+from hook_runner import HOOKS_DIR, load_hook_module  # noqa: E402
+from note_types import SCHEMA  # noqa: E402
+
+VALIDATOR = "validators/validate_frontmatter.py"
+
+NOTES = {
+    "flat": """---
+type: Meeting
+title: "Weekly architecture sync"
+date: 2026-03-02
+created: 2026-03-02
+attendees:
+  - "[[Alice Smith]]"
+  - "[[Bob Jones]]"
+project: "[[Project - Alpha]]"
+tags: [meeting, project/alpha, domain/architecture]
+---
+
+# Weekly architecture sync
+
+- Agreed the integration approach for the billing service.
+""",
+    "nested": """---
+type: Project
+title: Alpha
+status: active
+priority: high
+owner:
+  name: Alice Smith
+  team: Platform
+summary: |
+  Replace the billing batch jobs with an event-driven service.
+  Phase one covers invoices.
+tags: [project, domain/billing]
+---
+
+# Project - Alpha
+""",
+}
+
+
+def best_seconds(func, repeat: int, number: int = 1) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def run_seconds(command: list[str], repeat: int, env: dict | None = None) -> float:
+    return best_seconds(lambda: subprocess.run(command, env=env, stdout=subprocess.DEVNULL,
+                                               stderr=subprocess.DEVNULL), repeat)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the frontmatter loader ladder")
+    parser.add_argument("--repeat", type=int, default=10, help="Timing repetitions (best is kept)")
+    parser.add_argument("--number", type=int, default=1000, help="Parses per parse-time repetition")
+    args = parser.parse_args()
+
+    validator = load_hook_module(VALIDATOR)
+    loader = validator.yaml_loader()
+    if loader is None:
+        print("PyYAML not installed: only the simple parser is available")
+        yaml = None
+    else:
+        yaml = loader[0]
+        print(f"PyYAML {yaml.__version__}, libyaml {'available' if yaml.__with_libyaml__ else 'not available'}")
+
+    # Import time
+    python = [sys.executable, "-c"]
+    baseline = run_seconds(python + ["pass"], args.repeat)
+    print("\nimport (fresh interpreter, minus a bare `python -c pass`)")
+    if yaml is not None:
+        print(f"  {'import yaml':<24} {(run_seconds(python + ['import yaml'], args.repeat) - baseline) * 1000:>7.1f} ms")
+
+    with tempfile.TemporaryDirectory() as vault:
+        env = dict(os.environ, CLAUDE_PROJECT_DIR=vault)
+        for name, content in NOTES.items():
+            Path(vault, f"{name}.md").write_text(content, encoding="utf-8")
+            hook = [sys.executable, str(HOOKS_DIR / VALIDATOR), "--file", f"{name}.md"]
+            seconds = run_seconds(hook, args.repeat, env) - baseline
+            print(f"  {'hook, ' + name + ' note':<24} {seconds * 1000:>7.1f} ms")
+
+    # Parse time and correctness
+    print(f"\nparse (us per header) {'simple':>10} {'CSafeLoader':>12} {'SafeLoader':>11}  ladder path")
+    for name, content in NOTES.items():
+        raw = validator.parse_header(content).raw
+        data, path = validator.load_frontmatter(content)
+        timings = [best_seconds(lambda: validator.parse_header(content), args.repeat, args.number)]
+        if yaml is not None:
+            expected = yaml.safe_load(raw)
+            required = SCHEMA.types[expected["type"]].skill_required
+            if any((field in data) != (field in expected) for field in required):
+                print(f"MISMATCH on {name}: {path} gave {data}, PyYAML gave {expected}")
+                sys.exit(1)
+            loaders = [getattr(yaml, "CSafeLoader", None), yaml.SafeLoader]
+            timings += [best_seconds(lambda: yaml.load(raw, Loader=loader_class), args.repeat, args.number)
+                        if loader_class else None for loader_class in loaders]
+        cells = [f"{t * 1e6:.1f}" if t is not None else "-" for t in timings]
+        cells += ["-"] * (3 - len(cells))
+        print(f"  {name:<19} {cells[0]:>10} {cells[1]:>12} {cells[2]:>11}  {path}")
+
+
+if __name__ == "__main__":
+    main()
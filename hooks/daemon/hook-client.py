@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Hook Client Shim for Claude Code
+Forwards a hook payload to the hook daemon and replays its response.
+
+Usage (in .claude/settings.json):
+  python3 hooks/daemon/hook-client.py --timeout 10 quality/frontmatter-validator.py
+
+The first argument names the hook script relative to the hooks directory; any
+further arguments are passed through to the hook. --timeout repeats the
+hook's "timeout" from settings.json, so the client answers before Claude
+kills it (it waits TIMEOUT_MARGIN less; RESPONSE_TIMEOUT without it).
+
+If the daemon is not running (connect or send fails) the hook runs in this
+process instead. Once the request has been delivered the hook is never run a
+second time: if the daemon then fails or does not answer in time, the client
+reports it and exits 1, except for security/ hooks, which fail closed and
+exit 2 (block) as the hook itself would have on a finding.
+
+Exit Codes:
+  Whatever the forwarded hook returns
+  1 - No answer from the daemon (non-blocking)
+  2 - No answer from the daemon for a security/ hook (block)
+"""
+
+import json
+import os
+import socket
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.realpath(__file__))), "lib"))
+
+from hook_socket import default_socket_path  # noqa: E402
+
+CONNECT_TIMEOUT = 0.25  # seconds - give up quickly and run in-process
+
+# Seconds to wait for the daemon when no --timeout is given (below the
+# shortest hook "timeout" in the examples, 5s)
+RESPONSE_TIMEOUT = 4
+
+# Seconds kept back from --timeout to report before Claude kills the client
+TIMEOUT_MARGIN = 1
+
+# Hooks whose failure must block rather than let the action through
+FAIL_CLOSED_CATEGORIES = ("security/",)
+
+
+def forward(request: dict, response_timeout: float = RESPONSE_TIMEOUT) -> tuple[bool, dict | None]:
+    """Send a request to the daemon. Returns (delivered, response).
+
+    delivered is False when the daemon could not be reached, so the hook has
+    not run. response is None when it was delivered but no valid answer came.
+    """
+    try:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    except (AttributeError, OSError):
+        return False, None  # No Unix sockets on this platform
+
+    try:
+        try:
+            sock.settimeout(CONNECT_TIMEOUT)
+            sock.connect(default_socket_path())
+            sock.settimeout(response_timeout)
+            sock.sendall(json.dumps(request).encode("utf-8"))
+            sock.shutdown(socket.SHUT_WR)
+        except OSError:
+            return False, None
+
+        try:
+            chunks = []
+            while True:
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+            return True, json.loads(b"".join(chunks).decode("utf-8"))
+        except (OSError, ValueError):
+            return True, None
+    finally:
+        sock.close()
+
+
+def parse_args(argv: list[str]) -> tuple[float, list[str]]:
+    """Split off a leading --timeout SECONDS. Returns (response timeout, rest)."""
+    if len(argv) >= 2 and argv[0] == "--timeout":
+        try:
+            return max(float(argv[1]) - TIMEOUT_MARGIN, 0.5), argv[2:]
+        except ValueError:
+            return RESPONSE_TIMEOUT, argv[2:]
+    return RESPONSE_TIMEOUT, argv
+
+
+def fail(hook_name: str, message: str) -> None:
+    """Report a daemon failure after the request was delivered, and exit."""
+    print(f"hook-client: {message}", file=sys.stderr)
+    if hook_name.startswith(FAIL_CLOSED_CATEGORIES):
+        print(f"hook-client: blocking - {hook_name} could not be checked", file=sys.stderr)
+        sys.exit(2)
+    sys.exit(1)
+
+
+def main():
+    response_timeout, args = parse_args(sys.argv[1:])
+    if not args:
+        print("Usage: hook-client.py [--timeout SECONDS] <category/hook.py> [args...]",
+              file=sys.stderr)
+        sys.exit(0)
+
+    hook_name = args[0]
+    hook_args = args[1:]
+    raw_input = sys.stdin.read()
+
+    request = {
+        "hook": hook_name,
+        "input": raw_input,
+        "argv": hook_args,
+        "cwd": os.getcwd(),
+        "env": dict(os.environ),
+    }
+
+    delivered, response = forward(request, response_timeout)
+    if delivered and response is None:
+        # The daemon may have run the hook already - don't run it twice
+        fail(hook_name, f"no response from hook daemon for {hook_name}")
+    if delivered and "exit_code" not in response:
+        fail(hook_name, response.get("error", "invalid response"))
+
+    if not delivered:
+        # Daemon not running - run the hook here instead
+        from hook_runner import run_hook
+
+        try:
+            stdout, stderr, exit_code = run_hook(hook_name, raw_input, hook_args)
+        except ValueError as e:
+            print(f"hook-client: {e}", file=sys.stderr)
+            sys.exit(0)
+    else:
+        stdout = response.get("stdout", "")
+        stderr = response.get("stderr", "")
+        exit_code = response["exit_code"]
+
+    sys.stdout.write(stdout)
+    sys.stderr.write(stderr)
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Hook Daemon for Claude Code
+Keeps one warm Python interpreter that runs hook scripts on request.
+
+Every hook invocation normally starts a fresh interpreter, re-imports its
+modules and recompiles its regexes. The daemon listens on a Unix socket and
+runs hooks in-process (see hooks/lib/hook_runner.py), so a forwarded hook
+call costs a socket round trip instead of an interpreter start.
+
+Usage:
+  python3 hooks/daemon/hook-daemon.py              # run in foreground
+  python3 hooks/daemon/hook-daemon.py --detach     # start in background
+  python3 hooks/daemon/hook-daemon.py --status     # is it running?
+  python3 hooks/daemon/hook-daemon.py --stop       # shut it down
+
+Hooks are then configured through the client shim:
+  python3 hooks/daemon/hook-client.py quality/frontmatter-validator.py
+
+Hook scripts and their imports are loaded once at startup, then each request
+runs in a forked child. Concurrent hooks (Claude starts a tool's hooks in
+parallel) never wait for one another, a slow formatter cannot hold up
+file-protection.py, and the process-wide state a hook swaps (stdin, stdout,
+cwd, environment) dies with its child.
+
+Edited hook scripts are recompiled on their next run, but the hooks/lib
+modules (secret patterns, note types, protection rules, ...) stay imported.
+The daemon records their mtimes after warming up; when one changes, the
+request that notices runs in a fresh interpreter and the daemon re-executes
+itself, so edits apply immediately without a --stop.
+"""
+
+import argparse
+import json
+import os
+import signal
+import socket
+import socketserver
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "lib"))
+
+from hook_runner import (HOOKS_DIR, loaded_module_mtimes, run_hook,  # noqa: E402
+                         run_hook_process, warm_hook)
+from hook_socket import default_socket_path  # noqa: E402
+
+# Customise: exit after this many idle seconds (0 = run until stopped)
+DEFAULT_IDLE_TIMEOUT = 4 * 60 * 60
+
+# Largest request accepted (payload + environment)
+MAX_REQUEST_BYTES = 64 * 1024 * 1024
+
+# Customise: hook folders preloaded at startup
+WARM_CATEGORIES = ["security", "quality", "ux", "safety"]
+
+
+class HookRequestHandler(socketserver.StreamRequestHandler):
+    """Runs in a forked child: server state changes here do not reach the parent."""
+
+    def handle(self):
+        raw = self.rfile.read(MAX_REQUEST_BYTES)
+        try:
+            request = json.loads(raw.decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            self._reply({"error": "invalid request"})
+            return
+
+        command = request.get("command")
+        if command == "ping":
+            self._reply({
+                "pid": os.getppid(),
+                "uptime": round(time.monotonic() - self.server.started, 1),
+                "requests": self.server.request_count,
+            })
+            return
+        if command == "shutdown":
+            self._reply({"stopping": True})
+            os.kill(os.getppid(), signal.SIGTERM)
+            return
+
+        # Stale hooks/lib modules: run this one fresh while the daemon restarts
+        runner = run_hook_process if self.server.restart else run_hook
+        try:
+            result = runner(
+                request.get("hook", ""),
+                request.get("input", ""),
+                argv=request.get("argv") or [],
+                cwd=request.get("cwd"),
+                env=request.get("env"),
+            )
+        except (ValueError, OSError) as e:
+            self._reply({"error": str(e)})
+            return
+
+        self._reply(result._asdict())
+
+    def _reply(self, response: dict):
+        self.wfile.write(json.dumps(response).encode("utf-8"))
+
+
+class HookDaemon(socketserver.ForkingMixIn, socketserver.UnixStreamServer):
+    block_on_close = False  # Don't wait for running hooks on shutdown
+
+    def __init__(self, socket_path: str, idle_timeout: int):
+        self.started = time.monotonic()
+        self.last_activity = self.started
+        self.request_count = 0
+        self.stopping = False
+        self.restart = False
+        self.module_mtimes = loaded_module_mtimes()
+        self.idle_timeout = idle_timeout
+        self.timeout = 1  # handle_request() wakes up to reap children and check idle time
+
+        # Only the owning user may talk to the daemon
+        old_umask = os.umask(0o077)
+        try:
+            super().__init__(socket_path, HookRequestHandler)
+        finally:
+            os.umask(old_umask)
+
+    def process_request(self, request, client_address):
+        self.last_activity = time.monotonic()
+        self.request_count += 1
+        if not self.restart and self.modules_changed():
+            self.restart = self.stopping = True
+        super().process_request(request, client_address)
+
+    def modules_changed(self) -> bool:
+        """Has any imported hooks/lib module changed on disk since warm-up?"""
+        for filename, mtime in self.module_mtimes.items():
+            try:
+                if os.stat(filename).st_mtime_ns != mtime:
+                    return True
+            except OSError:
+                return True
+        return False
+
+    def serve(self):
+        while not self.stopping:
+            self.handle_request()
+            self.collect_children()
+            idle = time.monotonic() - self.last_activity
+            if self.idle_timeout and idle > self.idle_timeout:
+                break
+
+
+def warm_hooks() -> int:
+    """Run every hook in WARM_CATEGORIES once, so forked children start warm."""
+    warmed = 0
+    for category in WARM_CATEGORIES:
+        for path in sorted((HOOKS_DIR / category).glob("*.py")):
+            try:
+                warm_hook(f"{category}/{path.name}")
+                warmed += 1
+            except (ValueError, OSError):
+                pass  # Unreadable hook - it fails on demand instead
+    return warmed
+
+
+def send_command(socket_path: str, command: str) -> dict | None:
+    """Send a control command to a running daemon."""
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(2)
+            sock.connect(socket_path)
+            sock.sendall(json.dumps({"command": command}).encode("utf-8"))
+            sock.shutdown(socket.SHUT_WR)
+            return json.loads(sock.makefile("rb").read().decode("utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Persistent hook daemon")
+    parser.add_argument("--socket", default=default_socket_path(), help="Unix socket path")
+    parser.add_argument("--idle-timeout", type=int, default=DEFAULT_IDLE_TIMEOUT,
+                        help="Exit after N idle seconds (0 = never)")
+    parser.add_argument("--detach", action="store_true", help="Start in the background and return")
+    parser.add_argument("--status", action="store_true", help="Report whether the daemon is running")
+    parser.add_argument("--stop", action="store_true", help="Stop a running daemon")
+    args = parser.parse_args()
+
+    if args.status or args.stop:
+        response = send_command(args.socket, "shutdown" if args.stop else "ping")
+        if response is None:
+            print(f"Hook daemon not running ({args.socket})")
+            sys.exit(1 if args.status else 0)
+        if args.stop:
+            print("Hook daemon stopped")
+        else:
+            print(f"Hook daemon running: pid {response['pid']}, "
+                  f"up {response['uptime']}s, {response['requests']} requests")
+        sys.exit(0)
+
+    # Refuse to start twice; clear a stale socket left by a crash
+    if os.path.exists(args.socket):
+        if send_command(args.socket, "ping") is not None:
+            print(f"Hook daemon already running ({args.socket})")
+            sys.exit(0)
+        os.unlink(args.socket)
+
+    if args.detach:
+        command = [sys.executable, str(Path(__file__).resolve()),
+                   "--socket", args.socket, "--idle-timeout", str(args.idle_timeout)]
+        subprocess.Popen(command, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                         stderr=subprocess.DEVNULL, start_new_session=True)
+        sys.exit(0)
+
+    warm_hooks()
+    server = HookDaemon(args.socket, args.idle_timeout)
+
+    def _stop(signum, frame):
+        server.stopping = True
+
+    signal.signal(signal.SIGTERM, _stop)
+    signal.signal(signal.SIGINT, _stop)
+
+    try:
+        server.serve()
+    finally:
+        server.server_close()
+        try:
+            os.unlink(args.socket)
+        except FileNotFoundError:
+            pass
+
+    if server.restart:
+        # Re-execute to re-import the edited modules (children already
+        # forked finish on their own)
+        os.execv(sys.executable, [sys.executable, str(Path(__file__).resolve()),
+                                  "--socket", args.socket, "--idle-timeout", str(args.idle_timeout)])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+"""
+High-Entropy Token Detector
+Finds bare credential-like strings that no keyword pattern anchors on.
+
+Text is tokenised into runs of one charset (base64/URL-safe, or hex) and
+each run's Shannon entropy is computed from its character histogram. Random
+keys score near the charset maximum (6 bits for base64, 4 for hex) while
+words, identifiers and paths score well below it.
+
+Entropies are computed for all candidate tokens at once: with numpy, the
+tokens are concatenated into one byte array and a single bincount builds
+every token's histogram; without it, collections.Counter (C-accelerated)
+counts each token and a precomputed c*log2(c) table does the arithmetic. No
+per-character Python loop in either case.
+
+A token with D distinct characters has at most log2(D) bits of entropy, so
+tokens with fewer than 2**threshold distinct characters (nearly every word,
+identifier and path) are rejected with one len(set()) before any counting. Tokens inside
+URLs and data: URIs are skipped (document IDs in links and inline images look
+random but are not secrets), as are path-shaped tokens such as
+"src/components/UserProfileCard".
+"""
+
+import math
+import re
+from collections import Counter
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Customise: per-charset rules. Hex is off by default - git SHAs, UUIDs and
+# colour codes are everywhere in notes. max_length skips embedded data
+# (base64 images) that is high-entropy but not a credential.
+CHARSET_RULES = {
+    "base64": {"enabled": True, "threshold": 4.5, "min_length": 20, "max_length": 256},
+    "hex": {"enabled": False, "threshold": 3.0, "min_length": 32, "max_length": 256},
+}
+
+# Candidate runs: base64/URL-safe alphabet (hex is a subset)
+_TOKEN_CHARS = r"[A-Za-z0-9+/=_\-]"
+
+# Customise: token prefixes that mark known non-secret encodings
+# (Subresource Integrity / npm lockfile hashes, go.sum module hashes)
+IGNORE_PREFIXES = ("sha1-", "sha256-", "sha384-", "sha512-", "h1:")
+
+# Prefixes ending outside the token alphabet precede the token rather than
+# start it ("h1:" + hash)
+_PRECEDING_PREFIXES = tuple(prefix for prefix in IGNORE_PREFIXES
+                            if not re.fullmatch(f"{_TOKEN_CHARS}+", prefix))
+
+_HEX_RE = re.compile(r"[0-9a-fA-F]+")
+_URL_RE = re.compile(r"[A-Za-z][A-Za-z0-9+.\-]*://[^\s)\]>\"']+|\bdata:[^\s,]*,[^\s)\]>\"']+")
+
+# A path segment: a word in lower, Capitalised, camelCase or UPPER case, with
+# digits, "_" and "-". Random keys mix cases too freely to look like this.
+_PATH_SEGMENT_RE = re.compile(r"(?:[A-Z]?[a-z0-9_\-]+)+|[A-Z0-9_\-]+")
+
+# Tokens per numpy batch (bounds the tokens x 256 histogram matrix)
+_NUMPY_BATCH = 2048
+
+# Longest token a carried-over streaming fragment may grow to
+_MAX_CARRY = 4096
+
+
+def _charset(token: str) -> str:
+    return "hex" if _HEX_RE.fullmatch(token) else "base64"
+
+
+def _path_shaped(token: str) -> bool:
+    """Is the token a path like "docs/api/v2/UserGuide" rather than a key?"""
+    segments = [segment for segment in token.split("/") if segment]
+    return len(segments) > 1 and all(map(_PATH_SEGMENT_RE.fullmatch, segments))
+
+
+def _min_length(rule: dict) -> int:
+    """Shortest token that can reach the threshold (log2(L) >= threshold)."""
+    return max(rule["min_length"], math.ceil(2 ** rule["threshold"]))
+
+
+class EntropyDetector:
+    """Shannon-entropy check over candidate tokens, with per-charset rules."""
+
+    def __init__(self, rules: dict | None = None, use_numpy: bool | None = None):
+        self.rules = {name: dict(rule) for name, rule in (rules or CHARSET_RULES).items()
+                      if rule.get("enabled", True)}
+        self.use_numpy = np is not None if use_numpy is None else use_numpy and np is not None
+        self.min_length = min((_min_length(rule) for rule in self.rules.values()), default=0)
+        # Runs too short for any rule never leave the regex engine
+        self._token_re = re.compile(f"{_TOKEN_CHARS}{{{max(self.min_length, 1)},}}")
+        self._xlogx = [0.0]
+        self._min_distinct = {name: math.ceil(2 ** rule["threshold"])
+                              for name, rule in self.rules.items()}
+
+    def candidates(self, text: str) -> list[tuple[str, str]]:
+        """(charset, token) for runs that pass their charset's length limits."""
+        if not self.rules:
+            return []
+        # Document IDs in links (Google Docs, Confluence) and inline images
+        # look random
+        url_ends = {}
+        if "://" in text or "data:" in text:
+            url_ends = {m.start(): m.end() for m in _URL_RE.finditer(text)}
+        url_starts = sorted(url_ends)
+        next_url = 0
+        url_end = -1
+
+        found = []
+        for match in self._token_re.finditer(text):
+            token = match.group()
+            start = match.start()
+            if token.startswith(IGNORE_PREFIXES) or text.endswith(_PRECEDING_PREFIXES, 0, start):
+                continue
+            while next_url < len(url_starts) and url_starts[next_url] <= start:
+                url_end = max(url_end, url_ends[url_starts[next_url]])
+                next_url += 1
+            if start < url_end or ("/" in token and _path_shaped(token)):
+                continue
+            charset = _charset(token)
+            rule = self.rules.get(charset)
+            if rule and _min_length(rule) <= len(token) <= rule["max_length"]:
+                found.append((charset, token))
+        return found
+
+    def entropies(self, tokens: list[str]) -> list[float]:
+        """Shannon entropy (bits per character) of each token."""
+        if not tokens:
+            return []
+        if self.use_numpy:
+            return self._entropies_numpy(tokens)
+        return self._entropies_counter(tokens)
+
+    def _entropies_counter(self, tokens: list[str]) -> list[float]:
+        # H = log2(L) - sum(c * log2(c)) / L, with c*log2(c) from a table
+        longest = max(map(len, tokens))
+        xlogx = self._xlogx
+        if len(xlogx) <= longest:
+            xlogx.extend(c * math.log2(c) for c in range(len(xlogx), longest + 1))
+
+        result = []
+        for token in tokens:
+            length = len(token)
+            total = sum(xlogx[c] for c in Counter(token).values())
+            result.append(math.log2(length) - total / length)
+        return result
+
+    def _entropies_numpy(self, tokens: list[str]) -> list[float]:
+        result = []
+        for i in range(0, len(tokens), _NUMPY_BATCH):
+            batch = tokens[i:i + _NUMPY_BATCH]
+            lengths = np.fromiter(map(len, batch), dtype=np.int64, count=len(batch))
+            data = np.frombuffer("".join(batch).encode("ascii"), dtype=np.uint8)
+            owner = np.repeat(np.arange(len(batch), dtype=np.int64), lengths)
+
+            # One bincount builds every token's 256-bin histogram
+            counts = np.bincount(owner * 256 + data, minlength=len(batch) * 256)
+            counts = counts.reshape(len(batch), 256).astype(np.float64)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                xlogx = np.where(counts > 0, counts * np.log2(counts), 0.0)
+            result.extend((np.log2(lengths) - xlogx.sum(axis=1) / lengths).tolist())
+        return result
+
+    def findings(self, text: str, suppress=None) -> dict[str, int]:
+        """Charset -> number of tokens at or above its threshold.
+
+        suppress(charset, token) -> bool, if given, drops flagged tokens it
+        returns True for.
+        """
+        # Entropy is at most log2(distinct characters): a token with fewer
+        # than 2**threshold distinct characters (any word or identifier)
+        # fails without building a histogram
+        tokens = [(charset, token) for charset, token in self.candidates(text)
+                  if len(set(token)) >= self._min_distinct[charset]]
+        counts: dict[str, int] = {}
+        for (charset, token), entropy in zip(tokens, self.entropies([t for _, t in tokens])):
+            if entropy >= self.rules[charset]["threshold"]:
+                if suppress is None or not suppress(charset, token):
+                    counts[charset] = counts.get(charset, 0) + 1
+        return counts
+
+    def stream(self, suppress=None) -> "EntropyStream":
+        """Incremental findings() for text arriving in pieces."""
+        return EntropyStream(self, suppress)
+
+    def count_stream(self, chunks, stop_at_first: bool = False, suppress=None) -> dict[str, int]:
+        """findings() over text arriving in pieces."""
+        stream = self.stream(suppress)
+        for piece in chunks:
+            stream.feed(piece)
+            if stop_at_first and stream.counts:
+                break
+        return stream.finish()
+
+
+class EntropyStream:
+    """Feeds pieces of text to a detector.
+
+    A run touching the end of a piece is carried into the next one, so
+    tokens split across chunk boundaries are still seen whole.
+    """
+
+    def __init__(self, detector: EntropyDetector, suppress=None):
+        self.detector = detector
+        self.suppress = suppress
+        self.carry = ""
+        self.counts: dict[str, int] = {}
+
+    def _add(self, text: str) -> None:
+        for charset, count in self.detector.findings(text, self.suppress).items():
+            self.counts[charset] = self.counts.get(charset, 0) + count
+
+    def feed(self, piece: str) -> None:
+        text = self.carry + piece
+
+        # Hold back the trailing word, which may continue in the next piece
+        cut = len(text)
+        while cut > 0 and len(text) - cut < _MAX_CARRY and not text[cut - 1].isspace():
+            cut -= 1
+        if len(text) - cut >= _MAX_CARRY:
+            cut = len(text)
+
+        self._add(text[:cut])
+        self.carry = text[cut:]
+
+    def finish(self) -> dict[str, int]:
+        if self.carry:
+            self._add(self.carry)
+            self.carry = ""
+        return self.counts
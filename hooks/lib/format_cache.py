@@ -0,0 +1,122 @@
+"""
+Format Clean Cache
+Remembers files that are already formatted, so code-formatter.py can skip
+them without starting the formatter.
+
+After a file is formatted, its content hash is stored under the key
+(path, formatter, formatter version). On the next edit the formatter only
+runs if the file's hash differs from the stored one. Upgrading the formatter
+changes its version, so every file is formatted again.
+
+The entries live in ~/.cache/claude-hooks/format-clean.json. They are kept in
+least-recently-used order and trimmed to MAX_ENTRIES. That file is only
+rewritten when a file was formatted; a lookup that hits just reorders the
+entries in memory. The running hit and miss counts for
+`code-formatter.py --stats` go to the small format-clean-stats.json instead.
+"""
+
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from pathlib import Path
+
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "claude-hooks"
+CLEAN_CACHE = CACHE_DIR / "format-clean.json"
+CLEAN_CACHE_STATS = CACHE_DIR / "format-clean-stats.json"
+
+# Entries kept (one per formatted file); the least recently used go first
+MAX_ENTRIES = 2048
+
+
+def content_hash(path: Path) -> str | None:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+class CleanCache:
+    """(path, formatter, version) -> hash of the formatted content, in LRU order."""
+
+    def __init__(self, path: Path = CLEAN_CACHE, max_entries: int = MAX_ENTRIES,
+                 stats_path: Path = CLEAN_CACHE_STATS):
+        self.path = path
+        self.stats_path = stats_path
+        self.max_entries = max_entries
+        self.entries: OrderedDict[str, str] = OrderedDict()
+        self.hits = self.misses = 0  # This process's lookups, not yet saved
+        self.dirty = False
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            self.entries = OrderedDict(data["entries"])
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+    @staticmethod
+    def key(file_path: Path, formatter: str, version: str) -> str:
+        return f"{formatter}\0{version}\0{file_path.resolve()}"
+
+    def is_clean(self, file_path: Path, digest: str, formatter: str, version: str) -> bool:
+        """Is this content known to be formatted? Counts a hit or a miss."""
+        key = self.key(file_path, formatter, version)
+        if self.entries.get(key) == digest:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return True
+        self.misses += 1
+        return False
+
+    def mark_clean(self, file_path: Path, formatter: str, version: str) -> None:
+        """Record the file's current content as formatted."""
+        digest = content_hash(file_path)
+        if digest is None:
+            return
+        key = self.key(file_path, formatter, version)
+        self.entries[key] = digest
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        self.dirty = True
+
+    def _saved_counts(self) -> tuple[int, int]:
+        try:
+            data = json.loads(self.stats_path.read_text(encoding="utf-8"))
+            return int(data["hits"]), int(data["misses"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return 0, 0
+
+    def stats(self) -> dict:
+        hits, misses = self._saved_counts()
+        hits += self.hits
+        misses += self.misses
+        lookups = hits + misses
+        return {
+            "entries": len(self.entries),
+            "max_entries": self.max_entries,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+        }
+
+    def save(self) -> None:
+        """Add this process's counts to the stats file, and write the
+        entries if a file was marked clean."""
+        if self.hits or self.misses:
+            hits, misses = self._saved_counts()
+            counts = {"hits": hits + self.hits, "misses": misses + self.misses}
+            if _atomic_write(self.stats_path, json.dumps(counts)):
+                self.hits = self.misses = 0
+        if self.dirty and _atomic_write(self.path, json.dumps({"entries": self.entries})):
+            self.dirty = False
+
+
+def _atomic_write(path: Path, text: str) -> bool:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(text, encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        return False
+    return True
@@ -0,0 +1,248 @@
+"""
+Formatter Backends
+Fast ways to run a formatter on one file, for code-formatter.py.
+
+Spawning `npx prettier` resolves the package before formatting anything and
+routinely takes over a second; `black` as a subprocess pays interpreter
+startup and black's own import. The backends here avoid that:
+
+  black-api       black's Python API in this process (instant when the hook
+                  runs in the hook daemon, where black stays imported)
+  prettierd       the prettierd client, which hands the file to a running
+                  prettier server instead of starting prettier
+  prettier-local  node_modules/.bin/prettier found next to the file, without
+                  npx's package resolution
+
+Each backend's format() returns a FormatResult, or None when it cannot run
+here (not installed, server down, incompatible version), in which case the
+caller tries the next backend and finally the plain command. FormatError
+means the formatter ran and rejected the file (a syntax error), which no
+other backend would fix.
+
+run_batch() runs one formatter command over many files, for queue mode.
+
+version() identifies the formatter that would run without starting it (a
+package version, or the executable's path and mtime), so format_cache.py
+can tell when an upgrade makes earlier results stale. It returns None when
+the backend is not available.
+"""
+
+import json
+import os
+import shutil
+import subprocess
+from pathlib import Path
+from typing import NamedTuple
+
+# Seconds a formatter subprocess may take (the hook times out at 10s)
+FORMAT_TIMEOUT = 8
+
+
+class FormatResult(NamedTuple):
+    changed: bool
+    backend: str
+
+
+class FormatError(Exception):
+    """The formatter rejected the file."""
+
+
+class BlackAPIBackend:
+    """black.format_file_in_place(), honouring the nearest pyproject.toml."""
+
+    name = "black"
+
+    def __init__(self):
+        self._modes: dict[str, object] = {}
+
+    def _mode(self, black, path: Path):
+        pyproject = black.find_pyproject_toml((str(path.parent),))
+        key = f"{pyproject}:{path.suffix}"
+        if key not in self._modes:
+            config = black.parse_pyproject_toml(pyproject) if pyproject else {}
+            self._modes[key] = black.Mode(
+                target_versions={black.TargetVersion[v.upper()] for v in config.get("target_version", [])},
+                line_length=config.get("line_length", black.DEFAULT_LINE_LENGTH),
+                string_normalization=not config.get("skip_string_normalization", False),
+                magic_trailing_comma=not config.get("skip_magic_trailing_comma", False),
+                preview=config.get("preview", False),
+                is_pyi=path.suffix == ".pyi",
+            )
+        return self._modes[key]
+
+    def version(self, path: Path) -> str | None:
+        try:
+            from importlib.metadata import PackageNotFoundError, version
+        except ImportError:
+            return None
+        try:
+            return version("black")
+        except PackageNotFoundError:
+            return None
+
+    def format(self, path: Path) -> FormatResult | None:
+        try:
+            import black
+        except ImportError:
+            return None
+        try:
+            mode = self._mode(black, path)
+        except Exception:
+            return None  # Unfamiliar black version or config - use the command
+        try:
+            changed = black.format_file_in_place(path, fast=False, mode=mode,
+                                                 write_back=black.WriteBack.YES)
+        except Exception as exc:
+            raise FormatError(str(exc)) from exc
+        return FormatResult(changed, self.name)
+
+
+class PrettierdBackend:
+    """Formats via prettierd: content on stdin, formatted text on stdout."""
+
+    name = "prettierd"
+
+    def version(self, path: Path) -> str | None:
+        return executable_stamp("prettierd")
+
+    def format(self, path: Path) -> FormatResult | None:
+        executable = shutil.which("prettierd")
+        if executable is None:
+            return None
+        try:
+            original = path.read_text(encoding="utf-8")
+            # Absolute: a relative path would be resolved against cwd=path.parent
+            result = subprocess.run([executable, str(path.resolve())], input=original,
+                                    capture_output=True, text=True, timeout=FORMAT_TIMEOUT,
+                                    cwd=path.parent)
+        except (OSError, UnicodeDecodeError, subprocess.TimeoutExpired):
+            return None
+        if result.returncode != 0:
+            raise FormatError(result.stderr or result.stdout)
+        if not result.stdout:
+            return None
+        if result.stdout == original:
+            return FormatResult(False, self.name)
+        path.write_text(result.stdout, encoding="utf-8")
+        return FormatResult(True, self.name)
+
+
+class LocalPrettierBackend:
+    """The project's own node_modules/.bin/prettier, skipping npx."""
+
+    name = "prettier"
+
+    def find(self, path: Path) -> Path | None:
+        for parent in path.resolve().parents:
+            candidate = parent / "node_modules" / ".bin" / "prettier"
+            if candidate.is_file():
+                return candidate
+        return None
+
+    def version(self, path: Path) -> str | None:
+        executable = self.find(path)
+        if executable is None:
+            return None
+        return package_version(executable.parent.parent / "prettier") or executable_stamp(str(executable))
+
+    def format(self, path: Path) -> FormatResult | None:
+        executable = self.find(path)
+        if executable is None:
+            return None
+        return run_command([str(executable), "--write"], path, self.name)
+
+
+def executable_stamp(name: str) -> str | None:
+    """Resolved executable path and mtime, which change when it is upgraded."""
+    executable = shutil.which(name)
+    if executable is None:
+        return None
+    real = os.path.realpath(executable)
+    try:
+        return f"{real}@{os.stat(real).st_mtime_ns}"
+    except OSError:
+        return None
+
+
+def package_version(package_dir: Path) -> str | None:
+    try:
+        return json.loads((package_dir / "package.json").read_text(encoding="utf-8"))["version"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def command_version(command: list[str], path: Path) -> str | None:
+    """version() for a plain formatter command. For `npx <package>` this is
+    the package's version in the nearest node_modules, if installed there."""
+    if command[0] == "npx" and len(command) > 1:
+        for parent in path.resolve().parents:
+            found = package_version(parent / "node_modules" / command[1])
+            if found is not None:
+                return found
+        stamp = executable_stamp("npx")
+        return stamp and f"{command[1]}:{stamp}"
+    return executable_stamp(command[0])
+
+
+def run_command(command: list[str], path: Path, name: str | None = None) -> FormatResult | None:
+    """Run a formatter command on path. None if it is not installed."""
+    try:
+        before = path.stat().st_mtime_ns
+        result = subprocess.run(command + [str(path)], capture_output=True, text=True,
+                                timeout=FORMAT_TIMEOUT)
+    except FileNotFoundError:
+        return None
+    except subprocess.TimeoutExpired as exc:
+        raise FormatError("timed out") from exc
+    if result.returncode != 0:
+        raise FormatError(result.stderr)
+    changed = path.stat().st_mtime_ns != before
+    return FormatResult(changed, name or command[0])
+
+
+class CommandBackend:
+    """A plain formatter command, such as code-formatter.py's FORMATTERS."""
+
+    def __init__(self, command: list[str]):
+        self.command = command
+        self.name = Path(command[0]).name
+
+    def version(self, path: Path) -> str | None:
+        return command_version(self.command, path)
+
+    def format(self, path: Path) -> FormatResult | None:
+        return run_command(self.command, path, self.name)
+
+
+# Backends available to code-formatter.py's FAST_BACKENDS, by name
+BACKENDS = {
+    "black-api": BlackAPIBackend(),
+    "prettierd": PrettierdBackend(),
+    "prettier-local": LocalPrettierBackend(),
+}
+
+
+def run_batch(command: list[str], paths: list[Path], timeout: float) -> tuple[int, str] | None:
+    """Run one formatter command over many files.
+
+    Returns (files changed, error output), or None if it is not installed.
+    Formatters keep going past a file they reject, so a failure still
+    leaves the other files formatted.
+    """
+    def mtime(path: Path) -> int:
+        try:
+            return path.stat().st_mtime_ns
+        except OSError:
+            return 0
+
+    before = [mtime(path) for path in paths]
+    try:
+        result = subprocess.run(command + [str(path) for path in paths], capture_output=True,
+                                text=True, timeout=timeout)
+        errors = result.stderr if result.returncode != 0 else ""
+    except FileNotFoundError:
+        return None
+    except subprocess.TimeoutExpired:
+        errors = "timed out"
+    changed = sum(1 for path, stamp in zip(paths, before) if mtime(path) != stamp)
+    return changed, errors
@@ -0,0 +1,237 @@
+"""
+Note Frontmatter
+The one frontmatter parser shared by the quality hooks and validators.
+
+parse_frontmatter() walks the note line by line once, stopping at the
+closing `---`. It uses plain string operations, with no regex per line, and
+the body after the header is never split or copied. The result is a
+Frontmatter object:
+
+  data    top-level keys -> str, or list[str] for `[a, b]` inline lists and
+          `- item` block lists (None if the note has no closed header)
+  errors  why there is no data ("No frontmatter found ...")
+  raw     the header text between the `---` lines (for a full YAML loader)
+
+plus .note_type and .tags properties for the checks that only need those.
+Values stay strings, as the validators compare them against string enums.
+
+read_frontmatter() reads a file only up to the closing `---`, a line at a
+time, and never more than MAX_HEADER_BYTES. A multi-megabyte transcript
+costs the same as a short note, and a header that does not close within the
+cap is reported as "Frontmatter too large" instead of being read in full.
+
+Batch tools that read the same notes run after run keep their own caches
+of what they derive from the header (frontmatter_index.py,
+audit_frontmatter.py). The per-edit hooks parse directly: the note they
+check was just written, and a capped header parse (~45us) is cheaper than
+an SQLite hit (~400us).
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+
+# Bump when parsing changes, so cached results are discarded
+PARSER_VERSION = 1
+
+# Customise: most bytes read looking for the closing --- (larger headers are
+# reported as too large; changing this clears the caches)
+MAX_HEADER_BYTES = 64 * 1024
+
+NO_FRONTMATTER = "No frontmatter found (file should start with ---)"
+NOT_CLOSED = "Frontmatter not closed (missing closing ---)"
+TOO_LARGE = "Frontmatter too large (no closing --- within the first {limit} KB)"
+
+_QUOTES = "\"'"
+
+_SCALAR, _BLOCK_LIST, _INLINE_LIST = range(3)
+
+
+class HeaderTooLarge(Exception):
+    """The header did not close within MAX_HEADER_BYTES."""
+
+
+@dataclass
+class Frontmatter:
+    """A note's parsed header."""
+    data: dict | None
+    errors: list[str] = field(default_factory=list)
+    raw: str = ""
+
+    @property
+    def note_type(self) -> str:
+        """The `type` value up to its first non-word character ("" if none)."""
+        value = (self.data or {}).get("type", "")
+        if not isinstance(value, str):
+            return ""
+        end = 0
+        while end < len(value) and (value[end].isalnum() or value[end] == "_"):
+            end += 1
+        return value[:end]
+
+    @property
+    def tags(self) -> list[str]:
+        """The tags list (a scalar `tags: x` is not a list and gives [])."""
+        tags = (self.data or {}).get("tags")
+        return tags if isinstance(tags, list) else []
+
+
+def _is_key(key: str) -> bool:
+    """Top-level keys are ASCII letters, '-' and '_' (as in `title`, `adr-type`)."""
+    return key.isascii() and key.replace("-", "a").replace("_", "a").isalpha()
+
+
+def _split_inline(text: str) -> list[str]:
+    items = []
+    for item in text.split(","):
+        item = item.strip().strip(_QUOTES)
+        if item:
+            items.append(item)
+    return items
+
+
+def parse_lines(lines) -> Frontmatter:
+    """Parse a header from an iterable of lines, each ending in its newline.
+
+    Stops at the closing `---`, so the note body is never consumed.
+    """
+    lines = iter(lines)
+    first = next(lines, "")
+    if not first.startswith("---"):
+        return Frontmatter(None, [NO_FRONTMATTER])
+
+    data = {}
+    raw = []
+    key = None
+    mode = _SCALAR
+    values = []
+    inline = []
+    closed = False
+
+    for line in lines:
+        if line.endswith("\n"):
+            line = line[:-1]
+            if line.rstrip() == "---":
+                closed = True
+                break
+        raw.append(line)
+
+        stripped = line.strip()
+        if not stripped or stripped[0] == "#":
+            continue
+
+        if line[0] not in " \t":
+            colon = line.find(":")
+            if colon > 0 and _is_key(line[:colon]):
+                if key is not None:
+                    data[key] = _finish(mode, values, inline)
+                key = line[:colon]
+                value = line[colon + 1:].strip()
+                values = []
+                inline = []
+                if value.startswith("["):
+                    if value.endswith("]"):
+                        data[key] = _split_inline(value[1:-1])
+                        key = None
+                    else:
+                        mode = _INLINE_LIST
+                        inline.append(value[1:])
+                else:
+                    mode = _SCALAR
+                    value = value.strip(_QUOTES)
+                    if value:
+                        values.append(value)
+                continue
+
+        if key is None:
+            continue
+        if mode == _INLINE_LIST:
+            if stripped[0] == "-":
+                values.append(stripped[1:].strip().strip(_QUOTES))
+            elif stripped.endswith("]"):
+                inline.append(stripped[:-1])
+                data[key] = _finish(mode, values, inline)
+                key = None
+            else:
+                inline.append(stripped)
+        elif (stripped == "-" or stripped.startswith("- ")) and (mode == _BLOCK_LIST or not values):
+            mode = _BLOCK_LIST
+            item = stripped[1:].strip().strip(_QUOTES)
+            if item:
+                values.append(item)
+        elif mode == _SCALAR and line[0] in " \t":
+            values.append(stripped)  # Continuation: only the first line is kept
+
+    if not closed:
+        return Frontmatter(None, [NOT_CLOSED])
+    if key is not None:
+        data[key] = _finish(mode, values, inline)
+    return Frontmatter(data, [], "\n".join(raw))
+
+
+def _finish(mode: int, values: list[str], inline: list[str]):
+    if mode == _SCALAR:
+        return values[0] if values else ""
+    if mode == _INLINE_LIST:
+        return _split_inline(",".join(inline)) + [v for v in values if v]
+    return values
+
+
+def parse_frontmatter(content: str) -> Frontmatter:
+    """Parse the header of a note's full text (capped at MAX_HEADER_BYTES
+    characters, like read_frontmatter())."""
+    if not content.startswith("---"):
+        return Frontmatter(None, [NO_FRONTMATTER])
+    try:
+        return parse_lines(_iter_lines(content, MAX_HEADER_BYTES))
+    except HeaderTooLarge:
+        return too_large()
+
+
+def too_large() -> Frontmatter:
+    return Frontmatter(None, [TOO_LARGE.format(limit=MAX_HEADER_BYTES // 1024)])
+
+
+def _iter_lines(content: str, limit: int):
+    """Lines of content with their newlines, found with str.find."""
+    start = 0
+    while True:
+        if start > limit:
+            raise HeaderTooLarge
+        end = content.find("\n", start, limit + 1)
+        if end < 0:
+            if len(content) > limit + 1:
+                raise HeaderTooLarge
+            if start < len(content):
+                yield content[start:]
+            return
+        yield content[start:end + 1]
+        start = end + 1
+
+
+def _read_lines(f, limit: int):
+    """Lines of a binary file, decoded, reading at most limit bytes."""
+    remaining = limit
+    while True:
+        line = f.readline(remaining + 1)
+        if not line:
+            return
+        remaining -= len(line)
+        if remaining < 0:
+            raise HeaderTooLarge
+        yield line.decode("utf-8")
+
+
+def read_frontmatter(file_path: str | Path) -> Frontmatter | None:
+    """Parse a note's header. Returns None if the file cannot be read."""
+    try:
+        with open(file_path, "rb") as f:
+            if f.read(3) == b"---":
+                f.seek(0)
+                frontmatter = parse_lines(_read_lines(f, MAX_HEADER_BYTES))
+            else:
+                frontmatter = Frontmatter(None, [NO_FRONTMATTER])
+    except HeaderTooLarge:
+        frontmatter = too_large()
+    except (OSError, UnicodeDecodeError):
+        return None
+    return frontmatter
@@ -0,0 +1,271 @@
+"""
+Vault Frontmatter Index
+Queryable SQLite index of every note's frontmatter, for Dataview-style
+lookups ("active projects", "meetings since March") without parsing the
+whole vault.
+
+The index lives at .claude/cache/frontmatter-index.sqlite:
+
+  notes   one row per note: path, type, status, date, priority, title
+          (date is the note's `date`, else `created`, when it is YYYY-MM-DD)
+  fields  every top-level field as (path, key, value, item) rows, one per
+          list item, so `tags`, `project` or `attendees` are queryable too
+          (item is the position in a list, NULL for a scalar)
+
+Build it once with hooks/batch/frontmatter_index.py build. After that,
+refresh() reparses only notes whose size or mtime changed, and
+frontmatter-validator.py (or quality-dispatcher.py) records each edited note
+as it goes. Until the index is built, recording is a no-op, so vaults that
+never query it pay nothing.
+"""
+
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import NamedTuple
+
+from frontmatter import read_frontmatter
+
+# Where the index lives, relative to the vault root
+INDEX_PATH = Path(".claude") / "cache" / "frontmatter-index.sqlite"
+
+INDEX_VERSION = 2
+
+# Notes changed this recently are reparsed on the next refresh
+RACY_WINDOW_NS = 2_000_000_000
+
+_UNVERIFIED = -1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS notes (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime INTEGER NOT NULL,
+    type TEXT,
+    status TEXT,
+    date TEXT,
+    priority TEXT,
+    title TEXT
+);
+CREATE TABLE IF NOT EXISTS fields (
+    path TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    item INTEGER
+);
+CREATE INDEX IF NOT EXISTS notes_by_type ON notes (type, date);
+CREATE INDEX IF NOT EXISTS notes_by_status ON notes (status);
+CREATE INDEX IF NOT EXISTS notes_by_date ON notes (date);
+CREATE INDEX IF NOT EXISTS fields_by_path ON fields (path);
+CREATE INDEX IF NOT EXISTS fields_by_key ON fields (key, value);
+"""
+
+
+class NoteRow(NamedTuple):
+    path: str
+    type: str | None
+    status: str | None
+    date: str | None
+    priority: str | None
+    title: str | None
+
+
+def _iso_date(value) -> str | None:
+    """value if it is a YYYY-MM-DD date string, else None."""
+    if (isinstance(value, str) and len(value) == 10 and value[4] == "-" and value[7] == "-"
+            and value[:4].isdigit() and value[5:7].isdigit() and value[8:].isdigit()):
+        return value
+    return None
+
+
+def _text(value) -> str | None:
+    return value if isinstance(value, str) and value else None
+
+
+def note_columns(data: dict) -> tuple:
+    """The typed columns (type, status, date, priority, title) of a note."""
+    return (
+        _text(data.get("type")),
+        _text(data.get("status")),
+        _iso_date(data.get("date")) or _iso_date(data.get("created")),
+        _text(data.get("priority")),
+        _text(data.get("title")),
+    )
+
+
+def field_rows(rel_path: str, data: dict) -> list[tuple[str, str, str, int | None]]:
+    rows = []
+    for key, value in data.items():
+        if isinstance(value, list):
+            rows.extend((rel_path, key, str(item), i) for i, item in enumerate(value)
+                        if item not in (None, ""))
+        elif value not in (None, ""):
+            rows.append((rel_path, key, str(value), None))
+    return rows
+
+
+class FrontmatterIndex:
+    """Note frontmatter by path, refreshed incrementally by size and mtime."""
+
+    def __init__(self, vault_root: Path, db_path: str | Path | None = None):
+        self.vault_root = Path(vault_root)
+        self.db_path = str(db_path or self.vault_root / INDEX_PATH)
+        self.conn = None
+
+    def exists(self) -> bool:
+        return self.db_path == ":memory:" or Path(self.db_path).exists()
+
+    def open(self) -> "FrontmatterIndex":
+        if self.db_path != ":memory:":
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.db_path, timeout=5)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(_SCHEMA)
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        if row is None or row[0] != str(INDEX_VERSION):
+            # Recreate the tables: the columns may have changed
+            self.conn.executescript("DROP TABLE notes; DROP TABLE fields;" + _SCHEMA)
+            with self.conn:
+                self.conn.execute("INSERT OR REPLACE INTO meta VALUES ('version', ?)",
+                                  (str(INDEX_VERSION),))
+        return self
+
+    def close(self) -> None:
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+    def _store(self, rel_path: str, size: int, mtime: int, data: dict | None) -> None:
+        data = data or {}
+        self.conn.execute("INSERT OR REPLACE INTO notes VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                          (rel_path, size, mtime) + note_columns(data))
+        self.conn.execute("DELETE FROM fields WHERE path = ?", (rel_path,))
+        self.conn.executemany("INSERT INTO fields VALUES (?, ?, ?, ?)", field_rows(rel_path, data))
+
+    def _remove(self, rel_path: str) -> None:
+        self.conn.execute("DELETE FROM notes WHERE path = ?", (rel_path,))
+        self.conn.execute("DELETE FROM fields WHERE path = ?", (rel_path,))
+
+    def update_note(self, rel_path: str, data: dict | None) -> None:
+        """Record one note's current frontmatter (after an edit)."""
+        try:
+            st = os.stat(self.vault_root / rel_path)
+        except OSError:
+            with self.conn:
+                self._remove(rel_path)
+            return
+        with self.conn:
+            # Just written, so its mtime is racy: the next refresh reparses it
+            self._store(rel_path, st.st_size, _UNVERIFIED, data)
+
+    def refresh(self, note_paths) -> tuple[int, int]:
+        """Bring the index up to date with these notes (vault-relative paths).
+
+        Reparses only notes whose size or mtime changed and drops notes that
+        are gone. Returns (notes reparsed, notes removed).
+        """
+        now = time.time_ns()
+        known = {path: (size, mtime) for path, size, mtime
+                 in self.conn.execute("SELECT path, size, mtime FROM notes")}
+        seen = set()
+        parsed = 0
+        with self.conn:
+            for rel_path in note_paths:
+                abs_path = self.vault_root / rel_path
+                try:
+                    st = os.stat(abs_path)
+                except OSError:
+                    continue
+                seen.add(rel_path)
+                if known.get(rel_path) == (st.st_size, st.st_mtime_ns):
+                    continue
+                header = read_frontmatter(abs_path)
+                mtime = _UNVERIFIED if now - st.st_mtime_ns < RACY_WINDOW_NS else st.st_mtime_ns
+                self._store(rel_path, st.st_size, mtime, header.data if header else None)
+                parsed += 1
+            removed = set(known) - seen
+            for rel_path in removed:
+                self._remove(rel_path)
+        return parsed, len(removed)
+
+    def query(self, note_type: str | None = None, status: str | None = None,
+              priority: str | None = None, since: str | None = None, until: str | None = None,
+              fields: dict[str, str] | None = None, scope: str | None = None,
+              limit: int | None = None) -> list[NoteRow]:
+        """Notes matching every given filter, newest date first.
+
+        since/until bound the date column (inclusive, YYYY-MM-DD). fields
+        matches any frontmatter key: {"project": "Alpha", "tags": "domain/data"}
+        (a list field matches if any item equals the value).
+        """
+        clauses = []
+        params = []
+        for column, value in (("type", note_type), ("status", status), ("priority", priority)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if since is not None:
+            clauses.append("date >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("date <= ?")
+            params.append(until)
+        if scope:
+            clauses.append("substr(path, 1, ?) = ?")
+            prefix = scope.strip("/") + "/"
+            params.extend([len(prefix), prefix])
+        for key, value in (fields or {}).items():
+            clauses.append("path IN (SELECT path FROM fields WHERE key = ? AND value = ?)")
+            params.extend([key, value])
+
+        sql = "SELECT path, type, status, date, priority, title FROM notes"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY date IS NULL, date DESC, path"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [NoteRow(*row) for row in self.conn.execute(sql, params)]
+
+    def fields(self, rel_path: str) -> dict:
+        """All indexed fields of one note (list fields as lists, even with
+        one item; empty values and lists are not indexed)."""
+        data: dict = {}
+        for key, value, item in self.conn.execute(
+                "SELECT key, value, item FROM fields WHERE path = ? ORDER BY rowid", (rel_path,)):
+            if item is None:
+                data[key] = value
+            else:
+                data.setdefault(key, []).append(value)
+        return data
+
+    def counts(self, column: str = "type") -> dict[str, int]:
+        """Notes per type, status or priority."""
+        if column not in ("type", "status", "priority"):
+            raise ValueError(f"Not a countable column: {column}")
+        return {value or "": count for value, count in self.conn.execute(
+            f"SELECT {column}, COUNT(*) FROM notes GROUP BY {column} ORDER BY COUNT(*) DESC")}
+
+
+def record_note_frontmatter(vault_root: Path, file_path: str, data: dict | None) -> None:
+    """Update the frontmatter index with an edited note (if built)."""
+    index = FrontmatterIndex(vault_root)
+    if not index.exists():
+        return
+    try:
+        rel_path = Path(file_path).resolve().relative_to(Path(vault_root).resolve()).as_posix()
+    except ValueError:
+        return
+    try:
+        index.open().update_note(rel_path, data)
+    except sqlite3.Error:
+        pass  # Index updates are best-effort; the next refresh catches up
+    finally:
+        index.close()
+
+
+def load_frontmatter_index(vault_root: Path) -> FrontmatterIndex:
+    """Open the frontmatter index for a vault (refresh it before querying)."""
+    return FrontmatterIndex(vault_root).open()
@@ -0,0 +1,187 @@
+"""
+Hook Runner
+Runs hook scripts in the current interpreter instead of a fresh process.
+
+Shared by the hook daemon (hooks/daemon/hook-daemon.py) and its client shim,
+which falls back to running the hook in-process when no daemon is listening.
+
+Hooks are executed exactly as `python3 hooks/<category>/<hook>.py` would run
+them: fresh globals with __name__ == "__main__", stdin/stdout/stderr swapped
+for in-memory buffers, sys.argv and the working directory set for the call,
+and SystemExit translated into an exit code. Only the compiled code object is
+reused between calls, so module-level state never leaks from one run to the
+next. Hook scripts are recompiled when they change; imported hooks/lib
+modules are not reloaded (see loaded_module_mtimes(), which the daemon uses
+to notice and restart).
+"""
+
+import builtins
+import contextlib
+import importlib.util
+import io
+import os
+import subprocess
+import sys
+import traceback
+from pathlib import Path
+from typing import NamedTuple
+
+# Root of the hooks tree (hooks/lib/.. -> hooks/)
+HOOKS_DIR = Path(__file__).resolve().parent.parent
+
+# Compiled hook code, keyed by path -> (mtime_ns, code object)
+_code_cache: dict[Path, tuple[int, object]] = {}
+
+
+class HookResult(NamedTuple):
+    stdout: str
+    stderr: str
+    exit_code: int
+
+
+def resolve_hook(name: str) -> Path:
+    """Resolve a hook name like 'quality/wiki-link-checker.py' to its path.
+
+    Raises ValueError for anything outside the hooks tree or not a .py file.
+    """
+    path = (HOOKS_DIR / name).resolve()
+    if path.suffix != ".py" or HOOKS_DIR not in path.parents:
+        raise ValueError(f"Not a hook script: {name}")
+    if not path.is_file():
+        raise ValueError(f"Hook not found: {name}")
+    return path
+
+
+def load_hook_module(name: str):
+    """Import a hook script as a module (hook files use hyphens, so plain
+    `import` cannot reach them). Modules are cached in sys.modules."""
+    path = resolve_hook(name)
+    module_name = "hook_" + path.stem.replace("-", "_")
+
+    module = sys.modules.get(module_name)
+    if module is not None and getattr(module, "__file__", None) == str(path):
+        return module
+
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        sys.modules.pop(module_name, None)
+        raise
+    return module
+
+
+
+
+def _get_code(path: Path):
+    """Compile a hook script once, recompiling only when it changes on disk."""
+    mtime = path.stat().st_mtime_ns
+    cached = _code_cache.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    source = path.read_text(encoding="utf-8")
+    code = compile(source, str(path), "exec")
+    _code_cache[path] = (mtime, code)
+    return code
+
+
+def _exit_code(exc: SystemExit, stderr: io.StringIO) -> int:
+    """Mirror the interpreter's handling of sys.exit() arguments."""
+    code = exc.code
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    print(code, file=stderr)
+    return 1
+
+
+def run_hook(name: str, raw_input: str, argv: list[str] | None = None,
+             cwd: str | None = None, env: dict[str, str] | None = None) -> HookResult:
+    """Run a hook script in-process and capture its output and exit code."""
+    path = resolve_hook(name)
+    code = _get_code(path)
+
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    namespace = {
+        "__name__": "__main__",
+        "__file__": str(path),
+        "__builtins__": builtins,
+    }
+
+    saved_argv = sys.argv
+    saved_stdin = sys.stdin
+    saved_path = list(sys.path)
+    saved_cwd = os.getcwd()
+    saved_env = dict(os.environ) if env is not None else None
+
+    exit_code = 0
+    try:
+        sys.argv = [str(path)] + list(argv or [])
+        sys.stdin = io.StringIO(raw_input)
+        # Same as running the script directly: its directory comes first
+        sys.path.insert(0, str(path.parent))
+        if cwd:
+            os.chdir(cwd)
+        if env is not None:
+            os.environ.clear()
+            os.environ.update(env)
+
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                exec(code, namespace)
+            except SystemExit as exc:
+                exit_code = _exit_code(exc, stderr)
+            except Exception:
+                traceback.print_exc(file=stderr)
+                exit_code = 1
+    finally:
+        sys.argv = saved_argv
+        sys.stdin = saved_stdin
+        sys.path[:] = saved_path
+        os.chdir(saved_cwd)
+        if saved_env is not None:
+            os.environ.clear()
+            os.environ.update(saved_env)
+
+    return HookResult(stdout.getvalue(), stderr.getvalue(), exit_code)
+
+
+def warm_hook(name: str) -> HookResult:
+    """Run a hook once with an empty payload, so its code is compiled and its
+    imports are loaded before the first real call (every hook exits at its
+    startup guard on empty input)."""
+    return run_hook(name, "")
+
+
+def loaded_module_mtimes() -> dict[str, int]:
+    """mtime_ns of every imported module that lives in the hooks tree
+    (hooks/lib and friends), to detect edits the running process misses."""
+    mtimes = {}
+    root = str(HOOKS_DIR)
+    for module in list(sys.modules.values()):
+        filename = getattr(module, "__file__", None)
+        if filename and filename.startswith(root):
+            try:
+                mtimes[filename] = os.stat(filename).st_mtime_ns
+            except OSError:
+                mtimes[filename] = 0
+    return mtimes
+
+
+def run_hook_process(name: str, raw_input: str, argv: list[str] | None = None,
+                     cwd: str | None = None, env: dict[str, str] | None = None,
+                     timeout: float | None = None) -> HookResult:
+    """Run a hook in a fresh interpreter, as settings.json would."""
+    path = resolve_hook(name)
+    try:
+        result = subprocess.run([sys.executable, str(path)] + list(argv or []),
+                                input=raw_input, capture_output=True, text=True,
+                                cwd=cwd or None, env=env, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return HookResult("", f"hook timed out: {name}\n", 1)
+    return HookResult(result.stdout, result.stderr, result.returncode)
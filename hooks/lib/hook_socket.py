@@ -0,0 +1,30 @@
+"""
+Hook Daemon Socket
+Locates the Unix socket shared by the hook daemon and its client shim.
+
+Kept separate from hook_runner.py so the client can find the daemon without
+paying for any imports beyond os and zlib.
+"""
+
+import os
+import zlib
+
+# Customise: override the daemon socket location
+SOCKET_ENV_VAR = "CLAUDE_HOOK_DAEMON_SOCKET"
+
+# Root of the hooks tree (hooks/lib/.. -> hooks/)
+HOOKS_DIR = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+
+def default_socket_path() -> str:
+    """Socket path for this hooks tree (one daemon per user per hooks dir)."""
+    override = os.environ.get(SOCKET_ENV_VAR)
+    if override:
+        return override
+
+    # Unix socket paths are limited to ~104 bytes, so use a short checksum of
+    # the hooks directory rather than embedding the path itself
+    digest = format(zlib.crc32(HOOKS_DIR.encode("utf-8")), "08x")
+    uid = os.getuid() if hasattr(os, "getuid") else 0
+    tmp_dir = os.environ.get("TMPDIR") or "/tmp"
+    return os.path.join(tmp_dir, f"claude-hooks-{uid}-{digest}.sock")
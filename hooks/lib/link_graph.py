@@ -0,0 +1,346 @@
+"""
+Vault Link Graph
+Persistent forward and reverse wiki-link adjacency for an Obsidian vault.
+
+"Who links to this note?" otherwise means reading every note in the vault.
+This graph stores each note's outgoing links once and answers backlink and
+orphan queries from compact arrays.
+
+Layout (.claude/cache/link-graph/):
+  graph.json   - version, source files and link keys (integer ID = position)
+  graph.bin    - four uint32 CSR arrays: forward offsets/targets
+                 (file -> keys) and reverse offsets/sources (key -> files)
+  overlay.json - {file: [keys]} for notes edited since the last build
+
+Edges point at link keys (the target without any #heading or ^block
+anchor), not at resolved files, so a link to a note that doesn't exist yet
+becomes a backlink as soon as the note is created. A key links to a note
+exactly when the wiki-link checker would resolve it there (note_index:
+case-sensitive, ontology prefix added or dropped).
+
+The PostToolUse link checker records the edited note's links in the overlay
+(one small JSON rewrite under overlay.lock). Once the overlay grows past
+COMPACT_THRESHOLD files, the hook starts `hooks/batch/link_graph.py compact`
+in the background to fold it into the arrays; the hook itself never
+rebuilds the graph. Build the graph with hooks/batch/link_graph.py.
+"""
+
+import contextlib
+import json
+import os
+import subprocess
+import sys
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, last writer wins
+    fcntl = None
+
+from note_index import link_name, note_link_names
+
+# Where the graph lives, relative to the vault root
+GRAPH_DIR = Path(".claude") / "cache" / "link-graph"
+
+GRAPH_VERSION = 2
+
+# Fold the overlay into the CSR arrays once this many files are in it
+COMPACT_THRESHOLD = 500
+
+# The CLI that compacts the graph in the background
+COMPACT_SCRIPT = Path(__file__).resolve().parent.parent / "batch" / "link_graph.py"
+
+_ITEM_SIZE = 4  # uint32
+
+
+def link_key(link_target: str) -> str:
+    """Canonical graph key for a link target ("" for [[#Heading]] links)."""
+    return link_name(link_target)
+
+
+def note_keys(rel_path: str) -> set[str]:
+    """Link keys that point at a note: the names note_index resolves to it
+    ([[Foo]] and [[Concept - Foo]] both link to "Foo.md")."""
+    stem = rel_path[:-3] if rel_path.endswith(".md") else rel_path
+    return note_link_names(stem.rsplit("/", 1)[-1])
+
+
+def _uint32_array(values=()) -> array:
+    arr = array("I", values)
+    if arr.itemsize != _ITEM_SIZE:
+        arr = array("L", values)
+    return arr
+
+
+def _csr(rows: list[list[int]]) -> tuple[array, array]:
+    offsets = _uint32_array([0])
+    targets = _uint32_array()
+    for row in rows:
+        targets.extend(row)
+        offsets.append(len(targets))
+    return offsets, targets
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+@contextlib.contextmanager
+def _locked(path: Path, blocking: bool = True):
+    """Hold an exclusive lock on path. Yields False if non-blocking and busy."""
+    with open(path, "a") as lock_file:
+        if fcntl is None:
+            yield True
+            return
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+        except BlockingIOError:
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+class LinkGraph:
+    """Forward and reverse CSR link adjacency plus an edit overlay."""
+
+    def __init__(self, vault_root: Path, graph_dir: Path | None = None):
+        self.vault_root = Path(vault_root)
+        self.graph_dir = Path(graph_dir) if graph_dir else self.vault_root / GRAPH_DIR
+        self.files: list[str] = []  # sorted; file ID = position
+        self.keys: list[str] = []   # sorted; key ID = position
+        self.fwd_offsets = _uint32_array([0])
+        self.fwd_targets = _uint32_array()
+        self.rev_offsets = _uint32_array([0])
+        self.rev_sources = _uint32_array()
+        self.overlay: dict[str, list[str]] = {}
+
+    # -- persistence -------------------------------------------------------
+
+    def exists(self) -> bool:
+        return (self.graph_dir / "graph.json").exists()
+
+    def load(self) -> "LinkGraph":
+        """Load the arrays and overlay. A missing or stale graph loads empty."""
+        try:
+            meta = json.loads((self.graph_dir / "graph.json").read_text(encoding="utf-8"))
+            if meta.get("version") != GRAPH_VERSION:
+                return self
+            raw = (self.graph_dir / "graph.bin").read_bytes()
+        except (OSError, ValueError):
+            return self
+
+        lengths = meta.get("lengths", [])
+        itemsize = _uint32_array().itemsize
+        if len(lengths) != 4 or len(raw) != sum(lengths) * itemsize:
+            return self  # Interrupted write - treat as unbuilt
+
+        arrays = []
+        pos = 0
+        for count in lengths:
+            arr = _uint32_array()
+            arr.frombytes(raw[pos:pos + count * itemsize])
+            arrays.append(arr)
+            pos += count * itemsize
+
+        self.files = meta["files"]
+        self.keys = meta["keys"]
+        self.fwd_offsets, self.fwd_targets, self.rev_offsets, self.rev_sources = arrays
+        self.overlay = read_overlay(self.graph_dir)
+        return self
+
+    def save(self, folded: dict[str, list[str]] | None = None) -> None:
+        """Write the arrays and clear the overlay.
+
+        With folded, only overlay entries still equal to it are cleared, so
+        edits recorded while the arrays were being rebuilt are kept.
+        """
+        self.graph_dir.mkdir(parents=True, exist_ok=True)
+        arrays = (self.fwd_offsets, self.fwd_targets, self.rev_offsets, self.rev_sources)
+        meta = {
+            "version": GRAPH_VERSION,
+            "lengths": [len(arr) for arr in arrays],
+            "files": self.files,
+            "keys": self.keys,
+        }
+        # Arrays first: a crash in between leaves lengths that don't match
+        _atomic_write(self.graph_dir / "graph.bin", b"".join(arr.tobytes() for arr in arrays))
+        _atomic_write(self.graph_dir / "graph.json", json.dumps(meta).encode("utf-8"))
+        self._drop_overlay(folded)
+
+    def _drop_overlay(self, folded: dict[str, list[str]] | None) -> None:
+        with _locked(self.graph_dir / "overlay.lock"):
+            current = read_overlay(self.graph_dir) if folded is not None else {}
+            remaining = {name: keys for name, keys in current.items() if folded.get(name) != keys}
+            if remaining:
+                _atomic_write(self.graph_dir / "overlay.json", json.dumps(remaining).encode("utf-8"))
+            else:
+                try:
+                    (self.graph_dir / "overlay.json").unlink()
+                except FileNotFoundError:
+                    pass
+        self.overlay = remaining
+
+    # -- building ----------------------------------------------------------
+
+    def build(self, edges: dict[str, list[str]]) -> "LinkGraph":
+        """Replace the graph with {file: [link keys]}."""
+        self.files = sorted(edges)
+        self.keys = sorted({key for keys in edges.values() for key in keys})
+        key_ids = {key: i for i, key in enumerate(self.keys)}
+
+        forward = [sorted({key_ids[key] for key in edges[name]}) for name in self.files]
+        reverse: list[list[int]] = [[] for _ in self.keys]
+        for file_id, targets in enumerate(forward):
+            for key_id in targets:
+                reverse[key_id].append(file_id)
+
+        self.fwd_offsets, self.fwd_targets = _csr(forward)
+        self.rev_offsets, self.rev_sources = _csr(reverse)
+        self.overlay = {}
+        return self
+
+    def edges(self) -> dict[str, list[str]]:
+        """Current {file: [link keys]}, overlay applied."""
+        merged = {name: self._base_outlinks(file_id) for file_id, name in enumerate(self.files)}
+        merged.update(self.overlay)
+        return merged
+
+    def compact(self) -> None:
+        """Fold the overlay into the arrays and save."""
+        folded = dict(self.overlay)
+        self.build(self.edges())
+        self.save(folded)
+
+    # -- queries -----------------------------------------------------------
+
+    @staticmethod
+    def _find(names: list[str], name: str) -> int | None:
+        """ID of a name in a sorted list (binary search, no dict to build)."""
+        i = bisect_left(names, name)
+        return i if i < len(names) and names[i] == name else None
+
+    def _base_outlinks(self, file_id: int) -> list[str]:
+        start, end = self.fwd_offsets[file_id], self.fwd_offsets[file_id + 1]
+        return [self.keys[key_id] for key_id in self.fwd_targets[start:end]]
+
+    def outlinks(self, rel_path: str) -> list[str]:
+        """Link keys a note points at."""
+        if rel_path in self.overlay:
+            return list(self.overlay[rel_path])
+        file_id = self._find(self.files, rel_path)
+        return [] if file_id is None else self._base_outlinks(file_id)
+
+    def linking_files(self, keys) -> set[str]:
+        """Files with a link to any of the given keys."""
+        keys = set(keys)
+        sources = set()
+        for key in keys:
+            key_id = self._find(self.keys, key)
+            if key_id is None:
+                continue
+            start, end = self.rev_offsets[key_id], self.rev_offsets[key_id + 1]
+            sources.update(self.files[file_id] for file_id in self.rev_sources[start:end])
+
+        # Overlay entries replace whatever the arrays say about that file
+        sources.difference_update(self.overlay)
+        sources.update(name for name, targets in self.overlay.items() if keys.intersection(targets))
+        return sources
+
+    def backlinks(self, rel_path: str) -> list[str]:
+        """Notes that link to a note (excluding itself and deleted notes)."""
+        sources = self.linking_files(note_keys(rel_path))
+        sources.discard(rel_path)
+        return sorted(name for name in sources if (self.vault_root / name).exists())
+
+    def orphans(self, note_paths) -> list[str]:
+        """Notes no other existing note links to."""
+        note_paths = list(note_paths)
+        existing = set(note_paths)
+        overlay_ids = {self._find(self.files, name) for name in self.overlay} - {None}
+
+        # One pass over the reverse arrays: key -> linking files
+        sources: dict[str, set[str]] = {}
+        for key_id, key in enumerate(self.keys):
+            start, end = self.rev_offsets[key_id], self.rev_offsets[key_id + 1]
+            for file_id in self.rev_sources[start:end]:
+                if file_id not in overlay_ids:
+                    sources.setdefault(key, set()).add(self.files[file_id])
+        for name, targets in self.overlay.items():
+            for key in targets:
+                sources.setdefault(key, set()).add(name)
+
+        orphans = []
+        for rel_path in note_paths:
+            linked = set()
+            for key in note_keys(rel_path):
+                linked |= sources.get(key, set())
+            linked.discard(rel_path)
+            if linked.isdisjoint(existing):
+                orphans.append(rel_path)
+        return orphans
+
+
+def read_overlay(graph_dir: Path) -> dict[str, list[str]]:
+    try:
+        overlay = json.loads((graph_dir / "overlay.json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return overlay if isinstance(overlay, dict) else {}
+
+
+def record_note_links(vault_root: Path, rel_path: str, link_targets) -> None:
+    """Record one note's current links (called after each edit).
+
+    Only touches the small overlay file; does nothing until the graph has
+    been built, so vaults that never query backlinks pay nothing. Errors are
+    ignored: the next build or compaction catches up.
+    """
+    graph_dir = Path(vault_root) / GRAPH_DIR
+    if not (graph_dir / "graph.json").exists():
+        return
+
+    keys = sorted({key for key in map(link_key, link_targets) if key})
+    try:
+        with _locked(graph_dir / "overlay.lock"):
+            overlay = read_overlay(graph_dir)
+            overlay[rel_path] = keys
+            _atomic_write(graph_dir / "overlay.json", json.dumps(overlay).encode("utf-8"))
+    except OSError:
+        return
+
+    if len(overlay) > COMPACT_THRESHOLD:
+        start_compaction(vault_root)
+
+
+def start_compaction(vault_root: Path) -> None:
+    """Run `link_graph.py compact` detached (a no-op if one is already running)."""
+    try:
+        subprocess.Popen([sys.executable, str(COMPACT_SCRIPT), "compact", "--vault", str(vault_root)],
+                         stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                         stderr=subprocess.DEVNULL, start_new_session=True)
+    except OSError:
+        pass
+
+
+def compact_link_graph(vault_root: Path) -> LinkGraph | None:
+    """Fold the overlay into the arrays. None if another compaction is running."""
+    graph_dir = Path(vault_root) / GRAPH_DIR
+    with _locked(graph_dir / "compact.lock", blocking=False) as acquired:
+        if not acquired:
+            return None
+        graph = LinkGraph(vault_root, graph_dir).load()
+        if graph.overlay:
+            graph.compact()
+        return graph
+
+
+def load_link_graph(vault_root: Path) -> LinkGraph:
+    """Open a vault's link graph (empty if it hasn't been built)."""
+    return LinkGraph(vault_root).load()
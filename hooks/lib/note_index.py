@@ -0,0 +1,332 @@
+"""
+Vault Note Index
+Persistent index of the notes in an Obsidian vault.
+
+Each hook runs in a fresh process, so an in-memory cache of the vault never
+survives to the next invocation. This index is an SQLite database at
+.claude/cache/note-index.sqlite holding every directory's mtime and
+subdirectories plus one row per note. A refresh stats each directory and
+only rescans those whose mtime changed (a note was added, removed or renamed
+there), so the cost is one stat per directory instead of a full walk.
+
+Directories modified within the last couple of seconds are stored as
+"unverified" and rescanned next time, so changes that land within the
+filesystem's mtime granularity are never missed (the same trick git uses for
+its racy index entries).
+
+Each note row also carries its link key: the ontology prefix and the bare
+name ("Task - Fix Login" -> "Task - ", "Fix Login"). Every note a link can
+resolve to is stored under the link's name or its bare name, so resolving a
+link is one indexed lookup instead of probing every prefix variant, and
+nothing is loaded that the current note does not link to. A corrupt index
+file is deleted and rebuilt.
+"""
+
+import os
+import sqlite3
+import time
+from pathlib import Path
+
+# Where the index lives, relative to the vault root
+INDEX_PATH = Path(".claude") / "cache" / "note-index.sqlite"
+
+INDEX_VERSION = 2
+
+# Directories to skip (plus any directory starting with '.')
+SKIP_DIRS = {".obsidian", ".git", "node_modules", ".claude"}
+
+# Directories changed this recently are rescanned on the next refresh
+RACY_WINDOW_NS = 2_000_000_000
+
+_UNVERIFIED = -1
+
+# SQLite limits bound parameters per statement (999 on older builds)
+_BATCH_SIZE = 500
+
+# Customise: filename prefixes that links may include or omit (ontology types)
+LINK_PREFIXES = [
+    # Entities
+    "System - ", "Organisation - ", "DataAsset - ", "Location - ", "Department - ",
+    # Person has NO prefix (lives in People/ as {{Name}}.md)
+    # Nodes
+    "Concept - ", "Pattern - ", "Capability - ", "Theme - ", "Weblink - ",
+    "Book - ", "Research - ", "YouTube - ", "Threat - ", "Principle - ",
+    "Framework - ", "Tool - ", "Article - ", "Reference - ", "HLD - ", "LLD - ",
+    # Events
+    "Meeting - ", "Project - ", "Task - ", "ADR - ", "Email - ", "Trip - ",
+    "Daily - ", "Incubator - ", "Workstream - ", "Forum - ", "FormSubmission - ",
+    "Objective - ",
+    # Navigation
+    "_MOC - ", "_Dashboard - ", "Query - ", "ArchModel - ",
+]
+
+# All prefixes end in " - ", so one partition finds the candidate prefix
+_PREFIX_SEPARATOR = " - "
+_PREFIXES = frozenset(LINK_PREFIXES)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS dirs (
+    rel_dir TEXT PRIMARY KEY,
+    mtime INTEGER NOT NULL,
+    subdirs TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS notes (
+    rel_dir TEXT NOT NULL,
+    name TEXT NOT NULL,
+    prefix TEXT NOT NULL,
+    bare TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS notes_by_dir ON notes (rel_dir);
+CREATE INDEX IF NOT EXISTS notes_by_bare ON notes (bare);
+"""
+
+
+def split_prefix(name: str) -> tuple[str, str]:
+    """Split a note name into (ontology prefix, bare name).
+
+    "Task - Fix Login" -> ("Task - ", "Fix Login"); "Fix Login" -> ("", "Fix Login")
+    """
+    head, sep, tail = name.partition(_PREFIX_SEPARATOR)
+    if sep and head + sep in _PREFIXES:
+        return head + sep, tail
+    return "", name
+
+
+def link_name(link_target: str) -> str:
+    """The note name a link target points at, without any anchor.
+
+    "Task - Foo#Notes" -> "Task - Foo"
+    """
+    if '#' in link_target:
+        link_target = link_target.split('#', 1)[0]
+    if '^' in link_target:
+        link_target = link_target.split('^', 1)[0]
+    return link_target.strip()
+
+
+def link_lookup_keys(link_target: str) -> set[str]:
+    """Bare names under which every note the link can resolve to is indexed."""
+    name = link_name(link_target)
+    bare = split_prefix(name)[1]
+    return {name, bare, split_prefix(bare)[1]}
+
+
+def link_resolves(link_keys: dict[str, set[str]], link_target: str) -> bool:
+    """Check a link target against a bare name -> note names map.
+
+    Matching is exact (case-sensitive), #heading and ^block anchors are
+    ignored, and an ontology prefix may be added or dropped: [[Foo]] finds
+    "Task - Foo.md", [[Task - Foo]] finds "Foo.md" and also
+    "Project - Task - Foo.md" (but not "Project - Foo.md").
+    """
+    name = link_name(link_target)
+    if not name:
+        return True  # [[#Heading]] links within the same note
+
+    # Notes stored under the link's own name are "Foo" itself or "<prefix>Foo"
+    if link_keys.get(name):
+        return True
+    prefix, bare = split_prefix(name)
+    if not prefix:
+        return False
+    # The prefixed note itself, or the note without the link's prefix
+    return (name in link_keys.get(bare, ()) or
+            bare in link_keys.get(split_prefix(bare)[1], ()))
+
+
+def note_link_names(name: str) -> set[str]:
+    """Link names that resolve to a note (the inverse of link_resolves).
+
+    "Task - Foo" -> {"Task - Foo", "Foo", "<prefix>Task - Foo" for every prefix}
+    """
+    return {name, split_prefix(name)[1]} | {prefix + name for prefix in _PREFIXES}
+
+
+class NoteIndex:
+    """Vault notes by directory, refreshed incrementally by mtime."""
+
+    def __init__(self, vault_root: Path, db_path: str | Path | None = None):
+        self.vault_root = Path(vault_root)
+        self.db_path = str(db_path or self.vault_root / INDEX_PATH)
+        self.conn = self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self.db_path != ":memory:":
+            try:
+                Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+                return self._open_file()
+            except sqlite3.OperationalError:
+                pass  # Locked or unwritable - fall back to a throwaway index
+            except sqlite3.DatabaseError:
+                # Corrupt - delete it and rebuild from scratch
+                try:
+                    for suffix in ("", "-wal", "-shm"):
+                        Path(self.db_path + suffix).unlink(missing_ok=True)
+                    return self._open_file()
+                except (sqlite3.Error, OSError):
+                    pass
+            except OSError:
+                pass
+        return self._prepare(sqlite3.connect(":memory:"))
+
+    def _open_file(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=5)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            return self._prepare(conn)
+        except sqlite3.Error:
+            conn.close()
+            raise
+
+    @staticmethod
+    def _prepare(conn: sqlite3.Connection) -> sqlite3.Connection:
+        conn.executescript(_SCHEMA)
+        row = conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        if row is None or row[0] != str(INDEX_VERSION):
+            with conn:
+                conn.execute("DELETE FROM dirs")
+                conn.execute("DELETE FROM notes")
+                conn.execute("INSERT OR REPLACE INTO meta VALUES ('version', ?)",
+                             (str(INDEX_VERSION),))
+        return conn
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def _scan_dir(self, abs_dir: str) -> tuple[list[str], list[str]]:
+        """List one directory's notes and subdirectories."""
+        notes = []
+        subdirs = []
+        try:
+            with os.scandir(abs_dir) as it:
+                for entry in it:
+                    name = entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        if name not in SKIP_DIRS and not name.startswith('.'):
+                            subdirs.append(name)
+                    elif name.endswith(".md"):
+                        notes.append(name[:-3])
+        except OSError:
+            pass
+        return notes, subdirs
+
+    def add_notes(self, rel_dir: str, names) -> None:
+        """Add notes found in a directory."""
+        rows = [(rel_dir, name) + split_prefix(name) for name in names]
+        self.conn.executemany("INSERT INTO notes VALUES (?, ?, ?, ?)", rows)
+
+    def refresh(self) -> "NoteIndex":
+        """Bring the index up to date, rescanning only changed directories."""
+        now = time.time_ns()
+        root = str(self.vault_root)
+        known = {rel_dir: (mtime, subdirs) for rel_dir, mtime, subdirs
+                 in self.conn.execute("SELECT rel_dir, mtime, subdirs FROM dirs")}
+        seen = set()
+        stack = [""]
+
+        with self.conn:
+            while stack:
+                rel_dir = stack.pop()
+                abs_dir = os.path.join(root, rel_dir) if rel_dir else root
+                try:
+                    mtime = os.stat(abs_dir).st_mtime_ns
+                except OSError:
+                    continue
+
+                seen.add(rel_dir)
+                entry = known.get(rel_dir)
+                if entry is not None and entry[0] == mtime:
+                    subdirs = entry[1].split("\n") if entry[1] else []
+                else:
+                    notes, subdirs = self._scan_dir(abs_dir)
+                    stored_mtime = _UNVERIFIED if now - mtime < RACY_WINDOW_NS else mtime
+                    self.conn.execute("DELETE FROM notes WHERE rel_dir = ?", (rel_dir,))
+                    self.add_notes(rel_dir, notes)
+                    self.conn.execute("INSERT OR REPLACE INTO dirs VALUES (?, ?, ?)",
+                                      (rel_dir, stored_mtime, "\n".join(subdirs)))
+
+                for subdir in subdirs:
+                    stack.append(f"{rel_dir}/{subdir}" if rel_dir else subdir)
+
+            # Forget directories that were deleted or are no longer reachable
+            for rel_dir in set(known) - seen:
+                self.conn.execute("DELETE FROM dirs WHERE rel_dir = ?", (rel_dir,))
+                self.conn.execute("DELETE FROM notes WHERE rel_dir = ?", (rel_dir,))
+
+        return self
+
+    def link_keys(self, bares=None) -> dict[str, set[str]]:
+        """Map bare names to the note names stored under them.
+
+        Restricted to the given bare names if provided, otherwise the whole
+        vault (for batch tools that resolve many notes' links).
+        """
+        keys: dict[str, set[str]] = {}
+        if bares is None:
+            rows = self.conn.execute("SELECT bare, name FROM notes")
+        else:
+            bares = list(bares)
+            rows = []
+            for i in range(0, len(bares), _BATCH_SIZE):
+                batch = bares[i:i + _BATCH_SIZE]
+                placeholders = ",".join("?" * len(batch))
+                rows.extend(self.conn.execute(
+                    f"SELECT bare, name FROM notes WHERE bare IN ({placeholders})", batch))
+        for bare, name in rows:
+            keys.setdefault(bare, set()).add(name)
+        return keys
+
+    def resolve_links(self, link_targets) -> dict[str, bool]:
+        """Resolve many link targets with one indexed query."""
+        link_targets = list(link_targets)
+        bares = set().union(*map(link_lookup_keys, link_targets))
+        keys = self.link_keys(bares)
+        return {target: link_resolves(keys, target) for target in link_targets}
+
+    def resolves(self, link_target: str) -> bool:
+        """Check whether a wiki-link target points at an existing note."""
+        return self.resolve_links([link_target])[link_target]
+
+    def find_notes(self, names) -> dict[str, str]:
+        """Map exact note names to their vault-relative paths.
+
+        Names not in the vault are omitted. When several directories hold a
+        note with the same name, the one nearest the vault root wins.
+        """
+        names = set(names)
+        by_bare: dict[str, set[str]] = {}
+        for name in names:
+            by_bare.setdefault(split_prefix(name)[1], set()).add(name)
+
+        bares = list(by_bare)
+        found: dict[str, tuple[int, str, str]] = {}
+        for i in range(0, len(bares), _BATCH_SIZE):
+            batch = bares[i:i + _BATCH_SIZE]
+            placeholders = ",".join("?" * len(batch))
+            rows = self.conn.execute(
+                f"SELECT rel_dir, name, bare FROM notes WHERE bare IN ({placeholders})", batch)
+            for rel_dir, name, bare in rows:
+                if name not in by_bare[bare]:
+                    continue
+                depth = rel_dir.count("/") + 1 if rel_dir else 0
+                candidate = (depth, rel_dir, name)
+                if name not in found or candidate < found[name]:
+                    found[name] = candidate
+
+        return {name: f"{rel_dir}/{name}.md" if rel_dir else f"{name}.md"
+                for name, (_, rel_dir, _) in found.items()}
+
+    def note_paths(self) -> list[str]:
+        """Vault-relative paths of every note, sorted."""
+        rows = self.conn.execute("SELECT rel_dir, name FROM notes ORDER BY rel_dir, name")
+        return [f"{rel_dir}/{name}.md" if rel_dir else f"{name}.md" for rel_dir, name in rows]
+
+    def note_names(self) -> set[str]:
+        """All note names (filenames without .md) in the vault."""
+        return {name for (name,) in self.conn.execute("SELECT name FROM notes")}
+
+
+def load_note_index(vault_root: Path) -> NoteIndex:
+    """Open and refresh the note index for a vault."""
+    return NoteIndex(vault_root).refresh()
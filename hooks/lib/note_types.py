@@ -0,0 +1,225 @@
+"""
+Note Type Schema
+The one description of the vault's note-type ontology, used by
+frontmatter-validator.py (required fields, status values, filename prefix),
+filename-convention-checker.py (prefix, folder and pattern) and the
+validate_frontmatter.py Stop hook (required fields plus `pillar`).
+
+Each NoteType lists, in NOTE_TYPES:
+  required  fields every note of the type must have (in report order)
+  status    valid `status` values, if the type restricts them
+  prefix    filename prefix, e.g. "Task - " (None: no prefix)
+  location  folder checked by filename-convention-checker.py ("root" for the
+            vault root; None: filename conventions are not checked)
+  filename  the filename pattern shown in warnings
+  pillar    notes created by skills must also set `pillar`
+
+The lists are compiled once, at import, into SCHEMA: a TypeRules per type
+with the required fields, enum frozensets and prefix stem ready to use, so
+the hooks do a dict lookup per note instead of rebuilding tables per call.
+"""
+
+from typing import NamedTuple
+
+
+class NoteType(NamedTuple):
+    name: str
+    required: tuple[str, ...]
+    status: tuple[str, ...] = ()
+    prefix: str | None = None
+    location: str | None = None
+    filename: str | None = None
+    pillar: bool = False
+
+
+class TypeRules(NamedTuple):
+    """A NoteType compiled for lookups."""
+    name: str
+    required: tuple[str, ...]
+    skill_required: tuple[str, ...]
+    status: tuple[str, ...]
+    status_set: frozenset[str]
+    prefix: str | None
+    prefix_stem: str | None
+    location: str | None
+    filename: str | None
+
+
+class NoteSchema(NamedTuple):
+    types: dict[str, TypeRules]
+    field_values: dict[str, tuple[str, ...]]
+    field_sets: dict[str, frozenset[str]]
+    date_fields: tuple[str, ...]
+    default_required: tuple[str, ...]
+
+
+# Customise: note types, their required fields, status values and filename conventions
+NOTE_TYPES = [
+    # Current ontology types
+    NoteType("Task", ("type", "title", "completed", "priority"),
+             status=("active", "completed", "paused"),
+             prefix="Task - ", location="Tasks/", filename="Task - {{Title}}.md"),
+    NoteType("Project", ("type", "title", "status", "priority"),
+             status=("active", "paused", "completed"),
+             prefix="Project - ", location="Projects/", filename="Project - {{Name}}.md"),
+    NoteType("Meeting", ("type", "title", "date", "attendees"),
+             prefix="Meeting - ", location="Meetings/", filename="Meeting - YYYY-MM-DD {{Title}}.md"),
+    NoteType("Person", ("type", "title"), location="People/", filename="{{Name}}.md"),
+    NoteType("ADR", ("type", "title", "status", "adrType"),
+             status=("draft", "proposed", "accepted", "deprecated", "superseded"),
+             prefix="ADR - ", location="ADRs/", filename="ADR - {{Title}}.md"),
+    # Legacy types (redirect to Reference)
+    NoteType("Weblink", ("type", "title", "url"), prefix="Weblink - "),
+    NoteType("Daily", ("type", "title", "date"), location="Daily/", filename="YYYY-MM-DD.md"),
+    NoteType("Incubator", ("type", "title", "status", "domain"),
+             status=("seed", "exploring", "validated", "accepted", "rejected"),
+             prefix="Incubator - ", location="Incubator/", filename="Incubator - {{Title}}.md"),
+    NoteType("FormSubmission", ("type", "title", "formType", "status", "project"),
+             status=("draft", "submitted", "pending", "approved", "rejected", "expired"),
+             prefix="FormSubmission - ", location="Forms/",
+             filename="FormSubmission - {{Type}} for {{Project}}.md"),
+    NoteType("System", ("type", "title"),
+             status=("active", "planned", "deprecated", "retired"),
+             prefix="System - ", location="root", filename="System - {{Name}}.md"),
+    NoteType("MOC", ("type", "title"),
+             prefix="_MOC - ", location="root", filename="_MOC - {{Scope}}.md"),
+    NoteType("Dashboard", ("type", "title"),
+             prefix="_Dashboard - ", location="root", filename="_Dashboard - {{Scope}}.md"),
+    NoteType("Query", ("type", "title", "queryType"),
+             prefix="Query - ", location="root", filename="Query - {{Name}}.md"),
+    NoteType("Organisation", ("type", "title"),
+             prefix="Organisation - ", location="root", filename="Organisation - {{Name}}.md"),
+    NoteType("Policy", ("type", "title", "source", "status"),
+             status=("active", "draft", "deprecated"),
+             prefix="Policy - ", location="Sync/Policies/", filename="Policy - {{Title}}.md"),
+    NoteType("Guardrail", ("type", "title", "source", "scope", "status"),
+             status=("active", "draft", "deprecated"),
+             prefix="Guardrail - ", location="Sync/Guardrails/", filename="Guardrail - {{Title}}.md"),
+    # New ontology types (four pillars)
+    NoteType("Concept", ("type", "title"),
+             prefix="Concept - ", location="root", filename="Concept - {{Title}}.md", pillar=True),
+    NoteType("Pattern", ("type", "title"),
+             prefix="Pattern - ", location="root", filename="Pattern - {{Title}}.md", pillar=True),
+    NoteType("Reference", ("type", "title", "referenceType"),
+             prefix="Reference - ", location="root", filename="Reference - {{Title}}.md"),
+    NoteType("Location", ("type", "title"),
+             prefix="Location - ", location="root", filename="Location - {{Name}}.md", pillar=True),
+    NoteType("DataAsset", ("type", "title"),
+             prefix="DataAsset - ", location="root", filename="DataAsset - {{Name}}.md", pillar=True),
+    NoteType("Department", ("type", "title"),
+             prefix="Department - ", location="root", filename="Department - {{Name}}.md", pillar=True),
+    NoteType("Workstream", ("type", "title"),
+             status=("active", "paused", "completed"),
+             prefix="Workstream - ", location="Projects/", filename="Workstream - {{Name}}.md"),
+    NoteType("Forum", ("type", "title"),
+             prefix="Forum - ", location="Projects/", filename="Forum - {{Name}}.md"),
+    NoteType("ArchModel", ("type", "title"),
+             prefix="ArchModel - ", location="root", filename="ArchModel - {{ViewName}}.md"),
+    NoteType("Email", ("type", "title", "subject", "from", "date"),
+             prefix="Email - ", location="Emails/", filename="Email - {{From}} - {{Subject}}.md"),
+    NoteType("Trip", ("type", "title", "status"),
+             status=("idea", "planning", "booked", "completed", "cancelled"),
+             prefix="Trip - ", location="Trips/", filename="Trip - {{Destination}}.md"),
+    NoteType("Objective", ("type", "title", "objectiveType", "status"),
+             status=("draft", "agreed", "in-progress", "reviewed", "achieved", "partial", "missed"),
+             prefix="Objective - ", location="Objectives/", filename="Objective - {{Title}}.md", pillar=True),
+    # Node types
+    NoteType("Research", ("type", "title"),
+             prefix="Research - ", location="root", filename="Research - {{Title}}.md", pillar=True),
+    NoteType("Threat", ("type", "title"),
+             prefix="Threat - ", location="root", filename="Threat - {{Title}}.md", pillar=True),
+    NoteType("Framework", ("type", "title"),
+             prefix="Framework - ", location="root", filename="Framework - {{Title}}.md", pillar=True),
+    NoteType("Tool", ("type", "title"),
+             prefix="Tool - ", location="root", filename="Tool - {{Title}}.md", pillar=True),
+    NoteType("HLD", ("type", "title"),
+             prefix="HLD - ", location="root", filename="HLD - {{Title}}.md"),
+    NoteType("LLD", ("type", "title"),
+             prefix="LLD - ", location="root", filename="LLD - {{Title}}.md"),
+    # Legacy types (still valid but consolidated)
+    NoteType("Book", ("type", "title"), pillar=True),
+    NoteType("YouTube", ("type", "title", "url"), pillar=True),
+    NoteType("Article", ("type", "title"),
+             status=("idea", "drafting", "review", "published", "archived"),
+             prefix="Article - ", pillar=True),
+    NoteType("Capability", ("type", "title"), pillar=True),
+    NoteType("Theme", ("type", "title"), pillar=True),
+    NoteType("Principle", ("type", "title"), pillar=True),
+]
+
+# Customise: valid values for enum fields (any note type; `status` is per type above)
+FIELD_VALUES = {
+    "priority": ("high", "medium", "low"),
+    "adrType": ("Technology_ADR", "Architecture_ADR", "Integration_ADR", "Security_ADR", "Data_ADR", "AI_ADR"),
+    "confidence": ("high", "medium", "low"),
+    "freshness": ("current", "recent", "stale"),
+    "source": ("primary", "secondary", "synthesis", "external", "local", "confluence"),
+    "criticality": ("critical", "high", "medium", "low"),
+    "referenceType": ("weblink", "youtube", "article", "book"),
+    "conceptType": ("concept", "principle", "capability", "theme"),
+    "articleType": ("blog-post", "linkedin-post", "talk", "presentation", "video", "podcast", "newsletter"),
+    "targetAudience": ("internal", "external", "both"),
+    "objectiveType": ("performance", "development"),
+    "goalCategory": ("cascaded", "strategic", "personal"),
+    "readingStatus": ("to-read", "reading", "completed", "abandoned", "reference"),
+    "threatType": ("attack", "vulnerability", "weakness", "exploit"),
+    "principleType": ("axiom", "heuristic", "law", "mental-model"),
+    "frameworkType": ("taxonomy", "model", "matrix", "methodology", "reference-architecture"),
+    "toolType": ("ide", "library", "framework", "platform", "service", "cli", "extension"),
+    "formType": ("DPIA", "CyberRisk", "TPRM", "IAF", "ChangeRequest", "Other"),
+    "queryType": ("table", "list", "task"),
+    "authority": ("draft", "local", "team", "organizational"),
+    "transformationType": ("modernisation", "migration", "greenfield", "integration", "decommission", "uplift"),
+    "transformationScope": ("enterprise", "department", "team", "application"),
+}
+
+# Customise: date fields that should be ISO format (YYYY-MM-DD)
+DATE_FIELDS = ["created", "modified", "date", "reviewed", "doDate", "dueBy",
+               "submittedDate", "responseDate", "expiryDate", "publishedDate",
+               "completedDate", "effectiveDate", "reviewDate", "archivedDate"]
+
+# Required fields for types not in NOTE_TYPES
+DEFAULT_REQUIRED = ("type", "title")
+
+
+def _prefix_stem(prefix: str | None) -> str | None:
+    """The part a filename must start with: "Task - " -> "Task"."""
+    if prefix is None:
+        return None
+    return prefix.removesuffix(" - ") if prefix.endswith(" - ") else prefix.rstrip(" ")
+
+
+def compile_type(note_type: NoteType) -> TypeRules:
+    skill_required = note_type.required
+    if note_type.pillar:
+        skill_required = ("type", "pillar") + tuple(f for f in note_type.required if f != "type")
+    return TypeRules(
+        name=note_type.name,
+        required=note_type.required,
+        skill_required=skill_required,
+        status=note_type.status,
+        status_set=frozenset(note_type.status),
+        prefix=note_type.prefix,
+        prefix_stem=_prefix_stem(note_type.prefix),
+        location=note_type.location,
+        filename=note_type.filename,
+    )
+
+
+def compile_schema(note_types=NOTE_TYPES, field_values=FIELD_VALUES,
+                   date_fields=DATE_FIELDS) -> NoteSchema:
+    types = {}
+    for note_type in note_types:
+        if note_type.name in types:
+            raise ValueError(f"Duplicate note type: {note_type.name}")
+        types[note_type.name] = compile_type(note_type)
+    return NoteSchema(
+        types=types,
+        field_values={field: tuple(values) for field, values in field_values.items()},
+        field_sets={field: frozenset(values) for field, values in field_values.items()},
+        date_fields=tuple(date_fields),
+        default_required=DEFAULT_REQUIRED,
+    )
+
+
+SCHEMA = compile_schema()
@@ -0,0 +1,137 @@
+"""
+Secret Allowlist
+Suppresses known false positives one finding at a time, so a note that
+legitimately shows an example key is still scanned for everything else.
+
+Each allowed finding is stored as a fingerprint: the SHA-256 of the pattern
+id, the file path (relative to the project root) and the SHA-256 of the
+matched text. Each entry also records the pattern id and path for review,
+but the matched text cannot be read back, so .claude/secret-allowlist.json
+can be committed.
+
+At startup the fingerprints are loaded into a set; a finding is suppressed
+when its fingerprint, or its path-independent "*" fingerprint, is in the
+set. Scanning is untouched until a pattern actually matches, and each match
+then costs two hashes and two set lookups.
+
+Entries are written by hooks/batch/secret_baseline.py, never by the hooks.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+# Where the allowlist lives, relative to the project root
+ALLOWLIST_PATH = Path(".claude") / "secret-allowlist.json"
+
+# Path recorded for findings allowed anywhere (example keys from vendor docs)
+ANY_PATH = "*"
+
+# Path recorded for findings in prompts
+PROMPT_PATH = "<prompt>"
+
+# Allowlists by path -> ((mtime_ns, size) or None if missing, allowlist)
+_loaded: dict[str, tuple[tuple[int, int] | None, "SecretAllowlist"]] = {}
+
+
+def match_digest(matched: str) -> str:
+    return hashlib.sha256(matched.encode("utf-8")).hexdigest()
+
+
+def fingerprint(pattern_id: str, matched: str, path: str) -> str:
+    """Fingerprint of one finding (path relative to the project root)."""
+    source = f"{pattern_id}\0{path}\0{match_digest(matched)}"
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+
+def relative_path(project_root: Path, file_path: str) -> str:
+    """file_path relative to the project root (POSIX), or absolute if outside."""
+    path = Path(file_path)
+    if not path.is_absolute():
+        path = project_root / path
+    try:
+        return path.resolve().relative_to(project_root.resolve()).as_posix()
+    except ValueError:
+        return path.resolve().as_posix()
+
+
+class SecretAllowlist:
+    """Fingerprints of allowed findings, with the metadata shown by `list`."""
+
+    def __init__(self, path: Path, entries: dict[str, dict] | None = None):
+        self.path = path
+        self.entries = entries or {}
+        self.fingerprints = frozenset(self.entries)
+
+    def __bool__(self) -> bool:
+        return bool(self.fingerprints)
+
+    def allows(self, pattern_id: str, matched: str, path: str) -> bool:
+        """Is this finding allowlisted, for this path or any path?"""
+        return (fingerprint(pattern_id, matched, path) in self.fingerprints
+                or fingerprint(pattern_id, matched, ANY_PATH) in self.fingerprints)
+
+    def for_path(self, path: str):
+        """allows() bound to one path, or None when nothing is allowlisted
+        (so scans skip the check entirely)."""
+        if not self.fingerprints:
+            return None
+        return lambda pattern_id, matched: self.allows(pattern_id, matched, path)
+
+    def add(self, pattern_id: str, matched: str, path: str, note: str = "") -> bool:
+        """Allow a finding. Returns False if it was already allowed."""
+        key = fingerprint(pattern_id, matched, path)
+        if key in self.entries:
+            return False
+        self.entries[key] = {"pattern": pattern_id, "path": path, "note": note}
+        self.fingerprints = frozenset(self.entries)
+        return True
+
+    def remove(self, key: str) -> bool:
+        if self.entries.pop(key, None) is None:
+            return False
+        self.fingerprints = frozenset(self.entries)
+        return True
+
+    def digest(self) -> str:
+        """Hash of the allowed fingerprints, for invalidating scan caches."""
+        return hashlib.sha256("\n".join(sorted(self.fingerprints)).encode("ascii")).hexdigest()
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {"version": 1, "fingerprints": dict(sorted(self.entries.items()))}
+        tmp = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+        os.replace(tmp, self.path)
+
+
+def load_allowlist(project_root: Path) -> SecretAllowlist:
+    """The project's allowlist (empty if missing or unreadable).
+
+    Parsed once per process and reloaded when the file changes, which
+    matters in the hook daemon, where this module stays imported.
+    """
+    path = Path(project_root) / ALLOWLIST_PATH
+    try:
+        st = path.stat()
+        stamp = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        stamp = None
+
+    key = str(path)
+    cached = _loaded.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    entries = {}
+    if stamp is not None:
+        try:
+            entries = json.loads(path.read_text(encoding="utf-8"))["fingerprints"]
+            if not isinstance(entries, dict):
+                entries = {}
+        except (OSError, ValueError, KeyError, TypeError):
+            entries = {}
+    allowlist = SecretAllowlist(path, entries)
+    _loaded[key] = (stamp, allowlist)
+    return allowlist
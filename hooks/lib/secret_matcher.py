@@ -0,0 +1,501 @@
+"""
+Secret Matcher
+Scans text for every secret pattern in one pass instead of one pass each.
+
+Every pattern in SECRET_PATTERNS (secret_patterns.py) starts with a literal anchor: "AKIA",
+"ghp_", "sk-", "xox", "-----BEGIN", "password", and so on. The matcher
+extracts those leading literals from the parsed regexes, joins them into one
+alternation and scans the lower-cased text for them once. Each pattern
+then runs only at the positions where one of its anchors occurs, so a 2 MB
+log with no secrets in it is read once, not once per pattern.
+
+Findings are what re.findall() per pattern would report for matches within
+the span caps below: a match can only start where its anchor starts, and
+candidates are walked left to right skipping overlaps, as findall does.
+Patterns with no usable anchor (a custom pattern starting with a character
+class, say) fall back to a full findall.
+Patterns are compiled on first use, so text with no anchors in it compiles
+only the prefilter.
+
+Large text is scanned in overlapping chunks (count_stream), so memory stays
+bounded by the chunk size and a scan that only needs a yes/no decision can
+stop at the first chunk with a finding.
+
+Bounded match attempts: each attempt reads at most the pattern's span (its
+maximum width, capped at MAX_OVERLAP), never to the end of the text, so a
+pattern with a linear-time shape costs O(span) per anchor. A pattern that
+can backtrack super-linearly (backtracking_risk(): nested unbounded repeats,
+or an unbounded repeat that can give characters back to what follows it
+with another unbounded repeat later, like "[^\s]+:[^\s]+@") is capped at
+RISKY_SPAN instead, bounding its worst case per anchor to a constant.
+count_stream() also takes a deadline and raises ScanTimeout, with the
+counts so far, once it passes.
+"""
+
+import re
+import time
+
+try:
+    import re._parser as _sre_parse  # Python 3.11+
+except ImportError:
+    import sre_parse as _sre_parse
+
+# Anchors shorter than this match too often to be worth prefiltering on
+MIN_ANCHOR_LENGTH = 2
+
+# Give up on a pattern whose alternations expand to more anchors than this
+MAX_ANCHORS = 64
+
+# Characters scanned per chunk when streaming
+CHUNK_SIZE = 256 * 1024
+
+# How far a match may run past the end of its chunk. Patterns with an
+# unbounded tail (\S+, {20,}) are read this far at most; a longer match is
+# cut short and the text after the cut is scanned again, which can only add
+# findings, never lose one.
+MAX_OVERLAP = 4096
+
+# Span of a pattern that can backtrack quadratically. Matches longer than
+# this are cut short (still counted).
+RISKY_SPAN = 256
+
+# Characters considered when comparing character sets for backtracking_risk()
+_ALPHABET = [chr(c) for c in range(128)]
+
+_CATEGORIES = {
+    _sre_parse.CATEGORY_DIGIT: re.compile(r"\d"),
+    _sre_parse.CATEGORY_NOT_DIGIT: re.compile(r"\D"),
+    _sre_parse.CATEGORY_SPACE: re.compile(r"\s"),
+    _sre_parse.CATEGORY_NOT_SPACE: re.compile(r"\S"),
+    _sre_parse.CATEGORY_WORD: re.compile(r"\w"),
+    _sre_parse.CATEGORY_NOT_WORD: re.compile(r"\W"),
+}
+
+
+class ScanTimeout(Exception):
+    """A scan passed its deadline. counts: pattern index -> matches found in
+    the first `scanned` characters; findings: the same as (label, count)
+    pairs, when raised by secret_patterns.scan()."""
+
+    def __init__(self, counts: dict, scanned: int, findings: list | None = None):
+        super().__init__(f"secret scan timed out after {scanned} characters")
+        self.counts = counts
+        self.scanned = scanned
+        self.findings = findings
+
+
+def _leading_literals(items) -> tuple[set[str], bool] | None:
+    """Literal strings a parsed regex sequence must start with.
+
+    Returns (prefixes, complete), where complete means the whole sequence is
+    literal (so whatever follows can be appended), or None if the sequence
+    can start with something other than a literal.
+    """
+    prefixes = {""}
+    for op, av in items:
+        if op is _sre_parse.AT:
+            continue  # \b, ^ and friends are zero-width
+        if op is _sre_parse.LITERAL:
+            prefixes = {prefix + chr(av) for prefix in prefixes}
+            continue
+
+        if op is _sre_parse.SUBPATTERN:
+            inner = _leading_literals(av[-1])
+        elif op is _sre_parse.BRANCH:
+            inner = _branch_literals(av[1])
+        else:
+            return prefixes, False
+
+        if inner is None:
+            return prefixes, False
+        sub_prefixes, complete = inner
+        prefixes = {prefix + sub for prefix in prefixes for sub in sub_prefixes}
+        if len(prefixes) > MAX_ANCHORS:
+            return None
+        if not complete:
+            return prefixes, False
+
+    return prefixes, True
+
+
+def _branch_literals(branches) -> tuple[set[str], bool] | None:
+    prefixes = set()
+    complete = True
+    for branch in branches:
+        inner = _leading_literals(branch)
+        if inner is None:
+            return None
+        prefixes |= inner[0]
+        complete = complete and inner[1]
+    return prefixes, complete
+
+
+def pattern_anchors(pattern: str) -> set[str] | None:
+    """Lower-cased literals every match of a pattern starts with, or None."""
+    try:
+        result = _leading_literals(_sre_parse.parse(pattern))
+    except (re.error, RecursionError):
+        return None
+    if result is None:
+        return None
+    anchors = {anchor.lower() for anchor in result[0]}
+    if not anchors or min(len(anchor) for anchor in anchors) < MIN_ANCHOR_LENGTH:
+        return None
+    return anchors
+
+
+def pattern_max_width(pattern: str) -> int:
+    """Longest possible match of a pattern, capped at MAX_OVERLAP."""
+    try:
+        return min(_sre_parse.parse(pattern).getwidth()[1], MAX_OVERLAP)
+    except (re.error, RecursionError, OverflowError):
+        return MAX_OVERLAP
+
+
+def _char_set(op, av) -> set[str] | None:
+    """ASCII characters a single-character regex item matches, or None if
+    the item is not a single character."""
+    if op is _sre_parse.LITERAL:
+        return {chr(av)} if av < 128 else set()
+    if op is _sre_parse.NOT_LITERAL:
+        return {c for c in _ALPHABET if ord(c) != av}
+    if op is _sre_parse.ANY:
+        return set(_ALPHABET) - {"\n"}
+    if op is not _sre_parse.IN:
+        return None
+
+    chars = set()
+    negate = False
+    for item_op, item_av in av:
+        if item_op is _sre_parse.NEGATE:
+            negate = True
+        elif item_op is _sre_parse.LITERAL:
+            chars.add(chr(item_av))
+        elif item_op is _sre_parse.RANGE:
+            chars.update(chr(c) for c in range(item_av[0], min(item_av[1], 127) + 1))
+        elif item_op is _sre_parse.CATEGORY and item_av in _CATEGORIES:
+            chars.update(c for c in _ALPHABET if _CATEGORIES[item_av].match(c))
+        else:
+            return set(_ALPHABET)  # Unknown - assume it matches anything
+    return set(_ALPHABET) - chars if negate else chars
+
+
+def _first_chars(items, icase: bool) -> tuple[set[str], bool]:
+    """(characters a sequence can start with, whether it can match empty)."""
+    first: set[str] = set()
+    for op, av in items:
+        if op is _sre_parse.AT:
+            continue
+        chars = _char_set(op, av)
+        if chars is not None:
+            nullable = False
+        elif op is _sre_parse.SUBPATTERN:
+            chars, nullable = _first_chars(av[-1], icase)
+        elif op is _sre_parse.BRANCH:
+            chars, nullable = set(), False
+            for branch in av[1]:
+                branch_chars, branch_nullable = _first_chars(branch, icase)
+                chars |= branch_chars
+                nullable = nullable or branch_nullable
+        elif op in (_sre_parse.MAX_REPEAT, _sre_parse.MIN_REPEAT):
+            chars, nullable = _first_chars(av[2], icase)
+            nullable = nullable or av[0] == 0
+        else:
+            return first | set(_ALPHABET), True  # Lookarounds, backrefs: assume anything
+        if icase:
+            chars = chars | {c.swapcase() for c in chars}
+        first |= chars
+        if not nullable:
+            return first, False
+    return first, True
+
+
+def _has_unbounded(items) -> bool:
+    for op, av in items:
+        if op in (_sre_parse.MAX_REPEAT, _sre_parse.MIN_REPEAT):
+            if av[1] == _sre_parse.MAXREPEAT or _has_unbounded(av[2]):
+                return True
+        elif op is _sre_parse.SUBPATTERN and _has_unbounded(av[-1]):
+            return True
+        elif op is _sre_parse.BRANCH and any(_has_unbounded(b) for b in av[1]):
+            return True
+    return False
+
+
+def _sequence_risk(items, icase: bool) -> bool:
+    items = list(items)
+    for i, (op, av) in enumerate(items):
+        if op is _sre_parse.SUBPATTERN:
+            if _sequence_risk(list(av[-1]) + items[i + 1:], icase):
+                return True
+            continue
+        if op is _sre_parse.BRANCH:
+            if any(_sequence_risk(list(branch) + items[i + 1:], icase) for branch in av[1]):
+                return True
+            continue
+        if op not in (_sre_parse.MAX_REPEAT, _sre_parse.MIN_REPEAT):
+            continue
+        if av[1] != _sre_parse.MAXREPEAT:
+            if _sequence_risk(av[2], icase):
+                return True
+            continue
+
+        if _has_unbounded(av[2]):
+            return True  # Nested unbounded repeats, as in (a+)+
+
+        # An unbounded repeat that can give characters back to what follows
+        # it, with another unbounded repeat later: every give-back reruns
+        # the later repeat over the rest of the text
+        repeated, _ = _first_chars(av[2], icase)
+        follow, _ = _first_chars(items[i + 1:], icase)
+        if repeated & follow and _has_unbounded(items[i + 1:]):
+            return True
+    return False
+
+
+def backtracking_risk(pattern: str) -> bool:
+    """Can one match attempt take super-linear time in the text length?"""
+    try:
+        parsed = _sre_parse.parse(pattern)
+    except (re.error, RecursionError):
+        return True
+    return _sequence_risk(parsed, bool(parsed.state.flags & re.IGNORECASE))
+
+
+def pattern_span(pattern: str) -> int:
+    """Characters one match attempt may read (see "Bounded match attempts")."""
+    width = pattern_max_width(pattern)
+    return min(width, RISKY_SPAN) if backtracking_risk(pattern) else width
+
+
+class SecretMatcher:
+    """All secret patterns behind one literal-anchor prefilter."""
+
+    def __init__(self, patterns, anchors=None, spans=None):
+        """patterns: (regex, label) pairs. anchors/spans: optional
+        precomputed pattern_anchors()/pattern_span() results, one per
+        pattern (see secret_patterns.py)."""
+        self.patterns = list(patterns)
+        if spans is None:
+            spans = [pattern_span(pattern) for pattern, _ in self.patterns]
+        self.spans = list(spans)
+        self.overlap = max(self.spans, default=0)
+        self._compiled: list[re.Pattern | None] = [None] * len(self.patterns)
+        self.unanchored = []
+        anchor_patterns: dict[str, set[int]] = {}
+
+        if anchors is None:
+            anchors = [pattern_anchors(pattern) for pattern, _ in self.patterns]
+        for i, pattern_anchor_set in enumerate(anchors):
+            if pattern_anchor_set is None:
+                self.unanchored.append(i)
+                continue
+            for anchor in pattern_anchor_set:
+                anchor_patterns.setdefault(anchor, set()).add(i)
+
+        # Anchors found at the same position are prefixes of one another
+        # ("sk-" and "sk-ant-"), so the longest one found implies the rest
+        self.candidates: dict[str, list[int]] = {}
+        for anchor in anchor_patterns:
+            triggered = set()
+            for other, indexes in anchor_patterns.items():
+                if anchor.startswith(other):
+                    triggered |= indexes
+            self.candidates[anchor] = sorted(triggered)
+
+        # finditer() consumes each anchor it finds, so note which anchors can
+        # start inside another one ("secret" in "aws_secret_access_key") and
+        # check those offsets explicitly
+        self.inner_anchors: dict[str, list[tuple[int, str]]] = {}
+        for anchor in anchor_patterns:
+            for offset in range(1, len(anchor)):
+                tail = anchor[offset:]
+                for other in anchor_patterns:
+                    if other.startswith(tail) or tail.startswith(other):
+                        self.inner_anchors.setdefault(anchor, []).append((offset, other))
+
+        if anchor_patterns:
+            # Longest first, so the alternation reports the longest anchor.
+            # The prefilter runs over lower-cased text: a case-sensitive
+            # alternation is an order of magnitude faster in re than an
+            # IGNORECASE one.
+            alternation = "|".join(re.escape(anchor) for anchor in
+                                   sorted(anchor_patterns, key=len, reverse=True))
+            self.prefilter = re.compile(alternation)
+        else:
+            self.prefilter = None
+        self._prefilter_icase = None
+
+    def _anchor_hits(self, text: str) -> dict[str, list[int]]:
+        """Anchor -> positions where it starts (longest anchor per position)."""
+        lowered = text.lower()
+        if len(lowered) == len(text):
+            finditer = self.prefilter.finditer
+            text = lowered
+        else:
+            # A few characters change length when lower-cased ("\u0130"),
+            # which would shift positions - match case-insensitively instead
+            if self._prefilter_icase is None:
+                self._prefilter_icase = re.compile(self.prefilter.pattern, re.IGNORECASE)
+            finditer = self._prefilter_icase.finditer
+
+        hits: dict[str, list[int]] = {}
+        inner_anchors = self.inner_anchors
+        for match in finditer(text):
+            anchor = match.group()
+            if anchor not in self.candidates:
+                anchor = anchor.lower()
+            pos = match.start()
+            hits.setdefault(anchor, []).append(pos)
+
+            for offset, inner in inner_anchors.get(anchor, ()):
+                start = pos + offset
+                if text[start:start + len(inner)].lower() == inner:
+                    hits.setdefault(inner, []).append(start)
+        return hits
+
+    def _candidate_positions(self, text: str) -> dict[int, list[int]]:
+        """Pattern index -> sorted positions where one of its anchors starts."""
+        if self.prefilter is None:
+            return {}
+
+        everything = range(len(self.patterns))
+        grouped: dict[int, list[int]] = {}
+        for anchor, hits in self._anchor_hits(text).items():
+            for i in self.candidates.get(anchor, everything):
+                grouped.setdefault(i, []).extend(hits)
+        return {i: sorted(set(hits)) for i, hits in grouped.items()}
+
+    def compiled(self, i: int) -> re.Pattern:
+        """Pattern i, compiled the first time it is needed."""
+        pattern = self._compiled[i]
+        if pattern is None:
+            pattern = self._compiled[i] = re.compile(self.patterns[i][0])
+        return pattern
+
+    def count_matches(self, text: str, stop_at_first: bool = False,
+                      deadline: float | None = None, suppress=None) -> dict[int, int]:
+        """Pattern index -> number of matches, for patterns that match."""
+        return self.count_stream([text], stop_at_first, deadline, suppress)
+
+    def count_stream(self, chunks, stop_at_first: bool = False,
+                     deadline: float | None = None, suppress=None) -> dict[int, int]:
+        """Count matches over text arriving in pieces, in bounded memory.
+
+        The text is scanned CHUNK_SIZE characters at a time. Each window
+        reaches `overlap` characters past its chunk so a match starting in
+        the chunk can be read to its end (and one character before, for
+        \b); matches are counted only where they start. With stop_at_first
+        the scan returns after the first chunk with any finding.
+
+        deadline is a time.monotonic() value; past it, ScanTimeout is raised
+        (checked before each chunk and between patterns, so at most one
+        pattern's pass over a chunk late).
+
+        suppress(index, matched_text) -> bool, if given, is called for each
+        match; matches it returns True for are not counted.
+
+        A match of an unanchored pattern that runs to the end of its window
+        may be cut there. If the match the next window finds at the cut
+        extends it (re-matching the two joined goes past the cut), it is
+        the same match and is not counted again.
+        """
+        counts: dict[int, int] = {}
+        last_end: dict[int, int] = {}  # Absolute end of each pattern's last match
+        cut_at: dict[int, tuple[int, str | None]] = {}  # (absolute end, text) of a match
+                                                         # that ran to its window's end
+        buf = ""
+        pos = 0       # Start of the next chunk within buf
+        offset = 0    # Absolute position of buf[0]
+
+        for piece in chunks:
+            # Drop what has been scanned, keeping one character of context
+            cut = max(pos - 1, 0)
+            buf = buf[cut:] + piece
+            offset += cut
+            pos -= cut
+
+            while len(buf) - pos >= CHUNK_SIZE + self.overlap:
+                lo = max(pos - 1, 0)
+                window = buf[lo:pos + CHUNK_SIZE + self.overlap]
+                self._scan_window(window, pos - lo, pos - lo + CHUNK_SIZE, offset + lo,
+                                  counts, last_end, cut_at, False, deadline, suppress)
+                pos += CHUNK_SIZE
+                if stop_at_first and counts:
+                    return counts
+
+        if len(buf) > pos:
+            lo = max(pos - 1, 0)
+            self._scan_window(buf[lo:], pos - lo, len(buf) - lo, offset + lo, counts, last_end,
+                              cut_at, True, deadline, suppress)
+        return counts
+
+    def _scan_window(self, window: str, start: int, end: int, offset: int,
+                     counts: dict[int, int], last_end: dict[int, int],
+                     cut_at: dict[int, tuple[int, str | None]],
+                     final: bool, deadline: float | None = None, suppress=None) -> None:
+        """Count matches starting in window[start:end] (window begins at offset).
+
+        final is False when more text follows the window.
+        """
+        if deadline is not None and time.monotonic() > deadline:
+            raise ScanTimeout(counts, offset + start)
+        for i, positions in self._candidate_positions(window).items():
+            if deadline is not None and time.monotonic() > deadline:
+                raise ScanTimeout(counts, offset + start)
+            pattern = self.compiled(i)
+            span = self.spans[i]
+            resume = last_end.get(i, 0) - offset
+            for pos in positions:
+                if pos < start or pos < resume:
+                    continue  # Before this chunk, or inside the previous match
+                if pos >= end:
+                    break  # Belongs to the next chunk
+                m = pattern.match(window, pos, pos + span)
+                if m:
+                    if suppress is None or not suppress(i, m.group()):
+                        counts[i] = counts.get(i, 0) + 1
+                    resume = max(m.end(), pos + 1)
+            last_end[i] = resume + offset
+
+        for i in self.unanchored:
+            if deadline is not None and time.monotonic() > deadline:
+                raise ScanTimeout(counts, offset + start)
+            pattern = self.compiled(i)
+            resume = max(last_end.get(i, 0) - offset, start)
+            for m in pattern.finditer(window, resume):
+                if m.start() >= end:
+                    break
+                # Anchored matches stop at their span, which ends inside the
+                # window; only an unanchored one can be cut by the window end
+                cut_end, cut_text = cut_at.pop(i, (None, None))
+                text = m.group()
+                continued = False
+                if cut_end == m.start() + offset:
+                    if cut_text is None:
+                        continued = True  # Already longer than a chunk
+                    else:
+                        joined = pattern.match(cut_text + text)
+                        continued = joined is not None and joined.end() > len(cut_text)
+                if continued:
+                    if cut_text is not None and len(cut_text) < CHUNK_SIZE:
+                        text = cut_text + text
+                    else:
+                        text = None
+                elif suppress is None or not suppress(i, text):
+                    counts[i] = counts.get(i, 0) + 1
+                if m.end() == len(window) and not final:
+                    cut_at[i] = (m.end() + offset, text)
+                resume = max(m.end(), m.start() + 1)
+            last_end[i] = resume + offset
+
+    def scan(self, text: str) -> list[tuple[str, int]]:
+        """(label, count) for each pattern that matches, in pattern order."""
+        counts = self.count_matches(text)
+        return [(self.patterns[i][1], counts[i]) for i in sorted(counts)]
+
+
+def iter_chunks(text: str, size: int = CHUNK_SIZE):
+    """Slice text into chunks for count_stream()."""
+    for i in range(0, len(text), size):
+        yield text[i:i + size]
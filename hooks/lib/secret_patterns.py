@@ -0,0 +1,264 @@
+"""
+Secret Pattern Registry
+The one list of secret patterns used by secret-detection.py (prompts) and
+secret-file-scanner.py (file writes).
+
+Each pattern has a stable id, its regex and the label shown to the user.
+Patterns are compiled once per process behind the literal-anchor prefilter
+in secret_matcher.py, and only when one of their anchors actually appears,
+so a clean prompt compiles the prefilter and nothing else.
+
+Warm cache: deriving each pattern's anchors and match span (how far one
+match attempt may read; see secret_matcher.py) means parsing every regex.
+The result is saved to ~/.cache/claude-hooks/secret-anchors.json, keyed by
+a hash of the pattern list and of secret_matcher.py (the analysis code), so
+later processes skip the parse. Editing a pattern or the analyser changes
+the hash and the cache rebuilds itself.
+
+High-entropy tokens: scan() also runs the entropy detector (entropy.py),
+which catches bare keys that no pattern anchors on. Its findings are
+reported after the patterns as "high-entropy string (<charset>)" and counted
+under "entropy-<charset>".
+
+Allowlist: scan() takes allow(pattern_id, matched_text) -> bool, and
+matches it returns True for are not reported (see secret_allowlist.py).
+find_matches() lists every match with its id, for building the allowlist.
+
+Hit counters: scan() counts matches per pattern id in HIT_COUNTS, and
+record_hits() adds them to ~/.cache/claude-hooks/secret-pattern-hits.json
+(rewritten atomically), so noisy patterns (false positives) show up over time.
+"""
+
+import hashlib
+import json
+import os
+import time
+from collections import Counter
+from pathlib import Path
+from typing import NamedTuple
+
+import entropy
+from entropy import CHARSET_RULES, EntropyDetector
+import secret_matcher
+from secret_matcher import ScanTimeout, SecretMatcher, iter_chunks, pattern_anchors, pattern_span
+
+
+class SecretPattern(NamedTuple):
+    id: str
+    regex: str
+    label: str
+
+
+# Customise: patterns that indicate potential secrets (ids must be unique)
+SECRET_PATTERNS = [
+    # Explicit key-value patterns
+    SecretPattern("password", r"(?i)\b(password|passwd|pwd)\s*[:=]\s*\S+", "password"),
+    SecretPattern("secret", r"(?i)\b(secret|api_?secret)\s*[:=]\s*\S+", "secret"),
+    SecretPattern("api-key", r"(?i)\b(api_?key|apikey)\s*[:=]\s*\S+", "API key"),
+    SecretPattern("token", r"(?i)\b(token|auth_?token|access_?token)\s*[:=]\s*\S+", "token"),
+    SecretPattern("private-key", r"(?i)\b(private_?key)\s*[:=]\s*\S+", "private key"),
+
+    # Common API key formats
+    SecretPattern("openai-key", r"sk-[a-zA-Z0-9]{20,}", "OpenAI API key"),
+    SecretPattern("anthropic-key", r"sk-ant-[a-zA-Z0-9-]{20,}", "Anthropic API key"),
+    SecretPattern("github-pat", r"ghp_[a-zA-Z0-9]{36}", "GitHub personal access token"),
+    SecretPattern("github-oauth", r"gho_[a-zA-Z0-9]{36}", "GitHub OAuth token"),
+    SecretPattern("github-server", r"ghs_[a-zA-Z0-9]{36}", "GitHub server token"),
+    SecretPattern("aws-access-key-id", r"AKIA[0-9A-Z]{16}", "AWS access key ID"),
+    SecretPattern("aws-secret-key", r"(?i)aws_secret_access_key\s*[:=]\s*\S+", "AWS secret key"),
+
+    # Notion tokens (internal integration tokens)
+    SecretPattern("notion-integration", r"ntn_[a-zA-Z0-9]{40,}", "Notion integration token"),
+    SecretPattern("notion-internal", r"secret_[a-zA-Z0-9]{40,}", "Notion internal token"),
+
+    # Atlassian/Confluence tokens
+    SecretPattern("atlassian-token", r"(?i)atlassian[-_]?token\s*[:=]\s*\S+", "Atlassian token"),
+    SecretPattern("confluence-token", r"(?i)confluence[-_]?token\s*[:=]\s*\S+", "Confluence token"),
+    SecretPattern("jira-token", r"(?i)jira[-_]?token\s*[:=]\s*\S+", "Jira token"),
+    SecretPattern("atlassian-api-token", r"ATATT[a-zA-Z0-9]{20,}", "Atlassian API token"),
+
+    # Slack tokens
+    SecretPattern("slack-token", r"xox[baprs]-[0-9A-Za-z\-]{10,}", "Slack token"),
+
+    # Google API keys
+    SecretPattern("google-api-key", r"AIza[0-9A-Za-z\-_]{35}", "Google API key"),
+
+    # Bearer tokens
+    SecretPattern("bearer-token", r"(?i)bearer\s+[a-zA-Z0-9\-_\.]{20,}", "Bearer token"),
+
+    # Connection strings (user:password@ in the URL). The user part stops at
+    # ":" and the password part at "@", so matching never backtracks. Both
+    # parts are bounded: a user over 256 characters or containing "/" or ":",
+    # or a password over 256 characters, is not matched.
+    SecretPattern("connection-string",
+                  r"(?i)(mongodb|postgres|mysql|redis)://[^\s:@/]{0,256}:[^\s@]{1,256}@",
+                  "database connection string"),
+
+    # Private keys (PEM format headers)
+    SecretPattern("pem-private-key", r"-----BEGIN\s+(RSA\s+)?PRIVATE\s+KEY-----", "private key (PEM)"),
+    SecretPattern("ssh-private-key", r"-----BEGIN\s+OPENSSH\s+PRIVATE\s+KEY-----", "SSH private key"),
+
+    # Generic high-entropy patterns (base64-like with sufficient length)
+    # Only match if it looks like a standalone token/key, not regular text
+    SecretPattern("high-entropy-credential",
+                  r"(?i)(api[_-]?key|secret|token|password)\s*[:=]\s*['\"]?[A-Za-z0-9+/=]{32,}['\"]?",
+                  "high-entropy credential"),
+]
+
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "claude-hooks"
+ANCHOR_CACHE = CACHE_DIR / "secret-anchors.json"
+HITS_FILE = CACHE_DIR / "secret-pattern-hits.json"
+
+# Label prefix of entropy-detector findings (see is_entropy_finding())
+ENTROPY_LABEL = "high-entropy string"
+
+# Matches seen by this process, by pattern id
+HIT_COUNTS: Counter = Counter()
+
+_matcher: SecretMatcher | None = None
+_entropy: EntropyDetector | None = None
+
+
+def patterns_digest(patterns=SECRET_PATTERNS) -> str:
+    """Hash of the pattern list, the entropy rules and the analysis code
+    (secret_matcher.py, entropy.py), used to invalidate caches."""
+    source = json.dumps([[[p.id, p.regex] for p in patterns], CHARSET_RULES], sort_keys=True)
+    analysers = [Path(module.__file__).read_bytes() for module in (secret_matcher, entropy)]
+    return hashlib.sha256(b"\0".join([source.encode("utf-8")] + analysers)).hexdigest()
+
+
+def _load_analysis(patterns) -> tuple[list[set[str] | None], list[int]]:
+    """Each pattern's anchors and span, from the warm cache when it is
+    current."""
+    digest = patterns_digest(patterns)
+    try:
+        cached = json.loads(ANCHOR_CACHE.read_text(encoding="utf-8"))
+        if cached.get("digest") == digest:
+            anchors = [None if a is None else set(a) for a in cached["anchors"]]
+            return anchors, cached["spans"]
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
+
+    anchors = [pattern_anchors(p.regex) for p in patterns]
+    spans = [pattern_span(p.regex) for p in patterns]
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = ANCHOR_CACHE.with_name(f".{ANCHOR_CACHE.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps({
+            "digest": digest,
+            "anchors": [None if a is None else sorted(a) for a in anchors],
+            "spans": spans,
+        }), encoding="utf-8")
+        os.replace(tmp, ANCHOR_CACHE)
+    except OSError:
+        pass  # Read-only home - just analyse the patterns each time
+    return anchors, spans
+
+
+def get_matcher() -> SecretMatcher:
+    """The registry's matcher, built once per process."""
+    global _matcher
+    if _matcher is None:
+        anchors, spans = _load_analysis(SECRET_PATTERNS)
+        _matcher = SecretMatcher([(p.regex, p.label) for p in SECRET_PATTERNS],
+                                 anchors=anchors, spans=spans)
+    return _matcher
+
+
+def get_entropy_detector() -> EntropyDetector:
+    """The registry's entropy detector, built once per process."""
+    global _entropy
+    if _entropy is None:
+        _entropy = EntropyDetector()
+    return _entropy
+
+
+def scan(text: str, stop_at_first: bool = False, timeout: float | None = None,
+         allow=None, stop_on_entropy: bool = True) -> list[tuple[str, int]]:
+    """Check text for secrets. Returns (label, count) in pattern order.
+
+    The text is scanned in chunks; with stop_at_first the scan ends at the
+    first chunk with a finding (counts then cover only the text read);
+    stop_on_entropy=False keeps going past entropy-only findings.
+    With a timeout (seconds), ScanTimeout is raised once it runs out; its
+    findings cover the text scanned so far. Matches allow() returns True
+    for are left out.
+    """
+    return scan_stream(iter_chunks(text), stop_at_first, timeout, allow, stop_on_entropy)
+
+
+def scan_stream(chunks, stop_at_first: bool = False, timeout: float | None = None,
+                allow=None, stop_on_entropy: bool = True) -> list[tuple[str, int]]:
+    """scan() for text arriving in pieces (e.g. read from a file)."""
+    deadline = None if timeout is None else time.monotonic() + timeout
+    pattern_suppress = entropy_suppress = None
+    if allow is not None:
+        def pattern_suppress(i, matched):
+            return allow(SECRET_PATTERNS[i].id, matched)
+
+        def entropy_suppress(charset, token):
+            return allow(f"entropy-{charset}", token)
+
+    entropy = get_entropy_detector().stream(entropy_suppress)
+
+    def tee(pieces):
+        for piece in pieces:
+            entropy.feed(piece)
+            yield piece
+            if stop_at_first and stop_on_entropy and entropy.counts:
+                return
+
+    try:
+        counts = get_matcher().count_stream(tee(chunks), stop_at_first, deadline, pattern_suppress)
+    except ScanTimeout as exc:
+        findings = _findings(exc.counts, entropy.counts)
+        raise ScanTimeout(exc.counts, exc.scanned, findings) from None
+    return _findings(counts, entropy.finish())
+
+
+def find_matches(text: str) -> list[tuple[str, str]]:
+    """(pattern id, matched text) for every finding scan() would report."""
+    matches = []
+
+    def collect(pattern_id, matched):
+        matches.append((pattern_id, matched))
+        return True  # Keep the hit counters out of it
+
+    scan(text, allow=collect)
+    return matches
+
+
+def _findings(counts: dict[int, int], entropy_counts: dict[str, int]) -> list[tuple[str, int]]:
+    """(label, count) pairs, patterns first, adding to HIT_COUNTS."""
+    findings = []
+    for i in sorted(counts):
+        HIT_COUNTS[SECRET_PATTERNS[i].id] += counts[i]
+        findings.append((SECRET_PATTERNS[i].label, counts[i]))
+    for charset, count in entropy_counts.items():
+        HIT_COUNTS[f"entropy-{charset}"] += count
+        findings.append((f"{ENTROPY_LABEL} ({charset})", count))
+    return findings
+
+
+def is_entropy_finding(label: str) -> bool:
+    """Did this scan() finding come from the entropy detector (not a pattern)?"""
+    return label.startswith(ENTROPY_LABEL)
+
+
+def record_hits() -> None:
+    """Add this process's hit counts to the persistent totals."""
+    if not HIT_COUNTS:
+        return
+    try:
+        totals = Counter(json.loads(HITS_FILE.read_text(encoding="utf-8")))
+    except (OSError, ValueError, TypeError):
+        totals = Counter()
+    totals.update(HIT_COUNTS)
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = HITS_FILE.with_name(f".{HITS_FILE.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(dict(totals.most_common()), indent=2), encoding="utf-8")
+        os.replace(tmp, HITS_FILE)
+    except OSError:
+        return
+    HIT_COUNTS.clear()
@@ -14,48 +14,16 @@ import re
 import sys
 from pathlib import Path
 
-# Filename patterns by note type
-# Pattern: (expected_prefix, expected_location, pattern_description)
-FILENAME_CONVENTIONS = {
-    # Current ontology - Events (in folders)
-    "Task": ("Task - ", "Tasks/", "Task - {{Title}}.md"),
-    "Project": ("Project - ", "Projects/", "Project - {{Name}}.md"),
-    "Meeting": ("Meeting - ", "Meetings/", "Meeting - YYYY-MM-DD {{Title}}.md"),
-    "ADR": ("ADR - ", "ADRs/", "ADR - {{Title}}.md"),
-    "Daily": (None, "Daily/", "YYYY-MM-DD.md"),
-    "Incubator": ("Incubator - ", "Incubator/", "Incubator - {{Title}}.md"),
-    "FormSubmission": ("FormSubmission - ", "Forms/", "FormSubmission - {{Type}} for {{Project}}.md"),
-    "Email": ("Email - ", "Emails/", "Email - {{From}} - {{Subject}}.md"),
-    "Trip": ("Trip - ", "Trips/", "Trip - {{Destination}}.md"),
-    "Workstream": ("Workstream - ", "Projects/", "Workstream - {{Name}}.md"),
-    "Forum": ("Forum - ", "Projects/", "Forum - {{Name}}.md"),
-    "Objective": ("Objective - ", "Objectives/", "Objective - {{Title}}.md"),
-    # Current ontology - Entities (root)
-    "Person": (None, "People/", "{{Name}}.md"),
-    "System": ("System - ", "root", "System - {{Name}}.md"),
-    "Organisation": ("Organisation - ", "root", "Organisation - {{Name}}.md"),
-    "DataAsset": ("DataAsset - ", "root", "DataAsset - {{Name}}.md"),
-    "Location": ("Location - ", "root", "Location - {{Name}}.md"),
-    "Department": ("Department - ", "root", "Department - {{Name}}.md"),
-    # Current ontology - Nodes (root)
-    "Concept": ("Concept - ", "root", "Concept - {{Title}}.md"),
-    "Pattern": ("Pattern - ", "root", "Pattern - {{Title}}.md"),
-    "Reference": ("Reference - ", "root", "Reference - {{Title}}.md"),
-    "Research": ("Research - ", "root", "Research - {{Title}}.md"),
-    "Threat": ("Threat - ", "root", "Threat - {{Title}}.md"),
-    "Framework": ("Framework - ", "root", "Framework - {{Title}}.md"),
-    "Tool": ("Tool - ", "root", "Tool - {{Title}}.md"),
-    "HLD": ("HLD - ", "root", "HLD - {{Title}}.md"),
-    "LLD": ("LLD - ", "root", "LLD - {{Title}}.md"),
-    # Current ontology - Navigation (root with _ prefix)
-    "MOC": ("_MOC - ", "root", "_MOC - {{Scope}}.md"),
-    "Dashboard": ("_Dashboard - ", "root", "_Dashboard - {{Scope}}.md"),
-    "Query": ("Query - ", "root", "Query - {{Name}}.md"),
-    "ArchModel": ("ArchModel - ", "root", "ArchModel - {{ViewName}}.md"),
-    # Governance (synced)
-    "Policy": ("Policy - ", "Sync/Policies/", "Policy - {{Title}}.md"),
-    "Guardrail": ("Guardrail - ", "Sync/Guardrails/", "Guardrail - {{Title}}.md"),
-}
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "lib"))
+
+from frontmatter import parse_frontmatter, read_frontmatter  # noqa: E402
+from note_types import SCHEMA  # noqa: E402
+
+# Filename patterns by note type (prefix, location, pattern) come from
+# hooks/lib/note_types.py; types without a location are not checked
+
+# Template files and special directories to skip
+SKIP_PATHS = ["Templates/", ".obsidian/", "node_modules/", ".claude/"]
 
 # Date pattern for meetings and daily notes
 DATE_PATTERN = re.compile(r'\d{4}-\d{2}-\d{2}')
@@ -66,8 +34,7 @@ ISO_DATE_PATTERN = re.compile(r'^(19|20)\d{2}-(0[1-9]|1[0-2])-(0[1-9]|[12]\d|3[0
 
 def extract_note_type(content: str) -> str:
     """Extract note type from frontmatter."""
-    match = re.search(r'type:\s*(\w+)', content)
-    return match.group(1) if match else ""
+    return parse_frontmatter(content).note_type
 
 
 def get_relative_path(file_path: str) -> tuple[str, str]:
@@ -98,10 +65,11 @@ def validate_filename(file_path: str, note_type: str) -> list[str]:
     """Validate filename against conventions for note type."""
     warnings = []
 
-    if note_type not in FILENAME_CONVENTIONS:
+    rules = SCHEMA.types.get(note_type)
+    if rules is None or rules.location is None:
         return warnings  # Unknown type, skip validation
 
-    expected_prefix, expected_location, pattern_desc = FILENAME_CONVENTIONS[note_type]
+    expected_prefix, expected_location = rules.prefix, rules.location
     folder, filename = get_relative_path(file_path)
     stem = Path(filename).stem
 
@@ -172,6 +140,28 @@ def validate_filename(file_path: str, note_type: str) -> list[str]:
     return warnings
 
 
+def build_report(file_path: str, note_type: str) -> str | None:
+    """Format filename warnings for a note. Returns None if there are none."""
+    if not note_type:
+        return None
+
+    # Validate filename
+    warnings = validate_filename(file_path, note_type)
+    if not warnings:
+        return None
+
+    output_text = f"Filename check for {Path(file_path).name}:\n"
+    for warning in warnings:
+        output_text += f"   - {warning}\n"
+
+    # Show expected pattern
+    rules = SCHEMA.types.get(note_type)
+    if rules and rules.filename:
+        output_text += f"   Expected pattern: {rules.filename}"
+
+    return output_text
+
+
 def main():
     # Startup guard: exit gracefully if no valid input
     try:
@@ -203,35 +193,18 @@ def main():
         sys.exit(0)
 
     # Skip template files and special directories
-    skip_paths = ["Templates/", ".obsidian/", "node_modules/", ".claude/"]
-    if any(skip in file_path for skip in skip_paths):
-        sys.exit(0)
-
-    # Read the file to get note type
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-    except (IOError, OSError):
+    if any(skip in file_path for skip in SKIP_PATHS):
         sys.exit(0)
 
-    note_type = extract_note_type(content)
-    if not note_type:
+    # Read the header to get note type
+    header = read_frontmatter(file_path)
+    if header is None:
         sys.exit(0)
 
-    # Validate filename
-    warnings = validate_filename(file_path, note_type)
+    output_text = build_report(file_path, header.note_type)
 
     # Output using additionalContext JSON format
-    if warnings:
-        output_text = f"Filename check for {Path(file_path).name}:\n"
-        for warning in warnings:
-            output_text += f"   - {warning}\n"
-
-        # Show expected pattern
-        if note_type in FILENAME_CONVENTIONS:
-            _, _, pattern_desc = FILENAME_CONVENTIONS[note_type]
-            output_text += f"   Expected pattern: {pattern_desc}"
-
+    if output_text:
         output = {"additionalContext": output_text}
         print(json.dumps(output))
 
@@ -3,6 +3,12 @@
 Frontmatter Validator Hook for Claude Code
 Validates YAML frontmatter in Obsidian markdown files.
 
+Parsing is done by hooks/lib/frontmatter.py (shared with the other quality
+hooks and validators). Only the header is read (up to 64 KB), however long
+the note body is.
+Once the frontmatter index is built (hooks/batch/frontmatter_index.py),
+each checked note is also recorded there.
+
 Hook Type: PostToolUse
 Matcher: Edit|Write
 Exit Codes:
@@ -10,185 +16,32 @@ Exit Codes:
 """
 
 import json
-import re
+import os
 import sys
 from datetime import datetime
 from pathlib import Path
 
-# Required fields by note type
-REQUIRED_FIELDS = {
-    # Current ontology types
-    "Task": ["type", "title", "completed", "priority"],
-    "Project": ["type", "title", "status", "priority"],
-    "Meeting": ["type", "title", "date", "attendees"],
-    "Person": ["type", "title"],
-    "ADR": ["type", "title", "status", "adrType"],
-    # Legacy types (redirect to Reference)
-    "Weblink": ["type", "title", "url"],
-    "Daily": ["type", "title", "date"],
-    "Incubator": ["type", "title", "status", "domain"],
-    "FormSubmission": ["type", "title", "formType", "status", "project"],
-    "System": ["type", "title"],
-    "MOC": ["type", "title"],
-    "Dashboard": ["type", "title"],
-    "Query": ["type", "title", "queryType"],
-    "Organisation": ["type", "title"],
-    "Policy": ["type", "title", "source", "status"],
-    "Guardrail": ["type", "title", "source", "scope", "status"],
-    # New ontology types (four pillars)
-    "Concept": ["type", "title"],
-    "Pattern": ["type", "title"],
-    "Reference": ["type", "title", "referenceType"],
-    "Location": ["type", "title"],
-    "DataAsset": ["type", "title"],
-    "Department": ["type", "title"],
-    "Workstream": ["type", "title"],
-    "Forum": ["type", "title"],
-    "ArchModel": ["type", "title"],
-    "Email": ["type", "title", "subject", "from", "date"],
-    "Trip": ["type", "title", "status"],
-    "Objective": ["type", "title", "objectiveType", "status"],
-    # Node types
-    "Research": ["type", "title"],
-    "Threat": ["type", "title"],
-    "Framework": ["type", "title"],
-    "Tool": ["type", "title"],
-    "HLD": ["type", "title"],
-    "LLD": ["type", "title"],
-    # Legacy types (still valid but consolidated)
-    "Book": ["type", "title"],
-    "YouTube": ["type", "title", "url"],
-    "Article": ["type", "title"],
-    "Capability": ["type", "title"],
-    "Theme": ["type", "title"],
-    "Principle": ["type", "title"],
-}
-
-# Valid enum values for fields
-VALID_VALUES = {
-    "status": {
-        "Task": ["active", "completed", "paused"],
-        "Project": ["active", "paused", "completed"],
-        "ADR": ["draft", "proposed", "accepted", "deprecated", "superseded"],
-        "Incubator": ["seed", "exploring", "validated", "accepted", "rejected"],
-        "FormSubmission": ["draft", "submitted", "pending", "approved", "rejected", "expired"],
-        "Objective": ["draft", "agreed", "in-progress", "reviewed", "achieved", "partial", "missed"],
-        "Article": ["idea", "drafting", "review", "published", "archived"],
-        "System": ["active", "planned", "deprecated", "retired"],
-        "Policy": ["active", "draft", "deprecated"],
-        "Guardrail": ["active", "draft", "deprecated"],
-        "Workstream": ["active", "paused", "completed"],
-        "Trip": ["idea", "planning", "booked", "completed", "cancelled"],
-    },
-    "priority": ["high", "medium", "low"],
-    "adrType": ["Technology_ADR", "Architecture_ADR", "Integration_ADR", "Security_ADR", "Data_ADR", "AI_ADR"],
-    "confidence": ["high", "medium", "low"],
-    "freshness": ["current", "recent", "stale"],
-    "source": ["primary", "secondary", "synthesis", "external", "local", "confluence"],
-    "criticality": ["critical", "high", "medium", "low"],
-    "referenceType": ["weblink", "youtube", "article", "book"],
-    "conceptType": ["concept", "principle", "capability", "theme"],
-    "articleType": ["blog-post", "linkedin-post", "talk", "presentation", "video", "podcast", "newsletter"],
-    "targetAudience": ["internal", "external", "both"],
-    "objectiveType": ["performance", "development"],
-    "goalCategory": ["cascaded", "strategic", "personal"],
-    "readingStatus": ["to-read", "reading", "completed", "abandoned", "reference"],
-    "threatType": ["attack", "vulnerability", "weakness", "exploit"],
-    "principleType": ["axiom", "heuristic", "law", "mental-model"],
-    "frameworkType": ["taxonomy", "model", "matrix", "methodology", "reference-architecture"],
-    "toolType": ["ide", "library", "framework", "platform", "service", "cli", "extension"],
-    "formType": ["DPIA", "CyberRisk", "TPRM", "IAF", "ChangeRequest", "Other"],
-    "queryType": ["table", "list", "task"],
-    "authority": ["draft", "local", "team", "organizational"],
-    "transformationType": ["modernisation", "migration", "greenfield", "integration", "decommission", "uplift"],
-    "transformationScope": ["enterprise", "department", "team", "application"],
-}
-
-# Date fields that should be ISO format
-DATE_FIELDS = ["created", "modified", "date", "reviewed", "doDate", "dueBy",
-               "submittedDate", "responseDate", "expiryDate", "publishedDate",
-               "completedDate", "effectiveDate", "reviewDate", "archivedDate"]
-
-
-def extract_frontmatter(content: str) -> tuple[dict | None, list[str]]:
-    """Extract YAML frontmatter from markdown content."""
-    errors = []
-
-    if not content.startswith("---"):
-        return None, ["No frontmatter found (file should start with ---)"]
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "lib"))
 
-    # Find closing ---
-    end_match = re.search(r'\n---\s*\n', content[3:])
-    if not end_match:
-        return None, ["Frontmatter not closed (missing closing ---)"]
+from frontmatter import parse_frontmatter, read_frontmatter  # noqa: E402
+from frontmatter_index import record_note_frontmatter  # noqa: E402
+from note_types import SCHEMA  # noqa: E402
 
-    yaml_content = content[4:end_match.start() + 3]
+# Note types, enum values and date fields come from hooks/lib/note_types.py
 
-    # Simple YAML parsing (handles most common cases)
-    frontmatter = {}
-    current_key = None
-    current_value = []
-    in_array = False
+# Required fields that may be left empty
+EMPTY_ALLOWED = frozenset({"relatedTo", "nodeRelationships", "entityRelationships",
+                           "supersedes", "dependsOn", "contradicts",
+                           "project", "attendees", "domain", "parent-ideas"})
 
-    for line in yaml_content.split('\n'):
-        stripped = line.strip()
+# Template files and special directories to skip
+SKIP_PATHS = ["Templates/", ".obsidian/", "node_modules/"]
 
-        # Skip empty lines and comments
-        if not stripped or stripped.startswith('#'):
-            continue
 
-        # Check for key: value
-        key_match = re.match(r'^([a-zA-Z_-]+):\s*(.*)', line)
-        if key_match and not line.startswith(' ') and not line.startswith('\t'):
-            # Save previous key if exists
-            if current_key:
-                if in_array:
-                    frontmatter[current_key] = current_value
-                else:
-                    frontmatter[current_key] = current_value[0] if current_value else ""
-
-            current_key = key_match.group(1)
-            value = key_match.group(2).strip()
-
-            # Check if array
-            if value.startswith('['):
-                in_array = True
-                # Inline array
-                if value.endswith(']'):
-                    # Parse inline array
-                    array_content = value[1:-1]
-                    if array_content:
-                        items = [item.strip().strip('"\'') for item in array_content.split(',')]
-                        current_value = [i for i in items if i]
-                    else:
-                        current_value = []
-                    frontmatter[current_key] = current_value
-                    current_key = None
-                    in_array = False
-                else:
-                    current_value = []
-            else:
-                in_array = False
-                # Remove quotes
-                value = value.strip('"\'')
-                current_value = [value] if value else []
-        elif in_array and stripped.startswith('-'):
-            # Array item
-            item = stripped[1:].strip().strip('"\'')
-            current_value.append(item)
-        elif current_key and (line.startswith(' ') or line.startswith('\t')):
-            # Continuation of previous value
-            if not in_array:
-                current_value.append(stripped)
-
-    # Save last key
-    if current_key:
-        if in_array:
-            frontmatter[current_key] = current_value
-        else:
-            frontmatter[current_key] = current_value[0] if current_value else ""
-
-    return frontmatter, errors
+def extract_frontmatter(content: str) -> tuple[dict | None, list[str]]:
+    """Extract YAML frontmatter from markdown content."""
+    header = parse_frontmatter(content)
+    return header.data, header.errors
 
 
 def validate_date(value: str, field_name: str) -> str | None:
@@ -220,37 +73,32 @@ def validate_frontmatter(frontmatter: dict, file_path: str) -> list[str]:
         warnings.append("Missing required field: type")
         return warnings
 
+    rules = SCHEMA.types.get(note_type)
+
     # Check required fields for this type
-    required = REQUIRED_FIELDS.get(note_type, ["type", "title"])
+    required = rules.required if rules else SCHEMA.default_required
     for field in required:
         if field not in frontmatter:
             warnings.append(f"Missing required field for {note_type}: {field}")
         elif frontmatter[field] in (None, "", "null", []):
             # Some fields can be null/empty, but warn anyway
-            if field not in ["relatedTo", "nodeRelationships", "entityRelationships",
-                           "supersedes", "dependsOn", "contradicts",
-                           "project", "attendees", "domain", "parent-ideas"]:
+            if field not in EMPTY_ALLOWED:
                 warnings.append(f"Empty value for required field: {field}")
 
-    # Validate enum values
-    for field, valid_options in VALID_VALUES.items():
-        if field in frontmatter and frontmatter[field]:
-            value = frontmatter[field]
-            if value in ('null', 'None', '', None):
-                continue
-
-            # Handle type-specific status values
-            if isinstance(valid_options, dict):
-                if note_type in valid_options:
-                    options = valid_options[note_type]
-                    if value not in options:
-                        warnings.append(f"Invalid {field} value '{value}' for {note_type}. Valid: {', '.join(options)}")
-            else:
-                if value not in valid_options:
-                    warnings.append(f"Invalid {field} value '{value}'. Valid: {', '.join(valid_options)}")
+    # Validate enum values (status values are per type)
+    value = frontmatter.get("status")
+    if rules and rules.status and value not in ('null', 'None', '', None, []):
+        if not isinstance(value, str) or value not in rules.status_set:
+            warnings.append(f"Invalid status value '{value}' for {note_type}. Valid: {', '.join(rules.status)}")
+    for field, valid_options in SCHEMA.field_values.items():
+        value = frontmatter.get(field)
+        if value in ('null', 'None', '', None, []):
+            continue
+        if not isinstance(value, str) or value not in SCHEMA.field_sets[field]:
+            warnings.append(f"Invalid {field} value '{value}'. Valid: {', '.join(valid_options)}")
 
     # Validate date fields
-    for field in DATE_FIELDS:
+    for field in SCHEMA.date_fields:
         if field in frontmatter:
             error = validate_date(frontmatter[field], field)
             if error:
@@ -268,55 +116,33 @@ def validate_frontmatter(frontmatter: dict, file_path: str) -> list[str]:
     filename = Path(file_path).stem
 
     # Type-specific filename checks
-    expected_prefixes = {
-        # Current ontology
-        "Project": "Project - ",
-        "Task": "Task - ",
-        "ADR": "ADR - ",
-        "Weblink": "Weblink - ",
-        "Incubator": "Incubator - ",
-        "FormSubmission": "FormSubmission - ",
-        "MOC": "_MOC - ",
-        "Dashboard": "_Dashboard - ",
-        "Organisation": "Organisation - ",
-        "Query": "Query - ",
-        "Policy": "Policy - ",
-        "Guardrail": "Guardrail - ",
-        # New ontology types
-        "Concept": "Concept - ",
-        "Pattern": "Pattern - ",
-        "Reference": "Reference - ",
-        "Location": "Location - ",
-        "DataAsset": "DataAsset - ",
-        "Workstream": "Workstream - ",
-        "Forum": "Forum - ",
-        "ArchModel": "ArchModel - ",
-        "Email": "Email - ",
-        "Trip": "Trip - ",
-        "System": "System - ",
-        "Department": "Department - ",
-        # Person has NO prefix — lives in People/ folder as {{Name}}.md
-        # New node types
-        "Research": "Research - ",
-        "Threat": "Threat - ",
-        "Framework": "Framework - ",
-        "Tool": "Tool - ",
-        "Objective": "Objective - ",
-        "Article": "Article - ",
-        "HLD": "HLD - ",
-        "LLD": "LLD - ",
-    }
-
-    if note_type in expected_prefixes:
-        prefix = expected_prefixes[note_type]
-        # Use removesuffix to strip " - " as a string, not individual characters
-        prefix_stem = prefix.removesuffix(" - ") if prefix.endswith(" - ") else prefix.rstrip(" ")
-        if not filename.startswith(prefix_stem):
-            warnings.append(f"Filename should start with '{prefix}' for {note_type} notes")
+    if rules and rules.prefix:
+        if not filename.startswith(rules.prefix_stem):
+            warnings.append(f"Filename should start with '{rules.prefix}' for {note_type} notes")
 
     return warnings
 
 
+def build_report(file_path: str, frontmatter: dict | None, parse_errors: list[str]) -> str | None:
+    """Format frontmatter warnings for a note. Returns None if there are none."""
+    all_warnings = parse_errors.copy()
+
+    if frontmatter:
+        all_warnings.extend(validate_frontmatter(frontmatter, file_path))
+
+    if not all_warnings:
+        return None
+
+    warning_text = f"📋 Frontmatter validation for {Path(file_path).name}:\n"
+    warning_text += "\n".join(f"   ⚠️  {w}" for w in all_warnings)
+    return warning_text
+
+
+def record_frontmatter(file_path: str, frontmatter: dict | None) -> None:
+    """Update the frontmatter index with this note's header (if built)."""
+    record_note_frontmatter(Path(os.environ.get("CLAUDE_PROJECT_DIR", ".")), file_path, frontmatter)
+
+
 def main():
     # Startup guard: exit gracefully if no valid input
     try:
@@ -349,30 +175,21 @@ def main():
         sys.exit(0)
 
     # Skip template files and special directories
-    skip_paths = ["Templates/", ".obsidian/", "node_modules/"]
-    if any(skip in file_path for skip in skip_paths):
+    if any(skip in file_path for skip in SKIP_PATHS):
         sys.exit(0)
 
-    # Read the file
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-    except (IOError, OSError):
+    # Read the header
+    header = read_frontmatter(file_path)
+    if header is None:
         sys.exit(0)
 
-    # Extract and validate frontmatter
-    frontmatter, parse_errors = extract_frontmatter(content)
+    record_frontmatter(file_path, header.data)
 
-    all_warnings = parse_errors.copy()
-
-    if frontmatter:
-        all_warnings.extend(validate_frontmatter(frontmatter, file_path))
+    # Validate frontmatter
+    warning_text = build_report(file_path, header.data, header.errors)
 
     # Output warnings using v2.1.9 additionalContext
-    if all_warnings:
-        warning_text = f"📋 Frontmatter validation for {Path(file_path).name}:\n"
-        warning_text += "\n".join(f"   ⚠️  {w}" for w in all_warnings)
-
+    if warning_text:
         # Return additionalContext to inform Claude about issues
         output = {
             "additionalContext": warning_text
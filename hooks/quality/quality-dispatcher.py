@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Quality Dispatcher Hook for Claude Code
+Runs all four note quality checks from one process and one file read.
+
+Replaces this PostToolUse chain:
+  frontmatter-validator.py, tag-taxonomy-enforcer.py,
+  wiki-link-checker.py, filename-convention-checker.py
+
+The payload is parsed once, the note is read once and its frontmatter, tags,
+type and links are extracted once into a ParsedNote. Each check then formats
+its report from that shared object, and the reports are merged into a single
+additionalContext. Each check keeps its own SKIP_PATHS.
+
+Hook Type: PostToolUse
+Matcher: Edit|Write
+Exit Codes:
+  0 - Always (non-blocking, provides warnings via stdout)
+"""
+
+import json
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "lib"))
+
+from frontmatter import parse_frontmatter  # noqa: E402
+from hook_runner import load_hook_module  # noqa: E402
+
+# Customise: checks to run, in output order (comment out to disable)
+CHECKS = [
+    "quality/frontmatter-validator.py",
+    "quality/tag-taxonomy-enforcer.py",
+    "quality/wiki-link-checker.py",
+    "quality/filename-convention-checker.py",
+]
+
+
+@dataclass
+class ParsedNote:
+    """Everything the quality checks need from one note, extracted once."""
+    file_path: str
+    content: str
+    frontmatter: dict | None = None
+    parse_errors: list[str] = field(default_factory=list)
+    tags: list[str] = field(default_factory=list)
+    note_type: str = ""
+    body_links: list[tuple[str, int]] = field(default_factory=list)
+    frontmatter_links: list[str] = field(default_factory=list)
+
+
+def parse_note(file_path: str, content: str, checks: dict) -> ParsedNote:
+    """Extract the fields used by the enabled checks."""
+    note = ParsedNote(file_path=file_path, content=content)
+
+    # One header parse serves the frontmatter, tag and filename checks
+    header = parse_frontmatter(content)
+    note.frontmatter, note.parse_errors = header.data, header.errors
+    note.tags = header.tags
+    note.note_type = header.note_type
+
+    if "quality/wiki-link-checker.py" in checks:
+        module = checks["quality/wiki-link-checker.py"]
+        note.body_links = module.extract_wiki_links(content)
+        note.frontmatter_links = module.extract_frontmatter_links(content)
+
+    return note
+
+
+def run_check(name: str, module, note: ParsedNote) -> str | None:
+    """Run one check against the shared note. Returns its report text."""
+    if name == "quality/frontmatter-validator.py":
+        module.record_frontmatter(note.file_path, note.frontmatter)
+        return module.build_report(note.file_path, note.frontmatter, note.parse_errors)
+
+    if name == "quality/tag-taxonomy-enforcer.py":
+        return module.build_report(note.file_path, note.tags, note.note_type)
+
+    if name == "quality/wiki-link-checker.py":
+        vault_root = module.get_vault_root(note.file_path)
+        if not vault_root:
+            return None
+        module.record_links(vault_root, note.file_path, note.body_links, note.frontmatter_links)
+        if not note.body_links and not note.frontmatter_links:
+            return None
+        note_index = module.get_note_index(vault_root)
+        return module.build_report(note.file_path, note.body_links,
+                                   note.frontmatter_links, note_index)
+
+    if name == "quality/filename-convention-checker.py":
+        return module.build_report(note.file_path, note.note_type)
+
+    return None
+
+
+def main():
+    # Startup guard: exit gracefully if no valid input
+    try:
+        raw_input = sys.stdin.read()
+        if not raw_input or not raw_input.strip():
+            sys.exit(0)
+        input_data = json.loads(raw_input)
+    except (json.JSONDecodeError, ValueError, EOFError):
+        sys.exit(0)
+    except Exception:
+        sys.exit(0)
+
+    tool_name = input_data.get("tool_name", "")
+    file_path = input_data.get("tool_input", {}).get("file_path", "")
+
+    # Only check after Edit or Write on markdown files
+    if tool_name not in ("Edit", "Write"):
+        sys.exit(0)
+
+    if not file_path or not file_path.endswith(".md"):
+        sys.exit(0)
+
+    # Only validate files inside the Obsidian vault.
+    # Hooks fire for ALL Edit/Write operations regardless of target repo.
+    VAULT_ROOT = "."
+    if not file_path.startswith(VAULT_ROOT):
+        sys.exit(0)
+
+    checks = {name: load_hook_module(name) for name in CHECKS}
+
+    # Skip early if every check would skip this path
+    active = {
+        name: module for name, module in checks.items()
+        if not any(skip in file_path for skip in module.SKIP_PATHS)
+    }
+    if not active:
+        sys.exit(0)
+
+    # Read the file (once, for all checks)
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+    except (IOError, OSError):
+        sys.exit(0)
+
+    note = parse_note(file_path, content, active)
+
+    reports = []
+    for name, module in active.items():
+        report = run_check(name, module, note)
+        if report:
+            reports.append(report)
+
+    # Output using additionalContext JSON format
+    if reports:
+        output = {"additionalContext": "\n\n".join(reports)}
+        print(json.dumps(output))
+
+    # Always exit 0 - validation is non-blocking
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -10,10 +10,13 @@ Exit Codes:
 """
 
 import json
-import re
 import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "lib"))
+
+from frontmatter import parse_frontmatter, read_frontmatter  # noqa: E402
+
 # Valid hierarchical tag prefixes
 VALID_HIERARCHIES = {
     "activity": [
@@ -87,49 +90,18 @@ MINIMUM_TAGS = {
     "Department": {"required": [], "recommended": ["domain"]},
 }
 
+# Template files and special directories to skip
+SKIP_PATHS = ["Templates/", ".obsidian/", "node_modules/", ".claude/"]
+
 
 def extract_tags(content: str) -> list[str]:
     """Extract tags from frontmatter."""
-    # Find frontmatter
-    if not content.startswith("---"):
-        return []
-
-    end_match = re.search(r'\n---\s*\n', content[3:])
-    if not end_match:
-        return []
-
-    frontmatter = content[4:end_match.start() + 3]
-
-    # Find tags line(s)
-    tags = []
-
-    # Match inline array: tags: [tag1, tag2]
-    inline_match = re.search(r'tags:\s*\[(.*?)\]', frontmatter, re.DOTALL)
-    if inline_match:
-        tags_str = inline_match.group(1)
-        # Split by comma, clean up
-        for tag in tags_str.split(','):
-            tag = tag.strip().strip('"\'')
-            if tag:
-                tags.append(tag)
-        return tags
-
-    # Match multi-line array
-    multiline_match = re.search(r'tags:\s*\n((?:\s+-\s+.*\n?)+)', frontmatter)
-    if multiline_match:
-        for line in multiline_match.group(1).split('\n'):
-            if line.strip().startswith('-'):
-                tag = line.strip()[1:].strip().strip('"\'')
-                if tag:
-                    tags.append(tag)
-
-    return tags
+    return parse_frontmatter(content).tags
 
 
 def extract_note_type(content: str) -> str:
     """Extract note type from frontmatter."""
-    match = re.search(r'type:\s*(\w+)', content)
-    return match.group(1) if match else ""
+    return parse_frontmatter(content).note_type
 
 
 def validate_tag(tag: str) -> tuple[bool, str]:
@@ -210,6 +182,39 @@ def check_tag_coverage(tags: list[str], note_type: str) -> list[str]:
     return warnings
 
 
+def build_report(file_path: str, tags: list[str], note_type: str) -> str | None:
+    """Format tag warnings for a note. Returns None if there are none."""
+    if not tags:
+        # No tags is not necessarily an error
+        return None
+
+    warnings = []
+    infos = []
+
+    # Validate each tag
+    for tag in tags:
+        is_valid, message = validate_tag(tag)
+        if message:
+            if message.startswith("Note:"):
+                infos.append(message)
+            else:
+                warnings.append(message)
+
+    # Check tag coverage
+    coverage_warnings = check_tag_coverage(tags, note_type)
+    warnings.extend(coverage_warnings)
+
+    if not warnings and not infos:
+        return None
+
+    output_text = f"🏷️  Tag validation for {Path(file_path).name}:\n"
+    for warning in warnings:
+        output_text += f"   ⚠️  {warning}\n"
+    for info in infos:
+        output_text += f"   ℹ️  {info}\n"
+    return output_text.strip()
+
+
 def main():
     # Startup guard: exit gracefully if no valid input
     try:
@@ -242,52 +247,21 @@ def main():
         sys.exit(0)
 
     # Skip template files and special directories
-    skip_paths = ["Templates/", ".obsidian/", "node_modules/", ".claude/"]
-    if any(skip in file_path for skip in skip_paths):
-        sys.exit(0)
-
-    # Read the file
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-    except (IOError, OSError):
+    if any(skip in file_path for skip in SKIP_PATHS):
         sys.exit(0)
 
-    # Extract tags and note type
-    tags = extract_tags(content)
-    note_type = extract_note_type(content)
-
-    if not tags:
-        # No tags is not necessarily an error
+    # Read the header
+    header = read_frontmatter(file_path)
+    if header is None:
         sys.exit(0)
 
-    warnings = []
-    infos = []
-
-    # Validate each tag
-    for tag in tags:
-        is_valid, message = validate_tag(tag)
-        if message:
-            if message.startswith("Note:"):
-                infos.append(message)
-            else:
-                warnings.append(message)
-
-    # Check tag coverage
-    coverage_warnings = check_tag_coverage(tags, note_type)
-    warnings.extend(coverage_warnings)
+    output_text = build_report(file_path, header.tags, header.note_type)
 
     # Output using v2.1.9 additionalContext
-    if warnings or infos:
-        output_text = f"🏷️  Tag validation for {Path(file_path).name}:\n"
-        for warning in warnings:
-            output_text += f"   ⚠️  {warning}\n"
-        for info in infos:
-            output_text += f"   ℹ️  {info}\n"
-
+    if output_text:
         # Return additionalContext to inform Claude about tag issues
         output = {
-            "additionalContext": output_text.strip()
+            "additionalContext": output_text
         }
         print(json.dumps(output))
 
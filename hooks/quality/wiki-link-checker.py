@@ -10,13 +10,17 @@ Exit Codes:
 """
 
 import json
-import os
 import re
 import sys
 from pathlib import Path
 
-# Cache for vault notes (refreshed per invocation)
-_vault_notes_cache = None
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "lib"))
+
+from link_graph import record_note_links  # noqa: E402
+from note_index import NoteIndex, load_note_index  # noqa: E402
+
+# Template files and special directories to skip
+SKIP_PATHS = ["Templates/", ".obsidian/", "node_modules/"]
 
 
 def get_vault_root(file_path: str) -> Path | None:
@@ -31,33 +35,24 @@ def get_vault_root(file_path: str) -> Path | None:
     return None
 
 
-def get_vault_notes(vault_root: Path) -> set[str]:
-    """Get all note names (without .md extension) in the vault."""
-    global _vault_notes_cache
-
-    if _vault_notes_cache is not None:
-        return _vault_notes_cache
-
-    notes = set()
-
-    # Directories to skip
-    skip_dirs = {".obsidian", ".git", "node_modules", ".claude"}
-
-    for root, dirs, files in os.walk(vault_root):
-        # Skip hidden and special directories
-        dirs[:] = [d for d in dirs if d not in skip_dirs and not d.startswith('.')]
+def get_note_index(vault_root: Path) -> NoteIndex:
+    """Get the vault's note index.
 
-        for file in files:
-            if file.endswith(".md"):
-                # Store note name without extension
-                note_name = file[:-3]
-                notes.add(note_name)
+    Uses the persistent note index (.claude/cache/note-index.sqlite), which
+    only rescans directories whose mtime changed since the last hook run.
+    """
+    return load_note_index(vault_root)
 
-                # Also store with common variations
-                # Handle aliases if we want to support them in future
 
-    _vault_notes_cache = notes
-    return notes
+def record_links(vault_root: Path, file_path: str, body_links: list[tuple[str, int]],
+                 frontmatter_links: list[str]) -> None:
+    """Update the backlink graph with this note's current links (if built)."""
+    try:
+        rel_path = Path(file_path).resolve().relative_to(vault_root).as_posix()
+    except ValueError:
+        return
+    record_note_links(vault_root, rel_path,
+                      [link_target for link_target, _ in body_links] + frontmatter_links)
 
 
 def extract_wiki_links(content: str) -> list[tuple[str, int]]:
@@ -100,55 +95,55 @@ def extract_frontmatter_links(content: str) -> list[str]:
     return links
 
 
-def check_link_exists(link_target: str, vault_notes: set[str]) -> bool:
-    """Check if a link target exists in the vault."""
-    # Direct match
-    if link_target in vault_notes:
-        return True
-
-    # Try with common prefixes removed/added (all ontology types)
-    prefixes = [
-        # Entities
-        "System - ", "Organisation - ", "DataAsset - ", "Location - ", "Department - ",
-        # Person has NO prefix (lives in People/ as {{Name}}.md)
-        # Nodes
-        "Concept - ", "Pattern - ", "Capability - ", "Theme - ", "Weblink - ",
-        "Book - ", "Research - ", "YouTube - ", "Threat - ", "Principle - ",
-        "Framework - ", "Tool - ", "Article - ", "Reference - ", "HLD - ", "LLD - ",
-        # Events
-        "Meeting - ", "Project - ", "Task - ", "ADR - ", "Email - ", "Trip - ",
-        "Daily - ", "Incubator - ", "Workstream - ", "Forum - ", "FormSubmission - ",
-        "Objective - ",
-        # Navigation
-        "_MOC - ", "_Dashboard - ", "Query - ", "ArchModel - ",
-    ]
-
-    # If link has a prefix, try without
-    for prefix in prefixes:
-        if link_target.startswith(prefix):
-            without_prefix = link_target[len(prefix):]
-            if without_prefix in vault_notes:
-                return True
-
-    # If link doesn't have prefix, try with common ones
-    for prefix in prefixes:
-        with_prefix = prefix + link_target
-        if with_prefix in vault_notes:
-            return True
-
-    # Handle heading links [[Note#Heading]]
-    if '#' in link_target:
-        note_part = link_target.split('#')[0]
-        if note_part in vault_notes:
-            return True
-
-    # Handle block references [[Note^block-id]]
-    if '^' in link_target:
-        note_part = link_target.split('^')[0]
-        if note_part in vault_notes:
-            return True
-
-    return False
+def check_link_exists(link_target: str, note_index: NoteIndex) -> bool:
+    """Check if a link target exists in the vault.
+
+    Ontology prefixes (LINK_PREFIXES in hooks/lib/note_index.py) may be added
+    or dropped and headings/block references are ignored, using one indexed
+    lookup on the note's bare name (see note_index.link_resolves()).
+    """
+    return note_index.resolves(link_target)
+
+
+def build_report(file_path: str, body_links: list[tuple[str, int]],
+                 frontmatter_links: list[str], note_index: NoteIndex) -> str | None:
+    """Format broken-link warnings for a note. Returns None if all links resolve."""
+    broken_links = []
+    warnings = []
+
+    # Resolve every link in one query
+    resolved = note_index.resolve_links(
+        [link_target for link_target, _ in body_links] + frontmatter_links)
+
+    # Check body links
+    for link_target, line_num in body_links:
+        if not resolved[link_target]:
+            broken_links.append(f"Line {line_num}: [[{link_target}]]")
+
+    # Check frontmatter links
+    for link_target in frontmatter_links:
+        if not resolved[link_target]:
+            warnings.append(f"Frontmatter: [[{link_target}]]")
+
+    if not broken_links and not warnings:
+        return None
+
+    output_text = f"Wiki-link check for {Path(file_path).name}:\n"
+
+    if broken_links:
+        output_text += f"   Broken links found ({len(broken_links)}):\n"
+        for link in broken_links[:5]:  # Limit output
+            output_text += f"      - {link}\n"
+        if len(broken_links) > 5:
+            output_text += f"      - ... and {len(broken_links) - 5} more\n"
+
+    if warnings:
+        output_text += "   Broken frontmatter links:\n"
+        for warning in warnings[:3]:
+            output_text += f"      - {warning}\n"
+
+    output_text += "   Create missing notes or check spelling"
+    return output_text
 
 
 def main():
@@ -182,8 +177,7 @@ def main():
         sys.exit(0)
 
     # Skip template files
-    skip_paths = ["Templates/", ".obsidian/", "node_modules/"]
-    if any(skip in file_path for skip in skip_paths):
+    if any(skip in file_path for skip in SKIP_PATHS):
         sys.exit(0)
 
     # Find vault root
@@ -192,7 +186,7 @@ def main():
         sys.exit(0)
 
     # Get all notes in vault
-    vault_notes = get_vault_notes(vault_root)
+    note_index = get_note_index(vault_root)
 
     # Read the file
     try:
@@ -204,38 +198,12 @@ def main():
     # Extract and check links
     body_links = extract_wiki_links(content)
     frontmatter_links = extract_frontmatter_links(content)
+    record_links(vault_root, file_path, body_links, frontmatter_links)
 
-    broken_links = []
-    warnings = []
-
-    # Check body links
-    for link_target, line_num in body_links:
-        if not check_link_exists(link_target, vault_notes):
-            broken_links.append(f"Line {line_num}: [[{link_target}]]")
-
-    # Check frontmatter links
-    for link_target in frontmatter_links:
-        if not check_link_exists(link_target, vault_notes):
-            warnings.append(f"Frontmatter: [[{link_target}]]")
+    output_text = build_report(file_path, body_links, frontmatter_links, note_index)
 
     # Output using additionalContext JSON format
-    if broken_links or warnings:
-        output_text = f"Wiki-link check for {Path(file_path).name}:\n"
-
-        if broken_links:
-            output_text += f"   Broken links found ({len(broken_links)}):\n"
-            for link in broken_links[:5]:  # Limit output
-                output_text += f"      - {link}\n"
-            if len(broken_links) > 5:
-                output_text += f"      - ... and {len(broken_links) - 5} more\n"
-
-        if warnings:
-            output_text += "   Broken frontmatter links:\n"
-            for warning in warnings[:3]:
-                output_text += f"      - {warning}\n"
-
-        output_text += "   Create missing notes or check spelling"
-
+    if output_text:
         output = {"additionalContext": output_text}
         print(json.dumps(output))
 
@@ -5,6 +5,12 @@ Blocks edits to sensitive files.
 
 Hook Type: PreToolUse
 Matcher: Edit|Write
+
+The lists below are compiled once into a PathPolicy (see its docstring) and
+decisions are memoised per path. classify_paths() checks many paths in one
+call; hooks/batch/protected_paths.py uses it for pre-commit checks and
+vault sweeps.
+
 Exit Codes:
   0 - Success (file is safe to edit)
   1 - Error (non-blocking)
@@ -12,8 +18,10 @@ Exit Codes:
 """
 
 import json
+import os
 import re
 import sys
+from functools import lru_cache
 
 # Files and paths to protect
 PROTECTED_PATHS = [
@@ -116,58 +124,179 @@ ALLOWED_PREFIXES = [
 ]
 
 
+class PathPolicy:
+    """The lists above, compiled once.
+
+    Protected names, directories and suffixes become set/dict lookups,
+    ALLOWED_DIRECTORIES a trie over path segments, and both keyword lists a
+    single regex. Decisions match checking the lists in order, with one
+    difference: an allowed directory matches whole path segments only, so
+    "Secrets/" allows "Secrets/api.md" but not "MySecrets/api.md" (a plain
+    substring check allowed both). When several protected rules match, the
+    reason names the one listed first.
+    """
+
+    def __init__(self):
+        self.exceptions = frozenset(ALLOWED_EXCEPTIONS)
+        self.prefixes = tuple(ALLOWED_PREFIXES)
+
+        # Segment trie: {"segment": {...}, _END: True} for each allowed directory
+        self.allowed_dirs: dict = {}
+        for allowed_dir in ALLOWED_DIRECTORIES:
+            node = self.allowed_dirs
+            for segment in allowed_dir.strip("/").split("/"):
+                node = node.setdefault(segment, {})
+            node[_END] = True
+
+        # Protected rules by kind -> position in PROTECTED_PATHS
+        self.suffixes: dict[str, int] = {}
+        self.dirs: dict[str, int] = {}
+        self.names: dict[str, int] = {}
+        self.tails: dict[str, int] = {}  # Entries containing "/", matched against the path end
+        for i, protected in enumerate(PROTECTED_PATHS):
+            if protected.startswith("*"):
+                self.suffixes.setdefault(protected[1:], i)
+            elif protected.endswith("/"):
+                self.dirs.setdefault(protected[:-1], i)
+            elif "/" in protected:
+                self.tails.setdefault("/" + protected, i)
+            else:
+                self.names.setdefault(protected, i)
+        self.suffix_tuple = tuple(self.suffixes)
+        self.tail_tuple = tuple(self.tails)
+
+        # Any keyword at all; the reason is then taken from the lists in order
+        keyword_alternatives = [re.escape(k) for k in SENSITIVE_FILENAME_KEYWORDS]
+        keyword_alternatives += [rf"\b{re.escape(k)}\b" for k in SENSITIVE_WHOLE_WORD_KEYWORDS]
+        self.keywords = re.compile("|".join(keyword_alternatives)) if keyword_alternatives else None
+        self.whole_words = [(k, re.compile(rf"\b{re.escape(k)}\b")) for k in SENSITIVE_WHOLE_WORD_KEYWORDS]
+
+    def in_allowed_dir(self, dir_parts: tuple[str, ...]) -> bool:
+        """Does an allowed directory appear as consecutive path segments?"""
+        root = self.allowed_dirs
+        for start, part in enumerate(dir_parts):
+            node = root.get(part)
+            if node is None:
+                continue
+            for segment in dir_parts[start + 1:]:
+                if _END in node:
+                    break
+                node = node.get(segment)
+                if node is None:
+                    break
+            if node is not None and _END in node:
+                return True
+        return False
+
+    def protected_rule(self, file_path: str, parts: tuple[str, ...], filename: str) -> int | None:
+        """Position in PROTECTED_PATHS of the first rule matching, or None."""
+        hits = []
+        if self.suffix_tuple and file_path.endswith(self.suffix_tuple):
+            hits += [i for suffix, i in self.suffixes.items() if file_path.endswith(suffix)]
+        if filename in self.names:
+            hits.append(self.names[filename])
+        if self.tail_tuple and file_path.endswith(self.tail_tuple):
+            hits += [i for tail, i in self.tails.items() if file_path.endswith(tail)]
+        hits += [self.dirs[part] for part in parts if part in self.dirs]
+        return min(hits) if hits else None
+
+    def sensitive_keyword(self, filename_lower: str) -> str | None:
+        if self.keywords is None or not self.keywords.search(filename_lower):
+            return None
+        for keyword in SENSITIVE_FILENAME_KEYWORDS:
+            if keyword in filename_lower:
+                return keyword
+        for keyword, pattern in self.whole_words:
+            if pattern.search(filename_lower):
+                return keyword
+        return None
+
+
+_END = object()
+_policy: PathPolicy | None = None
+
+
+def get_policy() -> PathPolicy:
+    global _policy
+    if _policy is None:
+        _policy = PathPolicy()
+    return _policy
+
+
+def split_path(file_path: str) -> tuple[str, ...]:
+    """Path segments, as Path(file_path).parts gives them but without the
+    object (this is most of the cost of a check)."""
+    if os.altsep:
+        file_path = file_path.replace(os.altsep, os.sep)
+    return tuple(part for part in file_path.split(os.sep) if part and part != ".")
+
+
+@lru_cache(maxsize=4096)
 def is_protected(file_path: str) -> tuple[bool, str]:
     """Check if file path matches any protected pattern."""
-    from pathlib import Path
+    policy = get_policy()
 
     # Normalize path for consistent matching
-    path_parts = Path(file_path).parts
-    filename = Path(file_path).name
-    filename_lower = filename.lower()
+    path_parts = split_path(file_path)
+    filename = path_parts[-1] if path_parts else ""
 
     # Check for allowed exceptions first
-    if filename in ALLOWED_EXCEPTIONS:
+    if filename in policy.exceptions:
         return False, ""
 
-    # Check if file is in an allowed directory
-    for allowed_dir in ALLOWED_DIRECTORIES:
-        if allowed_dir in file_path:
-            return False, ""
+    # Check if file is in an allowed directory (raw segments, so "a//b" does
+    # not count as "a/b/")
+    if policy.in_allowed_dir(tuple(file_path.split(os.sep)[:-1])):
+        return False, ""
 
     # Check if file has an allowed prefix (Task notes, Page notes about security)
-    for prefix in ALLOWED_PREFIXES:
-        if filename.startswith(prefix):
-            return False, ""
+    if filename.startswith(policy.prefixes):
+        return False, ""
 
     # Check protected paths
-    for protected in PROTECTED_PATHS:
+    rule = policy.protected_rule(file_path, path_parts, filename)
+    if rule is not None:
+        protected = PROTECTED_PATHS[rule]
         if protected.startswith("*"):
-            # Wildcard suffix match (e.g., *.pem)
-            if file_path.endswith(protected[1:]):
-                return True, f"Protected file type: {protected}"
-        elif protected.endswith("/"):
-            # Directory match - check if directory appears as a path segment
-            dir_name = protected[:-1]
-            if dir_name in path_parts:
-                return True, f"Protected directory: {protected}"
-        else:
-            # Exact filename match (not substring)
-            if filename == protected or file_path.endswith("/" + protected):
-                return True, f"Protected file: {protected}"
-
-    # Check for sensitive keywords in filename (case-insensitive substring match)
-    for keyword in SENSITIVE_FILENAME_KEYWORDS:
-        if keyword in filename_lower:
-            return True, f"Sensitive keyword in filename: '{keyword}'"
-
-    # Check for whole-word sensitive keywords (avoids "pin" in "Mapping", "pat" in "Pattern")
-    for keyword in SENSITIVE_WHOLE_WORD_KEYWORDS:
-        if re.search(rf'\b{re.escape(keyword)}\b', filename_lower):
-            return True, f"Sensitive keyword in filename: '{keyword}'"
+            return True, f"Protected file type: {protected}"
+        if protected.endswith("/"):
+            return True, f"Protected directory: {protected}"
+        return True, f"Protected file: {protected}"
+
+    # Check for sensitive keywords in filename (substring, plus whole-word
+    # keywords that avoid "pin" in "Mapping", "pat" in "Pattern")
+    keyword = policy.sensitive_keyword(filename.lower())
+    if keyword is not None:
+        return True, f"Sensitive keyword in filename: '{keyword}'"
 
     return False, ""
 
 
+def classify_paths(paths) -> list[tuple[str, bool, str]]:
+    """is_protected() for many paths at once: (path, blocked, reason) each."""
+    return [(path, *is_protected(path)) for path in paths]
+
+
+def decide(file_path: str) -> dict | None:
+    """Hook output for an edit to file_path: a block decision, a config
+    hint (additionalContext), or None."""
+    is_blocked, reason = is_protected(file_path)
+
+    if is_blocked:
+        # v2.1.9: Return structured output with decision
+        return {
+            "decision": "block",
+            "reason": f"🛡️ {reason}\nFile: {file_path}\nUse --force or edit manually if you really need to modify this file."
+        }
+
+    # v2.1.9: Return additionalContext for allowed files with hints
+    if any(kw in file_path.lower() for kw in ["config", "settings", "setup"]):
+        return {
+            "additionalContext": f"Note: {file_path} may contain configuration. Ensure no secrets are included."
+        }
+    return None
+
+
 def main():
     # Startup guard: exit gracefully if no valid input
     try:
@@ -192,22 +321,8 @@ def main():
     if not file_path:
         sys.exit(0)
 
-    is_blocked, reason = is_protected(file_path)
-
-    if is_blocked:
-        # v2.1.9: Return structured output with decision
-        output = {
-            "decision": "block",
-            "reason": f"🛡️ {reason}\nFile: {file_path}\nUse --force or edit manually if you really need to modify this file."
-        }
-        print(json.dumps(output))
-        sys.exit(0)
-
-    # v2.1.9: Return additionalContext for allowed files with hints
-    if any(kw in file_path.lower() for kw in ["config", "settings", "setup"]):
-        output = {
-            "additionalContext": f"Note: {file_path} may contain configuration. Ensure no secrets are included."
-        }
+    output = decide(file_path)
+    if output is not None:
         print(json.dumps(output))
 
     sys.exit(0)
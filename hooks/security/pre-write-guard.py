@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Pre-Write Guard Hook for Claude Code
+Runs the path check and the secret scan for a write from one process.
+
+Replaces this PreToolUse chain:
+  file-protection.py, secret-file-scanner.py
+
+The payload is parsed once and the cheap check runs first: file-protection's
+compiled path policy (microseconds). Only when the path is allowed is the
+secret scanner loaded and the content scanned, so writes to protected files
+are blocked without importing the pattern registry at all. The two hooks'
+rules, messages and customisation points are unchanged; this only decides
+the order and returns a single decision.
+
+Hook Type: PreToolUse
+Matcher: Edit|Write
+Exit Codes:
+  0 - Success (write allowed, or decision output provided)
+  1 - Error (non-blocking)
+  2 - Block (protected file or secrets in content)
+"""
+
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "lib"))
+
+from hook_runner import load_hook_module  # noqa: E402
+
+
+def decide(tool_name: str, tool_input: dict) -> dict | None:
+    """Merged decision: path block, then secret block, then the path hint
+    and any secret warning."""
+    if tool_name not in ("Edit", "Write"):
+        return None
+
+    # Cheapest check first - a blocked path needs no content scan
+    hint = None
+    file_path = tool_input.get("file_path", "")
+    if file_path:
+        hint = load_hook_module("security/file-protection.py").decide(file_path)
+        if hint is not None and hint.get("decision") == "block":
+            return hint
+
+    scanner = load_hook_module("security/secret-file-scanner.py")
+    scanned = scanner.decide(tool_name, tool_input)
+    if scanned is None or scanned.get("decision") == "block":
+        return scanned or hint
+
+    # Entropy warning: keep the path hint alongside it
+    if hint is not None:
+        scanned["additionalContext"] = f"{hint['additionalContext']}\n{scanned['additionalContext']}"
+    return scanned
+
+
+def main():
+    # Startup guard: exit gracefully if no valid input
+    try:
+        raw_input = sys.stdin.read()
+        if not raw_input or not raw_input.strip():
+            sys.exit(0)
+        input_data = json.loads(raw_input)
+    except (json.JSONDecodeError, ValueError, EOFError):
+        sys.exit(0)
+    except Exception:
+        sys.exit(0)
+
+    output = decide(input_data.get("tool_name", ""), input_data.get("tool_input", {}))
+    if output is not None:
+        print(json.dumps(output))
+
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,21 @@ Secret Detection Hook for Claude Code
 Detects potential secrets in user prompts and blocks them from being sent.
 
 Hook Type: UserPromptSubmit
+
+Every pattern is matched in bounded time (see hooks/lib/secret_matcher.py),
+and the whole scan has a time budget so a huge paste cannot run into the
+hook timeout. When the budget runs out the fail policy decides: "closed"
+blocks the prompt, "open" lets it through with a warning. Findings in the
+part already scanned always block.
+
+Bare high-entropy tokens (hooks/lib/entropy.py) have no keyword to confirm
+them, so by default they only warn: the prompt is sent, and Claude is told
+it may contain a credential. Set ENTROPY_POLICY to "block" to block them.
+
+Findings allowlisted for prompts (or for any path) in the project's
+.claude/secret-allowlist.json are not reported; see
+hooks/batch/secret_baseline.py.
+
 Exit Codes:
   0 - Success (prompt is safe or decision output provided)
   1 - Error (non-blocking)
@@ -11,68 +26,64 @@ Exit Codes:
 """
 
 import json
-import re
+import os
 import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "lib"))
+
+from secret_allowlist import PROMPT_PATH, load_allowlist  # noqa: E402
+from secret_matcher import ScanTimeout  # noqa: E402
+from secret_patterns import is_entropy_finding, record_hits, scan  # noqa: E402
+
+# Customise: seconds the scan may take (the hook itself times out at 10s)
+SCAN_TIME_BUDGET = 3.0
+
+# Customise: "closed" blocks a prompt that could not be scanned in time,
+# "open" allows it. Overridden by the environment variable below.
+FAIL_POLICY = "closed"
+FAIL_POLICY_ENV_VAR = "CLAUDE_SECRET_SCAN_FAIL_POLICY"
+
+# Customise: "warn" lets prompts whose only findings are high-entropy tokens
+# through with a warning, "block" blocks them. Overridden by the variable below.
+ENTROPY_POLICY = "warn"
+ENTROPY_POLICY_ENV_VAR = "CLAUDE_SECRET_SCAN_ENTROPY_POLICY"
+
+
+def fail_policy() -> str:
+    policy = os.environ.get(FAIL_POLICY_ENV_VAR, FAIL_POLICY).strip().lower()
+    return policy if policy in ("open", "closed") else FAIL_POLICY
+
+
+def entropy_policy() -> str:
+    policy = os.environ.get(ENTROPY_POLICY_ENV_VAR, ENTROPY_POLICY).strip().lower()
+    return policy if policy in ("warn", "block") else ENTROPY_POLICY
+
 
-# Patterns that indicate potential secrets
-SECRET_PATTERNS = [
-    # Explicit key-value patterns
-    (r"(?i)\b(password|passwd|pwd)\s*[:=]\s*\S+", "password"),
-    (r"(?i)\b(secret|api_?secret)\s*[:=]\s*\S+", "secret"),
-    (r"(?i)\b(api_?key|apikey)\s*[:=]\s*\S+", "API key"),
-    (r"(?i)\b(token|auth_?token|access_?token)\s*[:=]\s*\S+", "token"),
-    (r"(?i)\b(private_?key)\s*[:=]\s*\S+", "private key"),
-
-    # Common API key formats
-    (r"sk-[a-zA-Z0-9]{20,}", "OpenAI API key"),
-    (r"sk-ant-[a-zA-Z0-9-]{20,}", "Anthropic API key"),
-    (r"ghp_[a-zA-Z0-9]{36}", "GitHub personal access token"),
-    (r"gho_[a-zA-Z0-9]{36}", "GitHub OAuth token"),
-    (r"ghs_[a-zA-Z0-9]{36}", "GitHub server token"),
-    (r"AKIA[0-9A-Z]{16}", "AWS access key ID"),
-    (r"(?i)aws_secret_access_key\s*[:=]\s*\S+", "AWS secret key"),
-
-    # Notion tokens (internal integration tokens)
-    (r"ntn_[a-zA-Z0-9]{40,}", "Notion integration token"),
-    (r"secret_[a-zA-Z0-9]{40,}", "Notion internal token"),
-
-    # Atlassian/Confluence tokens
-    (r"(?i)atlassian[-_]?token\s*[:=]\s*\S+", "Atlassian token"),
-    (r"(?i)confluence[-_]?token\s*[:=]\s*\S+", "Confluence token"),
-    (r"(?i)jira[-_]?token\s*[:=]\s*\S+", "Jira token"),
-    (r"ATATT[a-zA-Z0-9]{20,}", "Atlassian API token"),
-
-    # Slack tokens
-    (r"xox[baprs]-[0-9A-Za-z\-]{10,}", "Slack token"),
-
-    # Google API keys
-    (r"AIza[0-9A-Za-z\-_]{35}", "Google API key"),
-
-    # Bearer tokens
-    (r"(?i)bearer\s+[a-zA-Z0-9\-_\.]{20,}", "Bearer token"),
-
-    # Connection strings
-    (r"(?i)(mongodb|postgres|mysql|redis)://[^\s]+:[^\s]+@", "database connection string"),
-
-    # Private keys (PEM format headers)
-    (r"-----BEGIN\s+(RSA\s+)?PRIVATE\s+KEY-----", "private key (PEM)"),
-    (r"-----BEGIN\s+OPENSSH\s+PRIVATE\s+KEY-----", "SSH private key"),
-
-    # Generic high-entropy patterns (base64-like with sufficient length)
-    # Only match if it looks like a standalone token/key, not regular text
-    (r"(?i)(api[_-]?key|secret|token|password)\s*[:=]\s*['\"]?[A-Za-z0-9+/=]{32,}['\"]?", "high-entropy credential"),
-]
-
-
-def check_for_secrets(prompt: str) -> list[tuple[str, str]]:
-    """Check prompt for potential secrets. Returns list of (match, type) tuples."""
-    findings = []
-    for pattern, secret_type in SECRET_PATTERNS:
-        matches = re.findall(pattern, prompt)
-        if matches:
-            # Don't include the actual secret in findings
-            findings.append((secret_type, len(matches)))
-    return findings
+def split_findings(findings: list[tuple[str, int]]) -> tuple[list, list]:
+    """(blocking, warn-only) findings under the entropy policy."""
+    if entropy_policy() == "block":
+        return findings, []
+    blocking = [finding for finding in findings if not is_entropy_finding(finding[0])]
+    warnings = [finding for finding in findings if is_entropy_finding(finding[0])]
+    return blocking, warnings
+
+
+def describe(findings: list[tuple[str, int]]) -> str:
+    return ", ".join(f"{stype} ({count}x)" for stype, count in findings)
+
+
+def check_for_secrets(prompt: str, timeout: float | None = None,
+                      project_root: Path | None = None) -> list[tuple[str, int]]:
+    """Check prompt for potential secrets. Returns list of (type, count) tuples.
+
+    Raises ScanTimeout if the scan takes longer than timeout seconds.
+    """
+    allow = None
+    if project_root is not None:
+        allow = load_allowlist(project_root).for_path(PROMPT_PATH)
+    # Patterns live in hooks/lib/secret_patterns.py, shared by both scanners
+    return scan(prompt, timeout=timeout, allow=allow)
 
 
 def main():
@@ -99,12 +110,34 @@ def main():
         print('{}')
         sys.exit(0)
 
-    findings = check_for_secrets(prompt)
+    try:
+        project_root = Path(os.environ.get("CLAUDE_PROJECT_DIR") or input_data.get("cwd") or ".")
+        findings = check_for_secrets(prompt, timeout=SCAN_TIME_BUDGET, project_root=project_root)
+    except ScanTimeout as exc:
+        findings = exc.findings
+        if not split_findings(findings)[0]:
+            scanned = f"{exc.scanned:,} of {len(prompt):,} characters scanned"
+            if fail_policy() == "open":
+                print(f"⚠️ Secret scan stopped after {SCAN_TIME_BUDGET:g}s ({scanned}); "
+                      f"prompt allowed ({FAIL_POLICY_ENV_VAR}=open)", file=sys.stderr)
+                print('{}')
+                sys.exit(0)
+            output = {
+                "decision": "block",
+                "reason": f"⚠️ Prompt too large to scan for secrets within {SCAN_TIME_BUDGET:g}s "
+                          f"({scanned}).\n\nSplit it into smaller prompts, or set "
+                          f"{FAIL_POLICY_ENV_VAR}=open to allow unscanned prompts."
+            }
+            print(json.dumps(output))
+            sys.exit(0)
 
     if findings:
+        record_hits()
+    blocking, warnings = split_findings(findings)
+
+    if blocking:
         # Build warning message
-        secret_types = [f"{stype} ({count}x)" for stype, count in findings]
-        warning = f"Potential secrets detected: {', '.join(secret_types)}"
+        warning = f"Potential secrets detected: {describe(findings)}"
 
         # Output blocking decision
         output = {
@@ -114,6 +147,17 @@ def main():
         print(json.dumps(output))
         sys.exit(0)
 
+    if warnings:
+        # Unconfirmed tokens: allow, but warn the user and Claude
+        print(f"⚠️ Possible secrets in prompt: {describe(warnings)} "
+              f"({ENTROPY_POLICY_ENV_VAR}=block to block these)", file=sys.stderr)
+        output = {
+            "additionalContext": f"The user's prompt may contain a credential ({describe(warnings)}). "
+                                 "Do not repeat it, write it to files or pass it to commands."
+        }
+        print(json.dumps(output))
+        sys.exit(0)
+
     # No secrets found - allow the prompt
     print('{}')
     sys.exit(0)
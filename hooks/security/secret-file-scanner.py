@@ -5,6 +5,16 @@ Scans file content being written for potential secrets.
 
 Hook Type: PreToolUse
 Matcher: Edit|Write
+
+Known false positives (example keys in documentation) are suppressed one
+finding at a time by fingerprint, via .claude/secret-allowlist.json (see
+hooks/batch/secret_baseline.py); the rest of the file is still scanned.
+
+Bare high-entropy tokens (hooks/lib/entropy.py) have no keyword to confirm
+them and are common in generated files (hashed CSS class names, video IDs),
+so by default they only warn: the write goes ahead, and Claude is told the
+file may contain a credential. Set ENTROPY_POLICY to "block" to block them.
+
 Exit Codes:
   0 - Success (content is safe to write)
   1 - Error (non-blocking)
@@ -12,62 +22,23 @@ Exit Codes:
 """
 
 import json
+import os
 import re
 import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "lib"))
+
+from secret_allowlist import load_allowlist, relative_path  # noqa: E402
+from secret_patterns import is_entropy_finding, record_hits, scan  # noqa: E402
 
-# Secret patterns - synced with secret-detection.py
-SECRET_PATTERNS = [
-    # Explicit key-value patterns
-    (r"(?i)\b(password|passwd|pwd)\s*[:=]\s*\S+", "password"),
-    (r"(?i)\b(secret|api_?secret)\s*[:=]\s*\S+", "secret"),
-    (r"(?i)\b(api_?key|apikey)\s*[:=]\s*\S+", "API key"),
-    (r"(?i)\b(token|auth_?token|access_?token)\s*[:=]\s*\S+", "token"),
-    (r"(?i)\b(private_?key)\s*[:=]\s*\S+", "private key"),
-
-    # Common API key formats
-    (r"sk-[a-zA-Z0-9]{20,}", "OpenAI API key"),
-    (r"sk-ant-[a-zA-Z0-9-]{20,}", "Anthropic API key"),
-    (r"ghp_[a-zA-Z0-9]{36}", "GitHub personal access token"),
-    (r"gho_[a-zA-Z0-9]{36}", "GitHub OAuth token"),
-    (r"ghs_[a-zA-Z0-9]{36}", "GitHub server token"),
-    (r"AKIA[0-9A-Z]{16}", "AWS access key ID"),
-    (r"(?i)aws_secret_access_key\s*[:=]\s*\S+", "AWS secret key"),
-
-    # Notion tokens
-    (r"ntn_[a-zA-Z0-9]{40,}", "Notion integration token"),
-    (r"secret_[a-zA-Z0-9]{40,}", "Notion internal token"),
-
-    # Atlassian tokens
-    (r"(?i)atlassian[-_]?token\s*[:=]\s*\S+", "Atlassian token"),
-    (r"(?i)confluence[-_]?token\s*[:=]\s*\S+", "Confluence token"),
-    (r"(?i)jira[-_]?token\s*[:=]\s*\S+", "Jira token"),
-    (r"ATATT[a-zA-Z0-9]{20,}", "Atlassian API token"),
-
-    # Slack tokens
-    (r"xox[baprs]-[0-9A-Za-z\-]{10,}", "Slack token"),
-
-    # Google API keys
-    (r"AIza[0-9A-Za-z\-_]{35}", "Google API key"),
-
-    # Bearer tokens
-    (r"(?i)bearer\s+[a-zA-Z0-9\-_\.]{20,}", "Bearer token"),
-
-    # Connection strings
-    (r"(?i)(mongodb|postgres|mysql|redis)://[^\s]+:[^\s]+@", "database connection string"),
-
-    # Private keys (PEM format headers)
-    (r"-----BEGIN\s+(RSA\s+)?PRIVATE\s+KEY-----", "private key (PEM)"),
-    (r"-----BEGIN\s+OPENSSH\s+PRIVATE\s+KEY-----", "SSH private key"),
-
-    # Generic high-entropy credentials
-    (r"(?i)(api[_-]?key|secret|token|password)\s*[:=]\s*['\"]?[A-Za-z0-9+/=]{32,}['\"]?", "high-entropy credential"),
-]
 
 # Files to skip scanning (legitimate security tool files, documentation, etc.)
 SKIP_PATTERNS = [
     r"\.pre-commit-config\.yaml$",
     r"secret-detection\.py$",
     r"secret-file-scanner\.py$",
+    r"secret_patterns\.py$",
     r"file-protection\.py$",
     r"\.secrets\.baseline$",
     r"CLAUDE\.md$",  # Documentation may reference patterns
@@ -79,6 +50,35 @@ SKIP_PATTERNS = [
 ]
 
 
+# Customise: content larger than this (characters) stops scanning at the first
+# finding - a block only needs one, and large generated exports otherwise
+# take seconds to scan to the end
+EARLY_STOP_CHARS = 1_000_000
+
+# Customise: "warn" lets writes whose only findings are high-entropy tokens
+# through with a warning, "block" blocks them. Overridden by the variable below.
+ENTROPY_POLICY = "warn"
+ENTROPY_POLICY_ENV_VAR = "CLAUDE_SECRET_SCAN_ENTROPY_POLICY"
+
+
+def entropy_policy() -> str:
+    policy = os.environ.get(ENTROPY_POLICY_ENV_VAR, ENTROPY_POLICY).strip().lower()
+    return policy if policy in ("warn", "block") else ENTROPY_POLICY
+
+
+def split_findings(findings: list[tuple[str, int]]) -> tuple[list, list]:
+    """(blocking, warn-only) findings under the entropy policy."""
+    if entropy_policy() == "block":
+        return findings, []
+    blocking = [finding for finding in findings if not is_entropy_finding(finding[0])]
+    warnings = [finding for finding in findings if is_entropy_finding(finding[0])]
+    return blocking, warnings
+
+
+def describe(findings: list[tuple[str, int]]) -> str:
+    return ", ".join(f"{stype} ({count}x)" for stype, count in findings)
+
+
 def should_skip_file(file_path: str) -> bool:
     """Check if file should be skipped from scanning."""
     for pattern in SKIP_PATTERNS:
@@ -87,40 +87,42 @@ def should_skip_file(file_path: str) -> bool:
     return False
 
 
-def check_content_for_secrets(content: str) -> list[tuple[str, int]]:
-    """Check content for potential secrets. Returns list of (type, count) tuples."""
-    findings = []
-    for pattern, secret_type in SECRET_PATTERNS:
-        matches = re.findall(pattern, content)
-        if matches:
-            findings.append((secret_type, len(matches)))
-    return findings
+def allowlist_for(file_path: str, project_root: Path | None = None):
+    """The project allowlist's check for one file, or None if it is empty."""
+    if project_root is None:
+        project_root = Path(os.environ.get("CLAUDE_PROJECT_DIR", "."))
+    allowlist = load_allowlist(project_root)
+    if not allowlist:
+        return None
+    return allowlist.for_path(relative_path(project_root, file_path))
 
 
-def main():
-    # Startup guard: exit gracefully if no valid input
-    try:
-        raw_input = sys.stdin.read()
-        if not raw_input or not raw_input.strip():
-            sys.exit(0)
-        input_data = json.loads(raw_input)
-    except (json.JSONDecodeError, ValueError, EOFError):
-        sys.exit(0)
-    except Exception:
-        sys.exit(0)
+def check_content_for_secrets(content: str, stop_at_first: bool = False,
+                              allow=None) -> list[tuple[str, int]]:
+    """Check content for potential secrets. Returns list of (type, count) tuples.
 
-    tool_name = input_data.get("tool_name", "")
-    tool_input = input_data.get("tool_input", {})
+    Content is scanned in bounded chunks; with stop_at_first the scan ends
+    at the first chunk containing a blocking finding. allow (from
+    allowlist_for()) drops allowlisted findings.
+    """
+    # Patterns live in hooks/lib/secret_patterns.py, shared by both scanners
+    return scan(content, stop_at_first=stop_at_first, allow=allow,
+                stop_on_entropy=entropy_policy() == "block")
 
+
+def decide(tool_name: str, tool_input: dict) -> dict | None:
+    """Hook output for an Edit/Write payload: a block decision if the
+    content contains secrets, additionalContext if it only contains
+    warn-only findings, else None. Warnings go to stderr."""
     # Only check Edit and Write tools
     if tool_name not in ("Edit", "Write"):
-        sys.exit(0)
+        return None
 
     file_path = tool_input.get("file_path", "")
 
     # Skip certain files (documentation, security tools themselves)
     if should_skip_file(file_path):
-        sys.exit(0)
+        return None
 
     # Get the content being written
     content = ""
@@ -130,27 +132,58 @@ def main():
         content = tool_input.get("new_string", "")
 
     if not content:
-        sys.exit(0)
+        return None
+
+    stopped_early = len(content) > EARLY_STOP_CHARS
+    findings = check_content_for_secrets(content, stop_at_first=stopped_early,
+                                         allow=allowlist_for(file_path))
+    if not findings:
+        return None
+
+    record_hits()
+    blocking, warnings = split_findings(findings)
+
+    if not blocking:
+        # Unconfirmed tokens: allow, but warn the user and Claude
+        print(f"⚠️ Possible secrets in {file_path}: {describe(warnings)} "
+              f"({ENTROPY_POLICY_ENV_VAR}=block to block these)", file=sys.stderr)
+        return {
+            "additionalContext": f"The content written to {file_path} may contain a credential "
+                                 f"({describe(warnings)}). Check it is not a real secret."
+        }
 
-    findings = check_content_for_secrets(content)
+    # Build warning message
+    warning = f"Potential secrets detected in file content: {describe(findings)}"
+    if stopped_early:
+        warning += " (large file: scan stopped at first finding)"
 
-    if findings:
-        # Build warning message
-        secret_types = [f"{stype} ({count}x)" for stype, count in findings]
-        warning = f"Potential secrets detected in file content: {', '.join(secret_types)}"
+    print(f"🔐 {warning}", file=sys.stderr)
+    print(f"   File: {file_path}", file=sys.stderr)
+    print("   Review content before proceeding.", file=sys.stderr)
 
-        print(f"🔐 {warning}", file=sys.stderr)
-        print(f"   File: {file_path}", file=sys.stderr)
-        print("   Review content before proceeding.", file=sys.stderr)
+    # Output blocking decision
+    return {
+        "decision": "block",
+        "reason": f"⚠️ {warning}\n\nFile: {file_path}\n\nPlease remove sensitive data before writing."
+    }
 
-        # Output blocking decision
-        output = {
-            "decision": "block",
-            "reason": f"⚠️ {warning}\n\nFile: {file_path}\n\nPlease remove sensitive data before writing."
-        }
-        print(json.dumps(output))
+
+def main():
+    # Startup guard: exit gracefully if no valid input
+    try:
+        raw_input = sys.stdin.read()
+        if not raw_input or not raw_input.strip():
+            sys.exit(0)
+        input_data = json.loads(raw_input)
+    except (json.JSONDecodeError, ValueError, EOFError):
+        sys.exit(0)
+    except Exception:
         sys.exit(0)
 
+    output = decide(input_data.get("tool_name", ""), input_data.get("tool_input", {}))
+    if output is not None:
+        print(json.dumps(output))
+
     # No secrets found - allow the write
     sys.exit(0)
 
@@ -3,17 +3,42 @@
 Code Formatting Hook for Claude Code
 Automatically formats files after editing based on file type.
 
-Hook Type: PostToolUse
+Before spawning the command in FORMATTERS, the backends in FAST_BACKENDS are
+tried: black's Python API in-process, the prettierd server, or the project's
+own node_modules/.bin/prettier instead of npx (see hooks/lib/formatters.py).
+An edit then costs tens of milliseconds instead of a formatter cold start;
+backends that are not installed are skipped.
+
+Files already formatted are not formatted again: the hash of each file's
+formatted content is kept per formatter version (hooks/lib/format_cache.py),
+and a file whose content still matches is skipped without running anything.
+`code-formatter.py --stats` prints the cache's hit rate.
+
+Queue mode (FORMAT_MODE = "queue", or CLAUDE_FORMAT_MODE=queue) defers the
+work: each edit only appends the path to a per-session queue, and the Stop
+hook (`code-formatter.py --flush`) formats every queued file once. Files are
+deduplicated and grouped by formatter command, each formatter runs once
+over its whole group, and the groups run in parallel. Forty edits across
+fifteen files then cost one prettier run and one black run instead of forty
+formatter starts.
+
+Hook Type: PostToolUse (Stop with --flush)
 Matcher: Edit|Write
 Exit Codes:
   0 - Always (non-blocking hook)
 """
 
 import json
-import subprocess
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "lib"))
+
+from format_cache import CleanCache, content_hash  # noqa: E402
+from formatters import BACKENDS, CommandBackend, FormatError, command_version, run_batch  # noqa: E402
+
 # Formatter configuration by file extension
 # Each entry: extension -> [command, args...]
 FORMATTERS = {
@@ -43,6 +68,40 @@ FORMATTERS = {
     ".bash": ["shfmt", "-w"],
 }
 
+# Customise: faster backends tried in order before the FORMATTERS command.
+# Names refer to formatters.BACKENDS; remove an entry to always use the command.
+PRETTIER_BACKENDS = ["prettierd", "prettier-local"]
+FAST_BACKENDS = {
+    ".js": PRETTIER_BACKENDS,
+    ".jsx": PRETTIER_BACKENDS,
+    ".ts": PRETTIER_BACKENDS,
+    ".tsx": PRETTIER_BACKENDS,
+    ".json": PRETTIER_BACKENDS,
+    ".yaml": PRETTIER_BACKENDS,
+    ".yml": PRETTIER_BACKENDS,
+    ".css": PRETTIER_BACKENDS,
+    ".scss": PRETTIER_BACKENDS,
+    ".html": PRETTIER_BACKENDS,
+    ".py": ["black-api"],
+}
+
+# Customise: "immediate" formats after every edit; "queue" formats at Stop
+# (requires the --flush Stop hook). The environment variable overrides.
+FORMAT_MODE = "immediate"
+FORMAT_MODE_ENV_VAR = "CLAUDE_FORMAT_MODE"
+
+# Queued paths, one file per session, relative to the project root
+QUEUE_DIR = Path(".claude") / "cache" / "format-queue"
+
+# Files per formatter invocation at flush (keeps command lines short)
+BATCH_SIZE = 200
+
+# Seconds one batch invocation may take (set the Stop hook timeout above this)
+BATCH_TIMEOUT = 50
+
+# Customise: skip files whose content is unchanged since they were formatted
+CLEAN_CACHE_ENABLED = True
+
 # Files to skip (even if extension matches)
 SKIP_PATTERNS = [
     "node_modules/",
@@ -64,7 +123,7 @@ def should_skip(file_path: str) -> bool:
     return False
 
 
-def format_file(file_path: str) -> str | None:
+def format_file(file_path: str, cache: CleanCache | None = None) -> str | None:
     """Format file based on extension. Returns message if formatted, None otherwise."""
     if should_skip(file_path):
         return None
@@ -80,31 +139,130 @@ def format_file(file_path: str) -> str | None:
     if ext not in FORMATTERS:
         return None
 
-    formatter_cmd = FORMATTERS[ext] + [file_path]
+    backends = [BACKENDS[name] for name in FAST_BACKENDS.get(ext, [])] + [CommandBackend(FORMATTERS[ext])]
+    digest = content_hash(path) if cache is not None else None
 
     try:
-        result = subprocess.run(
-            formatter_cmd,
-            capture_output=True,
-            text=True,
-            timeout=8  # Must be less than hook timeout (10s)
-        )
-        if result.returncode == 0:
-            return f"Formatted {path.name} with {formatter_cmd[0]}"
-        else:
-            # Formatter failed, but don't block - just log
-            if result.stderr:
-                print(f"Format warning for {path.name}: {result.stderr[:100]}", file=sys.stderr)
-            return None
-    except FileNotFoundError:
+        for backend in backends:
+            version = backend.version(path)
+            if version is None:
+                continue  # Not installed here
+            if digest is not None and cache.is_clean(path, digest, backend.name, version):
+                return None  # Unchanged since it was formatted
+            result = backend.format(path)
+            if result is None:
+                continue
+            if cache is not None:
+                cache.mark_clean(path, backend.name, version)
+            return f"Formatted {path.name} with {result.backend}"
         # Formatter not installed, skip silently
         return None
-    except subprocess.TimeoutExpired:
-        print(f"Format timeout for {path.name}", file=sys.stderr)
+    except FormatError as e:
+        # Formatter failed, but don't block - just log
+        if str(e):
+            print(f"Format warning for {path.name}: {str(e)[:100]}", file=sys.stderr)
+        return None
+
+
+def format_mode() -> str:
+    mode = os.environ.get(FORMAT_MODE_ENV_VAR, FORMAT_MODE).strip().lower()
+    return mode if mode in ("immediate", "queue") else FORMAT_MODE
+
+
+def queue_path(project_root: Path, session_id: str) -> Path:
+    safe_id = "".join(c for c in session_id if c.isalnum() or c in "-_") or "default"
+    return project_root / QUEUE_DIR / f"{safe_id}.txt"
+
+
+def enqueue(project_root: Path, session_id: str, file_path: str) -> None:
+    """Record a path for the Stop-time flush (one appended line per edit)."""
+    path = queue_path(project_root, session_id)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(str(Path(file_path).resolve()) + "\n")
+
+
+def take_queue(project_root: Path, session_id: str) -> list[str]:
+    """Remove and return the session's queued paths.
+
+    The queue is renamed before reading, so edits queued during the flush
+    go to a fresh file for the next one.
+    """
+    queue = queue_path(project_root, session_id)
+    taken = queue.with_name(f"{queue.stem}.{os.getpid()}.flushing")
+    try:
+        os.replace(queue, taken)
+        paths = taken.read_text(encoding="utf-8").splitlines()
+        taken.unlink()
+    except OSError:
+        return []
+    return paths
+
+
+def batch_command(path: Path) -> list[str] | None:
+    """The command that formats this file in a batch, or None to skip it."""
+    ext = path.suffix.lower()
+    if ext not in FORMATTERS:
+        return None
+    if "prettier-local" in FAST_BACKENDS.get(ext, []):
+        local = BACKENDS["prettier-local"].find(path)
+        if local is not None:
+            return [str(local), "--write"]
+    return FORMATTERS[ext]
+
+
+def flush(paths: list[str], cache: CleanCache | None = None) -> str | None:
+    """Format the queued files, one run per formatter, formatters in parallel."""
+    groups: dict[tuple[str, ...], list[Path]] = {}
+    versions: dict[Path, str] = {}
+    for file_path in dict.fromkeys(paths):
+        path = Path(file_path)
+        if should_skip(file_path) or not path.exists():
+            continue
+        command = batch_command(path)
+        if command is None:
+            continue
+        version = command_version(command, path)
+        if cache is not None and version is not None:
+            digest = content_hash(path)
+            if digest is not None and cache.is_clean(path, digest, Path(command[0]).name, version):
+                continue  # Unchanged since it was formatted
+            versions[path] = version
+        groups.setdefault(tuple(command), []).append(path)
+    if not groups:
+        return None
+
+    jobs = [(list(command), files[i:i + BATCH_SIZE])
+            for command, files in groups.items()
+            for i in range(0, len(files), BATCH_SIZE)]
+    with ThreadPoolExecutor(max_workers=len(jobs)) as pool:
+        results = list(pool.map(lambda job: run_batch(job[0], job[1], BATCH_TIMEOUT), jobs))
+
+    formatted = []
+    changed = 0
+    for (command, files), result in zip(jobs, results):
+        name = Path(command[0]).name
+        if result is None:
+            continue  # Formatter not installed
+        count, errors = result
+        changed += count
+        formatted.append(f"{name} ({len(files)})")
+        if errors:
+            print(f"Format warning from {name}: {errors[:200]}", file=sys.stderr)
+        elif cache is not None:
+            for path in files:
+                if path in versions:
+                    cache.mark_clean(path, name, versions[path])
+    if not formatted:
         return None
+    return f"Formatted queued files with {', '.join(formatted)}: {changed} changed"
 
 
 def main():
+    if "--stats" in sys.argv[1:]:
+        print(json.dumps(CleanCache().stats(), indent=2))
+        sys.exit(0)
+
     # Startup guard: exit gracefully if no valid input
     try:
         raw_input = sys.stdin.read()
@@ -116,6 +274,19 @@ def main():
     except Exception:
         sys.exit(0)
 
+    project_root = Path(os.environ.get("CLAUDE_PROJECT_DIR") or input_data.get("cwd") or ".")
+    session_id = input_data.get("session_id") or "default"
+
+    # Stop hook: format everything queued by this session
+    if "--flush" in sys.argv[1:]:
+        cache = CleanCache() if CLEAN_CACHE_ENABLED else None
+        message = flush(take_queue(project_root, session_id), cache)
+        if cache is not None:
+            cache.save()
+        if message:
+            print(json.dumps({"additionalContext": message}))
+        sys.exit(0)
+
     tool_name = input_data.get("tool_name", "")
     file_path = input_data.get("tool_input", {}).get("file_path", "")
 
@@ -134,7 +305,16 @@ def main():
     if not file_path.startswith(VAULT_ROOT):
         sys.exit(0)
 
-    message = format_file(file_path)
+    if format_mode() == "queue":
+        ext = Path(file_path).suffix.lower()
+        if ext in FORMATTERS and not should_skip(file_path):
+            enqueue(project_root, session_id, file_path)
+        sys.exit(0)
+
+    cache = CleanCache() if CLEAN_CACHE_ENABLED else None
+    message = format_file(file_path, cache)
+    if cache is not None:
+        cache.save()
 
     # Output using additionalContext JSON format
     if message:
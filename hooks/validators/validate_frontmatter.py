@@ -9,6 +9,15 @@ Validate Frontmatter Hook (Blocking)
 Validates YAML frontmatter structure and required fields for a specific note type.
 Used as a Stop hook to verify skill output has correct frontmatter.
 
+Required fields come from hooks/lib/note_types.py (the same schema as
+frontmatter-validator.py), plus `pillar` for pillar note types.
+
+Frontmatter goes through a loader ladder. Flat headers (`key: value` and
+lists) use the shared simple parser, and PyYAML is not imported at all.
+Headers with nested mappings, block scalars, anchors, tags or flow mappings
+use PyYAML, with the libyaml CSafeLoader when available and SafeLoader
+otherwise. The path used is printed with the result.
+
 Exit Codes:
   0 - Validation passed
   2 - Validation failed (blocking, feeds back to Claude)
@@ -31,46 +40,27 @@ import sys
 from datetime import datetime, timedelta
 from pathlib import Path
 
-# Try to use PyYAML if available, otherwise use simple parser
-try:
-    import yaml
-    HAS_YAML = True
-except ImportError:
-    HAS_YAML = False
-
-
-# Required fields by note type (subset for validation)
-REQUIRED_FIELDS = {
-    "Meeting": ["type", "title", "date", "attendees"],
-    "ADR": ["type", "title", "status", "adrType"],
-    "Task": ["type", "title", "completed", "priority"],
-    "Daily": ["type", "title", "date"],
-    "Project": ["type", "title", "status"],
-    "Person": ["type", "title"],
-    "System": ["type", "title"],
-    "Concept": ["type", "pillar", "title"],
-    "Pattern": ["type", "pillar", "title"],
-    "Weblink": ["type", "title", "url"],
-    "Incubator": ["type", "title", "status"],
-    "YouTube": ["type", "pillar", "title", "url"],
-    "Research": ["type", "pillar", "title"],
-    "Book": ["type", "pillar", "title"],
-    "Threat": ["type", "pillar", "title"],
-    "Principle": ["type", "pillar", "title"],
-    "Framework": ["type", "pillar", "title"],
-    "Tool": ["type", "pillar", "title"],
-    "Article": ["type", "pillar", "title"],
-    "Department": ["type", "pillar", "title"],
-    "Objective": ["type", "pillar", "title", "objectiveType", "status"],
-    "Email": ["type", "title", "subject", "from", "date"],
-    "Trip": ["type", "title", "status"],
-    "FormSubmission": ["type", "title", "formType", "status"],
-    "Organisation": ["type", "title"],
-    "DataAsset": ["type", "pillar", "title"],
-    "Location": ["type", "pillar", "title"],
-    "Capability": ["type", "pillar", "title"],
-    "Theme": ["type", "pillar", "title"],
-}
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "lib"))
+
+from frontmatter import parse_frontmatter as parse_header  # noqa: E402
+from note_types import SCHEMA  # noqa: E402
+
+# Loader ladder paths, as reported
+SIMPLE_LOADER = "simple parser"
+LIBYAML_LOADER = "libyaml CSafeLoader"
+PYYAML_LOADER = "PyYAML SafeLoader"
+
+# A top-level `key: value` line the simple parser handles
+SIMPLE_KEY = re.compile(r"[A-Za-z_-]+:(\s|$)")
+
+# Value prefixes that need a YAML parser: block scalars, anchors, aliases,
+# tags and flow mappings
+YAML_VALUE_PREFIXES = ("|", ">", "&", "*", "!", "{")
+
+# Values YAML reads as null that the simple parser keeps as text
+YAML_NULLS = ("~", "Null", "NULL")
+
+_yaml = None
 
 
 def find_latest_file(directory: Path, extension: str, within_minutes: int = 5) -> Path | None:
@@ -94,48 +84,72 @@ def find_latest_file(directory: Path, extension: str, within_minutes: int = 5) -
 
 def parse_frontmatter_simple(content: str) -> dict | None:
     """Simple YAML frontmatter parser (fallback if PyYAML not available)."""
-    if not content.startswith("---"):
-        return None
-
-    end_match = re.search(r'\n---\s*\n', content[3:])
-    if not end_match:
-        return None
-
-    yaml_content = content[4:end_match.start() + 3]
-    frontmatter = {}
-
-    for line in yaml_content.split('\n'):
-        if ':' in line and not line.strip().startswith('#'):
-            key, _, value = line.partition(':')
-            key = key.strip()
-            value = value.strip().strip('"\'')
-            if value.startswith('[') and value.endswith(']'):
-                # Simple array parsing
-                items = value[1:-1].split(',')
-                value = [i.strip().strip('"\'') for i in items if i.strip()]
-            frontmatter[key] = value
-
-    return frontmatter
+    return parse_header(content).data
+
+
+def needs_yaml(raw: str) -> bool:
+    """True if a header uses YAML the simple parser would get wrong."""
+    for line in raw.splitlines():
+        stripped = line.strip()
+        if not stripped or stripped[0] == "#":
+            continue
+        if stripped == "-" or stripped.startswith("- "):
+            if ": " in stripped or stripped.endswith(":"):
+                return True  # List of mappings
+            continue
+        if line[0] in " \t":
+            return True  # Nested mapping or multi-line scalar
+        if not SIMPLE_KEY.match(line):
+            return True  # Quoted or complex key, or a stray line
+        value = line.split(":", 1)[1].strip()
+        if value.startswith(YAML_VALUE_PREFIXES) or value in YAML_NULLS or " #" in value:
+            return True
+        if value[:1] in ('"', "'") and ("\\" in value or "''" in value[1:-1]):
+            return True  # Escapes inside a quoted string
+        if value.startswith("[") and ("[" in value[1:] or "{" in value):
+            return True  # Nested flow collection
+    return False
+
+
+def yaml_loader():
+    """(yaml module, Loader class, path name), imported on first use; None without PyYAML."""
+    global _yaml
+    if _yaml is None:
+        try:
+            import yaml
+        except ImportError:
+            _yaml = False
+            return None
+        if getattr(yaml, "__with_libyaml__", False):
+            _yaml = (yaml, yaml.CSafeLoader, LIBYAML_LOADER)
+        else:
+            _yaml = (yaml, yaml.SafeLoader, PYYAML_LOADER)
+    return _yaml or None
+
+
+def load_frontmatter(content: str) -> tuple[dict | None, str]:
+    """Parse YAML frontmatter from markdown content. Returns (data, loader path)."""
+    header = parse_header(content)
+    if header.data is None or not needs_yaml(header.raw):
+        return header.data, SIMPLE_LOADER
+
+    loader = yaml_loader()
+    if loader is None:
+        return header.data, f"{SIMPLE_LOADER}, PyYAML not installed"
+    yaml, loader_class, path = loader
+    try:
+        data = yaml.load(header.raw, Loader=loader_class)
+    except (yaml.YAMLError, ValueError) as e:
+        # ValueError: a date-like value that is not a real date (2024-13-01)
+        return header.data, f"{SIMPLE_LOADER}, after {path} failed: {type(e).__name__}"
+    if not isinstance(data, dict):
+        return header.data, SIMPLE_LOADER
+    return data, path
 
 
 def parse_frontmatter(content: str) -> dict | None:
     """Parse YAML frontmatter from markdown content."""
-    if not content.startswith("---"):
-        return None
-
-    end_match = re.search(r'\n---\s*\n', content[3:])
-    if not end_match:
-        return None
-
-    yaml_content = content[4:end_match.start() + 3]
-
-    if HAS_YAML:
-        try:
-            return yaml.safe_load(yaml_content)
-        except yaml.YAMLError:
-            return parse_frontmatter_simple(content)
-    else:
-        return parse_frontmatter_simple(content)
+    return load_frontmatter(content)[0]
 
 
 def main():
@@ -169,14 +183,14 @@ def main():
     print(f"📄 Validating frontmatter: {target.relative_to(vault_root)}")
 
     content = target.read_text(encoding="utf-8")
-    frontmatter = parse_frontmatter(content)
+    frontmatter, loader_path = load_frontmatter(content)
 
     if not frontmatter:
         print("ERROR: No valid frontmatter found")
         print("File should start with --- and have closing ---")
         sys.exit(2)
 
-    print("✅ Frontmatter parsed successfully")
+    print(f"✅ Frontmatter parsed successfully ({loader_path})")
 
     errors = []
 
@@ -192,10 +206,10 @@ def main():
     required_fields = []
     if args.required:
         required_fields = [f.strip() for f in args.required.split(",")]
-    elif args.note_type and args.note_type in REQUIRED_FIELDS:
-        required_fields = REQUIRED_FIELDS[args.note_type]
-    elif actual_type and actual_type in REQUIRED_FIELDS:
-        required_fields = REQUIRED_FIELDS[actual_type]
+    elif args.note_type and args.note_type in SCHEMA.types:
+        required_fields = SCHEMA.types[args.note_type].skill_required
+    elif actual_type and actual_type in SCHEMA.types:
+        required_fields = SCHEMA.types[actual_type].skill_required
 
     # Check required fields
     for field in required_fields:
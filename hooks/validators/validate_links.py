@@ -30,6 +30,10 @@ import sys
 from datetime import datetime, timedelta
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "lib"))
+
+from note_index import load_note_index  # noqa: E402
+
 
 def find_latest_file(directory: Path, extension: str, within_minutes: int = 5) -> Path | None:
     """Find the most recently modified file in directory."""
@@ -58,42 +62,36 @@ def extract_wiki_links(content: str) -> list[str]:
     return list(set(matches))
 
 
-def find_note(vault_root: Path, link_text: str) -> Path | None:
-    """Try to find a note matching the link text."""
-    # Direct match
-    direct = vault_root / f"{link_text}.md"
-    if direct.exists():
-        return direct
-
-    # Search in common directories
-    search_dirs = [
-        vault_root,
-        vault_root / "Meetings",
-        vault_root / "Projects",
-        vault_root / "Tasks",
-        vault_root / "ADRs",
-        vault_root / "Incubator",
-        vault_root / "Daily",
-    ]
-
-    for year in ["2024", "2025", "2026"]:
-        search_dirs.append(vault_root / "Meetings" / year)
-        search_dirs.append(vault_root / "Daily" / year)
-
-    for search_dir in search_dirs:
-        if not search_dir.exists():
-            continue
+def find_notes(vault_root: Path, links: list[str]) -> dict[str, Path]:
+    """Resolve many links to note paths in one pass over the note index.
+
+    Links are matched on the exact note name wherever it lives in the vault
+    (nearest the root wins); links containing a folder path are checked
+    directly. Links that don't resolve are omitted.
+    """
+    found = {}
+    names = []
+    for link in links:
+        direct = vault_root / f"{link}.md"
+        if "/" in link and direct.exists():
+            found[link] = direct
+        else:
+            names.append(link)
+
+    if names:
+        note_index = load_note_index(vault_root)
+        try:
+            for name, rel_path in note_index.find_notes(names).items():
+                found[name] = vault_root / rel_path
+        finally:
+            note_index.close()
 
-        target = search_dir / f"{link_text}.md"
-        if target.exists():
-            return target
+    return found
 
-    # Glob search for partial match
-    for match in vault_root.rglob(f"*{link_text}*.md"):
-        if match.stem == link_text:
-            return match
 
-    return None
+def find_note(vault_root: Path, link_text: str) -> Path | None:
+    """Try to find a note matching the link text."""
+    return find_notes(vault_root, [link_text]).get(link_text)
 
 
 def main():
@@ -138,14 +136,16 @@ def main():
     broken = []
     valid = []
 
+    checked = [link for link in links if not any(pattern in link for pattern in args.ignore)]
+    resolved = find_notes(vault_root, checked)
+
     for link in links:
         # Check ignore patterns
         if any(pattern in link for pattern in args.ignore):
             print(f"⏭️  Ignored: [[{link}]]")
             continue
 
-        found = find_note(vault_root, link)
-        if found:
+        if link in resolved:
             print(f"✅ Valid: [[{link}]]")
             valid.append(link)
         else: